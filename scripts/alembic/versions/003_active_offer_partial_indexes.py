@@ -0,0 +1,43 @@
+"""Replace state-prefixed offer indexes with partial indexes on ACTIVE offers
+
+Revision ID: 003_active_offer_partial_indexes
+Revises: 002_ux_flow_implementation
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '003_active_offer_partial_indexes'
+down_revision: Union[str, None] = '002_ux_flow_implementation'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index only ACTIVE offers for expiry sweeps and listings."""
+    op.create_index(
+        'ix_offers_active_pickup_end',
+        'offers',
+        ['pickup_end_time'],
+        postgresql_where=sa.text("state = 'ACTIVE'"),
+    )
+    op.create_index(
+        'ix_offers_active_created',
+        'offers',
+        [sa.text('created_at DESC')],
+        postgresql_where=sa.text("state = 'ACTIVE'"),
+    )
+    op.drop_index('ix_offers_state_pickup_end', table_name='offers')
+    op.drop_index('ix_offers_state_created', table_name='offers')
+
+
+def downgrade() -> None:
+    """Restore the state-prefixed offer indexes."""
+    op.create_index('ix_offers_state_pickup_end', 'offers', ['state', 'pickup_end_time'])
+    op.create_index('ix_offers_state_created', 'offers', ['state', sa.text('created_at DESC')])
+    op.drop_index('ix_offers_active_created', table_name='offers')
+    op.drop_index('ix_offers_active_pickup_end', table_name='offers')
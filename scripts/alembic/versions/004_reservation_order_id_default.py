@@ -0,0 +1,33 @@
+"""Generate reservation order IDs in the database
+
+Revision ID: 004_reservation_order_id_default
+Revises: 003_active_offer_partial_indexes
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '004_reservation_order_id_default'
+down_revision: Union[str, None] = '003_active_offer_partial_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Default order_id to "RES-" plus 8 random hex characters."""
+    op.alter_column(
+        'reservations',
+        'order_id',
+        server_default=sa.text(
+            "'RES-' || upper(left(replace(gen_random_uuid()::text, '-', ''), 8))"
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Drop the order_id default; the application must supply it again."""
+    op.alter_column('reservations', 'order_id', server_default=None)
@@ -0,0 +1,30 @@
+"""Drop single-column indexes covered by composite indexes
+
+Revision ID: 005_drop_prefix_indexes
+Revises: 004_reservation_order_id_default
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '005_drop_prefix_indexes'
+down_revision: Union[str, None] = '004_reservation_order_id_default'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Drop indexes that are left prefixes of composite indexes."""
+    # Covered by ix_offers_business_state (business_id, state)
+    op.drop_index('ix_offers_business_id', table_name='offers')
+    # Covered by ix_reservations_customer_created (customer_id, created_at DESC)
+    op.drop_index('ix_reservations_customer_id', table_name='reservations')
+
+
+def downgrade() -> None:
+    """Restore the single-column indexes."""
+    op.create_index('ix_reservations_customer_id', 'reservations', ['customer_id'])
+    op.create_index('ix_offers_business_id', 'offers', ['business_id'])
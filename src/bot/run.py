@@ -25,6 +25,7 @@ from src.bot.command_map import register_handlers
 from src.config import load_settings
 from src.handlers.system.health import start_health_server
 from src.logging import get_logger, setup_logging
+from src.logging.audit import run_audit_drain
 from src.security.permissions import PermissionChecker
 from src.security.rate_limit import RateLimiter
 from src.services.discovery_ranking import DiscoveryRankingService
@@ -36,7 +37,6 @@ from src.storage.postgres_business_repo import PostgresBusinessRepository
 from src.storage.postgres_offer_repo import PostgresOfferRepository
 from src.storage.postgres_reservation_repo import PostgresReservationRepository
 from src.storage.postgres_user_repo import PostgresUserRepository
-from src.storage.redis_locks import RedisLockHelper
 
 
 async def setup_bot_menu(application: Application) -> None:
@@ -90,7 +90,6 @@ async def main() -> None:
     reservation_repo = PostgresReservationRepository(session)
 
     # Initialize Redis-backed services
-    redis_locks = RedisLockHelper(settings.redis_url, ttl_seconds=settings.redis_lock_ttl_seconds)
     rate_limiter = RateLimiter(
         settings.redis_url,
         max_requests=settings.rate_limit_max_requests,
@@ -105,7 +104,7 @@ async def main() -> None:
     discovery_service = DiscoveryRankingService(nearby_radius_km=settings.nearby_radius_km)
     
     # Initialize reservation flow service
-    reservation_flow_service = ReservationFlowService(offer_repo, reservation_repo, redis_locks)
+    reservation_flow_service = ReservationFlowService(offer_repo, reservation_repo)
 
     # Initialize background scheduler
     scheduler = SchedulerService(offer_repo, interval_seconds=settings.expiration_check_interval_seconds)
@@ -119,11 +118,11 @@ async def main() -> None:
     application.bot_data["business_repo"] = business_repo
     application.bot_data["offer_repo"] = offer_repo
     application.bot_data["reservation_repo"] = reservation_repo
-    application.bot_data["redis_locks"] = redis_locks
     application.bot_data["permission_checker"] = permission_checker
     application.bot_data["rate_limiter"] = rate_limiter
     application.bot_data["discovery_service"] = discovery_service
     application.bot_data["reservation_flow_service"] = reservation_flow_service
+    application.bot_data["scheduler"] = scheduler
     application.bot_data["settings"] = settings
 
     # Register handlers
@@ -157,6 +156,9 @@ async def main() -> None:
     # Start background scheduler
     scheduler_task = asyncio.create_task(scheduler.start())
 
+    # Start background audit log writer
+    audit_task = asyncio.create_task(run_audit_drain())
+
     # Run until stopped
     try:
         await asyncio.Event().wait()
@@ -168,6 +170,7 @@ async def main() -> None:
         logger.info("Health check server stopped")
         await scheduler.stop()
         scheduler_task.cancel()
+        audit_task.cancel()
         await rate_limiter.disconnect()
         # Close the persistent session before disconnecting the database
         await session.close()
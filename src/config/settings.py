@@ -18,6 +18,13 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_timeout_seconds: int = 30
+    db_pool_recycle_seconds: int = 1800
+    # Prepared statements kept per connection; set to 0 behind PgBouncer in
+    # transaction pooling mode
+    db_prepared_statement_cache_size: int = 256
 
     # Redis
     redis_url: str = "redis://localhost:6379/0"
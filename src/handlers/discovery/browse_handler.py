@@ -87,9 +87,12 @@ async def handle_browse_callback(update: Update, context: ContextTypes.DEFAULT_T
         discovery_service: DiscoveryRankingService = context.bot_data.get("discovery_service")
         if discovery_service:
             # Get business locations
+            businesses = await business_repo.get_by_ids(
+                [offer.business_id for offer in offers]
+            )
             offers_with_location = []
             for offer in offers:
-                business = await business_repo.get_by_id(offer.business_id)
+                business = businesses.get(offer.business_id)
                 if business and business.venue.latitude and business.venue.longitude:
                     offers_with_location.append(
                         (offer, business.venue.latitude, business.venue.longitude)
@@ -133,8 +136,11 @@ async def handle_browse_callback(update: Update, context: ContextTypes.DEFAULT_T
     
     keyboard = []
     
+    businesses = await business_repo.get_by_ids(
+        [offer.business_id for offer in page_offers]
+    )
     for offer in page_offers:
-        business = await business_repo.get_by_id(offer.business_id)
+        business = businesses.get(offer.business_id)
         
         if not business:
             continue
@@ -4,6 +4,8 @@ Allows customers to browse available offers with ranking and filtering.
 Command: /offers or /browse
 """
 
+from datetime import datetime
+
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Update
 from telegram.ext import CommandHandler, ContextTypes
 
@@ -120,6 +122,7 @@ async def view_offer_details(update: Update, context: ContextTypes.DEFAULT_TYPE)
         business = await business_repo.get_by_id(offer.business_id)
         
         # Status indicators
+        now = datetime.utcnow()
         status_indicator = ""
         if offer.state == OfferStatus.PAUSED:
             status_indicator = "⏸️ **PAUSED** - Not currently available\n\n"
@@ -129,7 +132,7 @@ async def view_offer_details(update: Update, context: ContextTypes.DEFAULT_TYPE)
             status_indicator = "⏰ **EXPIRED**\n\n"
         elif offer.state == OfferStatus.EXPIRED_EARLY:
             status_indicator = "🛑 **ENDED**\n\n"
-        elif offer.is_expired:
+        elif offer.is_expired_at(now):
             status_indicator = "⏰ **EXPIRED**\n\n"
 
         # Format offer details
@@ -153,7 +156,7 @@ async def view_offer_details(update: Update, context: ContextTypes.DEFAULT_TYPE)
         keyboard = []
         
         # Only show Reserve button if offer is available
-        if offer.available_for_reservation:
+        if offer.is_available_at(now):
             keyboard.append([
                 InlineKeyboardButton("🛒 Reserve", callback_data=f"reserve:{offer_id}")
             ])
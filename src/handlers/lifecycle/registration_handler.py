@@ -177,10 +177,12 @@ async def handle_phone(update: Update, context: ContextTypes.DEFAULT_TYPE) -> in
         owner_id=user.id,
         business_name=context.user_data["business_name"],
         phone=context.user_data["phone"],
-        street_address=context.user_data["street_address"],
-        city=context.user_data["city"],
-        postal_code=context.user_data["postal_code"],
-        country_code="TJ",  # Default, can be enhanced later
+        venue=Venue(
+            street_address=context.user_data["street_address"],
+            city=context.user_data["city"],
+            postal_code=context.user_data["postal_code"],
+            country_code="TJ",  # Default, can be enhanced later
+        ),
     )
     
     business = await business_repo.create(business_input)
@@ -278,6 +278,7 @@ async def handle_edit_pickup_end_input(update: Update, context: ContextTypes.DEF
         
         offer.pickup_end_time = new_end_time
         updated = await offer_repo.update(offer)
+        context.bot_data["scheduler"].wake()
         
         await update.message.reply_text(
             f"✅ Pickup end time updated to {new_end_time.strftime('%H:%M')}\n\n"
@@ -88,6 +88,8 @@ async def handle_resume_offer(update: Update, context: ContextTypes.DEFAULT_TYPE
     
     # Update state to ACTIVE
     updated_offer = await offer_repo.update_state(offer_id, OfferStatus.ACTIVE)
+    # Paused offers are not tracked for expiry, so recompute the next one
+    context.bot_data["scheduler"].wake()
     
     await query.edit_message_text(
         f"▶️ **{offer.title}** is now active!\n\n"
@@ -320,6 +320,8 @@ async def handle_confirmation(update: Update, context: ContextTypes.DEFAULT_TYPE
     )
     
     offer = await offer_repo.create(offer_input)
+    # The new offer may expire before the scheduler's next check
+    context.bot_data["scheduler"].wake()
     
     logger.info(
         "offer_created",
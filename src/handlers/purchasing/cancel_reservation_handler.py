@@ -97,11 +97,12 @@ async def handle_confirm_cancel_reservation(update: Update, context: ContextType
         await query.edit_message_text("❌ Reservation not found.")
         return
     
-    # Validate time again
+    # Validate again; the reservation may have been cancelled or the pickup
+    # window may have ended since the prompt was shown
     now = datetime.utcnow()
-    if now >= reservation.pickup_end_time:
+    if not reservation.is_cancellable_at(now):
         await query.edit_message_text(
-            "❌ Cannot cancel reservation after the pickup window has ended."
+            "❌ This reservation can no longer be cancelled."
         )
         return
     
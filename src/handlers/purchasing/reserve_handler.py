@@ -121,40 +121,21 @@ async def handle_confirm_reserve(update: Update, context: ContextTypes.DEFAULT_T
     
     # Create reservation with atomic inventory management
     if not reservation_flow_service:
-        # Fallback: create reservation directly (less safe)
+        # Fallback: create reservation directly through the repository
         logger.warning("reservation_flow_service_not_available", using_fallback=True)
         
         reservation_repo: PostgresReservationRepository = context.bot_data["reservation_repo"]
-        offer = await offer_repo.get_by_id(offer_id)
         
-        if not offer or quantity > offer.quantity_remaining:
+        # Stock, price and pickup window are taken from the offer row by the
+        # same statement, so no intermediate ReservationInput is needed
+        created = await reservation_repo.create_with_decrement(
+            offer_id, user.id, quantity
+        )
+        if created is None:
             await query.edit_message_text("❌ Reservation failed. Offer no longer available.")
             return
         
-        # Decrement inventory
-        success = await offer_repo.decrement_quantity(offer_id, quantity)
-        if not success:
-            await query.edit_message_text("❌ Failed to reserve. Please try again.")
-            return
-        
-        # Create reservation
-        from src.models.reservation import ReservationInput
-        from decimal import Decimal
-        
-        total_price = Decimal(str(quantity)) * offer.price_per_unit
-        reservation_input = ReservationInput(
-            offer_id=offer_id,
-            customer_id=user.id,
-            quantity=quantity,
-            unit_price=offer.price_per_unit,
-            total_price=total_price,
-            currency=offer.currency,
-            pickup_start_time=offer.pickup_start_time,
-            pickup_end_time=offer.pickup_end_time,
-        )
-        
-        reservation = await reservation_repo.create(reservation_input)
-        order_id = reservation.order_id
+        order_id, _, _ = created
         success = True
         message = "Reservation confirmed!"
         
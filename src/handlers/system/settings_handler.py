@@ -1,5 +1,7 @@
 """Settings command handler for language and notification preferences."""
 
+from functools import lru_cache
+
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Update
 from telegram.ext import CallbackQueryHandler, CommandHandler, ContextTypes
 
@@ -9,6 +11,23 @@ from src.storage.postgres_user_repo import PostgresUserRepository
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def _settings_markup(user_id: int) -> InlineKeyboardMarkup:
+    """Build the settings keyboard for a user.
+
+    PTB markup objects are immutable, so cached instances are safe to reuse.
+    """
+    keyboard = [
+        [InlineKeyboardButton(
+            "🔔 Toggle Notifications",
+            callback_data=f"toggle_notifications:{user_id}"
+        )],
+        # Future: Language selection
+        # [InlineKeyboardButton("🌐 Change Language", callback_data="change_language")],
+    ]
+    return InlineKeyboardMarkup(keyboard)
+
+
 async def settings_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Show user settings with options to modify."""
     user_repo: PostgresUserRepository = context.bot_data["user_repo"]
@@ -33,16 +52,7 @@ async def settings_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -
         f"**Notifications:** {notification_status}\n"
     )
     
-    # Build settings keyboard
-    keyboard = [
-        [InlineKeyboardButton(
-            "🔔 Toggle Notifications",
-            callback_data=f"toggle_notifications:{user.id}"
-        )],
-        # Future: Language selection
-        # [InlineKeyboardButton("🌐 Change Language", callback_data="change_language")],
-    ]
-    reply_markup = InlineKeyboardMarkup(keyboard)
+    reply_markup = _settings_markup(user.id)
     
     await update.message.reply_text(text, reply_markup=reply_markup, parse_mode="Markdown")
     
@@ -63,17 +73,13 @@ async def handle_toggle_notifications(update: Update, context: ContextTypes.DEFA
     user_id_str = query.data.split(":")[1]
     user_id = int(user_id_str)
     
-    # Get user
-    user = await user_repo.get_by_id(user_id)
+    # Toggle notification setting
+    updated_user = await user_repo.toggle_notifications(user_id)
     
-    if not user:
+    if not updated_user:
         await query.edit_message_text("❌ User not found.")
         return
     
-    # Toggle notification setting
-    user.notification_enabled = not user.notification_enabled
-    updated_user = await user_repo.update(user)
-    
     notification_status = "✅ Enabled" if updated_user.notification_enabled else "❌ Disabled"
     
     # Update message
@@ -83,19 +89,13 @@ async def handle_toggle_notifications(update: Update, context: ContextTypes.DEFA
         f"**Notifications:** {notification_status}\n"
     )
     
-    keyboard = [
-        [InlineKeyboardButton(
-            "🔔 Toggle Notifications",
-            callback_data=f"toggle_notifications:{user.id}"
-        )],
-    ]
-    reply_markup = InlineKeyboardMarkup(keyboard)
+    reply_markup = _settings_markup(updated_user.id)
     
     await query.edit_message_text(text, reply_markup=reply_markup, parse_mode="Markdown")
     
     logger.info(
         "notifications_toggled",
-        user_id=user.id,
+        user_id=updated_user.id,
         enabled=updated_user.notification_enabled
     )
 
@@ -4,7 +4,9 @@ Provides a friendly /start command and a default text handler so that
 users who send plain messages get a helpful response instead of no reply.
 """
 
-from telegram import ReplyKeyboardMarkup, Update
+from typing import Awaitable, Callable
+
+from telegram import InlineKeyboardButton, InlineKeyboardMarkup, ReplyKeyboardMarkup, Update
 from telegram.ext import CommandHandler, MessageHandler, ContextTypes, filters
 
 from src.logging import get_logger
@@ -14,68 +16,79 @@ from src.storage.postgres_user_repo import PostgresUserRepository
 logger = get_logger(__name__)
 
 
+async def _handle_offer_link(
+    update: Update, context: ContextTypes.DEFAULT_TYPE, offer_id: str
+) -> bool:
+    """Handle deep link: offer_<offer_id>."""
+    telegram_user = update.effective_user
+    try:
+        # Link to view_offer_details via its callback button; a single reply
+        # keeps this to one Telegram API request
+        keyboard = [[
+            InlineKeyboardButton("View Offer", callback_data=f"view_offer:{offer_id}")
+        ]]
+        reply_markup = InlineKeyboardMarkup(keyboard)
+        
+        await update.message.reply_text(
+            "📦 Offer details — tap the button below to view.\n\n"
+            "Use /browse to see all available offers.",
+            reply_markup=reply_markup
+        )
+        
+        logger.info(
+            "deep_link_offer_accessed",
+            user_id=telegram_user.id,
+            offer_id=offer_id
+        )
+    
+    except Exception as e:
+        logger.error("deep_link_offer_failed", error=str(e), exc_info=True)
+        await update.message.reply_text(
+            "❌ Invalid offer link. Use /browse to see available offers."
+        )
+    return True
+
+
+async def _handle_business_invite_link(
+    update: Update, context: ContextTypes.DEFAULT_TYPE, rest: str
+) -> bool:
+    """Handle deep link: business_invite_<token> (future feature)."""
+    if not rest.startswith("invite_"):
+        return False
+    token = rest.removeprefix("invite_")
+    # TODO: Implement business invitation flow
+    await update.message.reply_text(
+        "🏪 Business invitation feature coming soon!\n\n"
+        "Use /start to register manually."
+    )
+    logger.info(
+        "deep_link_business_invite_accessed",
+        user_id=update.effective_user.id,
+        token=token
+    )
+    return True
+
+
+# Deep link handlers keyed by the parameter prefix before the first "_"; each
+# returns False to fall through to the normal welcome
+_DEEP_LINK_HANDLERS: dict[
+    str, Callable[[Update, ContextTypes.DEFAULT_TYPE, str], Awaitable[bool]]
+] = {
+    "offer": _handle_offer_link,
+    "business": _handle_business_invite_link,
+}
+
+
 async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Welcome message with role selection for new users or deep link handling."""
     user_repo: PostgresUserRepository = context.bot_data["user_repo"]
     telegram_user = update.effective_user
     
     # Check for deep link parameters (format: /start <parameter>)
-    if context.args and len(context.args) > 0:
-        param = context.args[0]
-        
-        # Handle deep link: offer_<offer_id>
-        if param.startswith("offer_"):
-            from uuid import UUID
-            from src.handlers.discovery.list_offers_handler import view_offer_details
-            
-            offer_id = param.replace("offer_", "")
-            try:
-                # Create a mock callback query to reuse view_offer_details
-                # Note: This is a simplified approach; ideally refactor view_offer_details
-                # to accept both callback queries and direct calls
-                await update.message.reply_text(
-                    f"📦 Loading offer details...\n\n"
-                    f"Use /browse to see all available offers, or tap the button below:",
-                )
-                
-                from telegram import InlineKeyboardButton, InlineKeyboardMarkup
-                keyboard = [[
-                    InlineKeyboardButton("View Offer", callback_data=f"view_offer:{offer_id}")
-                ]]
-                reply_markup = InlineKeyboardMarkup(keyboard)
-                
-                await update.message.reply_text(
-                    "👆 Tap to view offer details",
-                    reply_markup=reply_markup
-                )
-                
-                logger.info(
-                    "deep_link_offer_accessed",
-                    user_id=telegram_user.id,
-                    offer_id=offer_id
-                )
-                return
-            
-            except Exception as e:
-                logger.error("deep_link_offer_failed", error=str(e), exc_info=True)
-                await update.message.reply_text(
-                    "❌ Invalid offer link. Use /browse to see available offers."
-                )
-                return
-        
-        # Handle deep link: business_invite_<token> (future feature)
-        elif param.startswith("business_invite_"):
-            token = param.replace("business_invite_", "")
-            # TODO: Implement business invitation flow
-            await update.message.reply_text(
-                "🏪 Business invitation feature coming soon!\n\n"
-                "Use /start to register manually."
-            )
-            logger.info(
-                "deep_link_business_invite_accessed",
-                user_id=telegram_user.id,
-                token=token
-            )
+    if context.args:
+        prefix, _, rest = context.args[0].partition("_")
+        handler = _DEEP_LINK_HANDLERS.get(prefix)
+        if handler is not None and await handler(update, context, rest):
             return
     
     # Check if user already exists
@@ -129,7 +142,7 @@ async def default_message(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     """Fallback for plain text messages — give a short helpful nudge."""
     logger.info("received_plain_message", user_id=update.effective_user.id)
     await update.message.reply_text(
-        "I didn't understand that. Try /offers or /newoffer to begin — or send /start for help."
+        "I didn't understand that. Try /browse or /newdeal to begin — or send /start for help."
     )
 
 
@@ -1,15 +1,50 @@
 """Structured logging configuration using structlog."""
 
+import atexit
 import logging
 import os
 import re
 import sys
+import threading
+import time
+from typing import Any, TextIO
 
+import orjson
 import structlog
 
 # Pattern to match Telegram bot tokens in URLs and strings
 # Format: <bot_id>:<token> e.g., 8392205405:AAGcX5QLzoD6l7gSh4RahBAdYpY8jsSorSI
-_BOT_TOKEN_PATTERN = re.compile(r"(\d{8,12}:[A-Za-z0-9_-]{35})")
+_BOT_TOKEN_PATTERN = re.compile(r"(\d{8,12}:[A-Za-z0-9_-]{35})", re.ASCII)
+_BOT_TOKEN_REPLACEMENT = "<BOT_TOKEN_REDACTED>"
+
+# Buffered output: flush after this many lines or this many seconds
+LOG_FLUSH_LINES = 32
+LOG_FLUSH_INTERVAL_SECONDS = 0.1
+
+
+def _maybe_has_token(value: str) -> bool:
+    """Cheap pre-check for the <digits>:<secret> shape before running the regex.
+
+    Looks for a colon preceded by at least 8 digits and followed by at least
+    35 characters. Never rejects a string the pattern would match.
+    """
+    index = value.find(":", 8)
+    while index != -1:
+        if len(value) - index > 35 and value[index - 8 : index].isdigit():
+            return True
+        index = value.find(":", index + 1)
+    return False
+
+
+def _redact(value: str) -> str | None:
+    """Return value with secrets redacted, or None if it contains none.
+
+    Single entry point for both the stdlib filter and the structlog processor.
+    """
+    if not _maybe_has_token(value):
+        return None
+    redacted, count = _BOT_TOKEN_PATTERN.subn(_BOT_TOKEN_REPLACEMENT, value)
+    return redacted if count else None
 
 
 class TokenRedactingFilter(logging.Filter):
@@ -18,14 +53,18 @@ class TokenRedactingFilter(logging.Filter):
     def filter(self, record: logging.LogRecord) -> bool:
         """Redact bot tokens from log message."""
         if record.msg and isinstance(record.msg, str):
-            record.msg = _BOT_TOKEN_PATTERN.sub("<BOT_TOKEN_REDACTED>", record.msg)
-        if record.args:
-            record.args = tuple(
-                _BOT_TOKEN_PATTERN.sub("<BOT_TOKEN_REDACTED>", str(arg))
-                if isinstance(arg, str)
-                else arg
-                for arg in record.args
-            )
+            redacted = _redact(record.msg)
+            if redacted is not None:
+                record.msg = redacted
+        if record.args and isinstance(record.args, tuple):
+            redacted_args = [
+                _redact(arg) if isinstance(arg, str) else None for arg in record.args
+            ]
+            if any(arg is not None for arg in redacted_args):
+                record.args = tuple(
+                    arg if redacted is None else redacted
+                    for arg, redacted in zip(record.args, redacted_args)
+                )
         return True
 
 
@@ -33,12 +72,120 @@ def _redact_tokens(
     logger: logging.Logger, method_name: str, event_dict: dict
 ) -> dict:
     """Structlog processor to redact bot tokens from event dictionaries."""
-    for key, value in list(event_dict.items()):
+    # Only values of existing keys are replaced, so iterating the live view is safe
+    for key, value in event_dict.items():
         if isinstance(value, str):
-            event_dict[key] = _BOT_TOKEN_PATTERN.sub("<BOT_TOKEN_REDACTED>", value)
+            redacted = _redact(value)
+            if redacted is not None:
+                event_dict[key] = redacted
     return event_dict
 
 
+def _orjson_dumps(value: Any, **kwargs: Any) -> str:
+    """Serialize an event dict with orjson, keeping structlog's fallback handler."""
+    return orjson.dumps(
+        value, default=kwargs.get("default"), option=orjson.OPT_NON_STR_KEYS
+    ).decode()
+
+
+class BufferedWriteLogger:
+    """Structlog logger that batches rendered lines into fewer writes.
+
+    Lines are written once LOG_FLUSH_LINES are pending or
+    LOG_FLUSH_INTERVAL_SECONDS have passed since the last write; a daemon
+    thread flushes lines left pending while the bot is idle. Error-level
+    events are written immediately so they are never lost on a crash.
+    Without a file, lines go to whatever sys.stdout is when they are written.
+    """
+
+    def __init__(self, file: TextIO | None = None):
+        self._file = file
+        self._buffer: list[str] = []
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        self._flusher: threading.Thread | None = None
+
+    def msg(self, message: str) -> None:
+        """Buffer a line, writing the batch once a threshold is reached."""
+        with self._lock:
+            self._buffer.append(message)
+            if (
+                len(self._buffer) >= LOG_FLUSH_LINES
+                or time.monotonic() - self._last_flush >= LOG_FLUSH_INTERVAL_SECONDS
+            ):
+                self._flush_locked()
+            elif self._flusher is None:
+                self._flusher = threading.Thread(
+                    target=self._flush_periodically, name="log-flusher", daemon=True
+                )
+                self._flusher.start()
+
+    def msg_now(self, message: str) -> None:
+        """Write a line together with anything already buffered."""
+        with self._lock:
+            self._buffer.append(message)
+            self._flush_locked()
+
+    def flush(self) -> None:
+        """Write all buffered lines."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_periodically(self) -> None:
+        while True:
+            time.sleep(LOG_FLUSH_INTERVAL_SECONDS)
+            self.flush()
+
+    def _flush_locked(self) -> None:
+        if self._buffer:
+            file = self._file or sys.stdout
+            file.write("\n".join(self._buffer) + "\n")
+            file.flush()
+            self._buffer.clear()
+        self._last_flush = time.monotonic()
+
+    log = debug = info = warn = warning = msg
+    fatal = failure = err = error = critical = exception = msg_now
+
+
+# One writer shared by structlog and the stdlib root handler so their lines
+# stay in order; created once so repeated setup_logging() calls reuse it
+_writer = BufferedWriteLogger()
+atexit.register(_writer.flush)
+
+
+def _get_writer(*args: Any) -> BufferedWriteLogger:
+    """Structlog logger factory returning the shared writer."""
+    return _writer
+
+
+class _SharedWriterHandler(logging.Handler):
+    """Stdlib handler that writes formatted records through the shared writer."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            message = self.format(record)
+        except Exception:
+            self.handleError(record)
+            return
+        if record.levelno >= logging.ERROR:
+            _writer.msg_now(message)
+        else:
+            _writer.msg(message)
+
+
+_timestamper = structlog.processors.TimeStamper(fmt="iso")
+
+
+def _add_timestamp(
+    logger: Any, method_name: str, event_dict: dict[str, Any]
+) -> dict[str, Any]:
+    """Stamp the event unless the caller already recorded when it happened."""
+    if "timestamp" in event_dict:
+        return event_dict
+    return _timestamper(logger, method_name, event_dict)
+
+
 def setup_logging(log_level: str = "INFO") -> None:
     """Configure structured logging for the application."""
     # Create token-redacting filter
@@ -50,7 +197,7 @@ def setup_logging(log_level: str = "INFO") -> None:
 
     # Clear existing handlers and add new one with filter
     root_logger.handlers.clear()
-    handler = logging.StreamHandler(sys.stdout)
+    handler = _SharedWriterHandler()
     handler.setLevel(getattr(logging, log_level.upper()))
     handler.setFormatter(logging.Formatter("%(message)s"))
     handler.addFilter(token_filter)
@@ -61,21 +208,23 @@ def setup_logging(log_level: str = "INFO") -> None:
         lib_logger = logging.getLogger(logger_name)
         lib_logger.addFilter(token_filter)
 
+    # The filtering bound logger turns calls below log_level into no-ops, so
+    # dropped events never reach the processors (including _redact_tokens).
     structlog.configure(
         processors=[
             structlog.contextvars.merge_contextvars,
             structlog.processors.add_log_level,
-            structlog.processors.TimeStamper(fmt="iso"),
+            _add_timestamp,
             _redact_tokens,  # Custom processor to redact tokens
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
-            structlog.processors.JSONRenderer(),
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps),
         ],
         wrapper_class=structlog.make_filtering_bound_logger(
             getattr(logging, log_level.upper())
         ),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
+        logger_factory=_get_writer,
         cache_logger_on_first_use=True,
     )
 
@@ -3,15 +3,28 @@
 Provides detailed audit trails for compliance and security monitoring.
 """
 
-from datetime import datetime
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Final, Optional
 from uuid import UUID
 
 from src.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Background drain settings
+AUDIT_QUEUE_MAXSIZE = 10_000
+AUDIT_DRAIN_BATCH_SIZE = 256
+
+# Shared metadata for entries logged without any; never mutate
+_EMPTY_METADATA: Final[dict[str, Any]] = {}
+
+# Queue of pending audit entries; only set while run_audit_drain() is running
+_audit_queue: asyncio.Queue["AuditEntry"] | None = None
+
 
 class AuditEventType(str, Enum):
     """Types of auditable events."""
@@ -42,6 +55,42 @@ class AuditEventType(str, Enum):
     INVALID_ACCESS_ATTEMPT = "invalid_access_attempt"
 
 
+@dataclass(slots=True)
+class AuditEntry:
+    """A single audit record, held as-is until it is written."""
+
+    event_type: AuditEventType
+    actor_id: int
+    resource_type: str
+    resource_id: UUID | str
+    action: str
+    success: bool
+    metadata: Optional[dict[str, Any]]
+    error: Optional[str]
+    created_at: float
+
+    @property
+    def timestamp(self) -> str:
+        """When the event was logged, in the same ISO form as other log lines."""
+        stamp = datetime.fromtimestamp(self.created_at, timezone.utc).isoformat()
+        return stamp.replace("+00:00", "Z")
+
+    def write(self) -> None:
+        """Write the entry through the structured logger."""
+        logger.info(
+            "audit_event",
+            event_type=self.event_type.value,
+            actor_id=self.actor_id,
+            resource_type=self.resource_type,
+            resource_id=self.resource_id,
+            action=self.action,
+            success=self.success,
+            metadata=self.metadata or _EMPTY_METADATA,
+            timestamp=self.timestamp,
+            **({"error": self.error} if self.error else {}),
+        )
+
+
 class AuditLogger:
     """Centralized audit logging service."""
 
@@ -69,25 +118,28 @@ class AuditLogger:
             metadata: Additional context (prices, quantities, etc.)
             error: Error message if action failed
         """
-        audit_entry = {
-            "event_type": event_type.value,
-            "actor_id": actor_id,
-            "resource_type": resource_type,
-            "resource_id": str(resource_id),
-            "action": action,
-            "success": success,
-            "timestamp": datetime.utcnow().isoformat(),
-            "metadata": metadata or {},
-        }
-
-        if error:
-            audit_entry["error"] = error
-
-        logger.info(
-            "audit_event",
-            **audit_entry,
+        audit_entry = AuditEntry(
+            event_type=event_type,
+            actor_id=actor_id,
+            resource_type=resource_type,
+            resource_id=resource_id,
+            action=action,
+            success=success,
+            metadata=metadata,
+            error=error,
+            created_at=time.time(),
         )
 
+        # Hand off to the background drain when running; log inline otherwise
+        if _audit_queue is not None:
+            try:
+                _audit_queue.put_nowait(audit_entry)
+                return
+            except asyncio.QueueFull:
+                pass
+
+        audit_entry.write()
+
     @staticmethod
     def log_business_registered(
         actor_id: int,
@@ -249,3 +301,41 @@ class AuditLogger:
                 "window_seconds": window_seconds,
             },
         )
+
+
+async def run_audit_drain() -> None:
+    """
+    Write queued audit entries to the structured logger.
+
+    Runs until cancelled. While running, AuditLogger.log_event enqueues
+    entries instead of writing them inline, keeping log I/O off the
+    request path. Entries still queued on cancellation are flushed.
+    """
+    global _audit_queue
+    queue: asyncio.Queue[AuditEntry] = asyncio.Queue(maxsize=AUDIT_QUEUE_MAXSIZE)
+    _audit_queue = queue
+
+    try:
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < AUDIT_DRAIN_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            for audit_entry in batch:
+                _write_entry(audit_entry)
+    finally:
+        _audit_queue = None
+        while not queue.empty():
+            _write_entry(queue.get_nowait())
+
+
+def _write_entry(audit_entry: AuditEntry) -> None:
+    """Write one entry, logging failures so the drain keeps running."""
+    try:
+        audit_entry.write()
+    except Exception:
+        logger.exception(
+            "audit_write_failed",
+            event_type=audit_entry.event_type.value,
+            resource_id=audit_entry.resource_id,
+        )
@@ -1,9 +1,32 @@
 """Models package - Pydantic domain models."""
 
-from .business import Business, BusinessInput, VerificationStatus, Venue
-from .offer import Offer, OfferCategory, OfferInput, OfferStatus
-from .reservation import Reservation, ReservationInput, ReservationStatus
-from .user import User, UserInput, UserRole
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .business import Business, BusinessInput, VerificationStatus, Venue
+    from .offer import Offer, OfferCategory, OfferInput, OfferStatus
+    from .reservation import Reservation, ReservationInput, ReservationStatus
+    from .user import User, UserInput, UserRole
+
+# Submodules are imported on first attribute access (PEP 562), so importing
+# one model does not build every other Pydantic model class.
+_EXPORTS = {
+    "Business": ".business",
+    "BusinessInput": ".business",
+    "VerificationStatus": ".business",
+    "Venue": ".business",
+    "Offer": ".offer",
+    "OfferCategory": ".offer",
+    "OfferInput": ".offer",
+    "OfferStatus": ".offer",
+    "Reservation": ".reservation",
+    "ReservationInput": ".reservation",
+    "ReservationStatus": ".reservation",
+    "User": ".user",
+    "UserInput": ".user",
+    "UserRole": ".user",
+}
 
 __all__ = [
     "Business",
@@ -21,3 +44,18 @@ __all__ = [
     "UserInput",
     "UserRole",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule defining name on first access."""
+    try:
+        module_name = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Any, Mapping, Optional, Self
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel, Field, field_validator
@@ -32,12 +32,7 @@ class BusinessInput(BaseModel):
 
     business_name: str = Field(min_length=3, max_length=200)
     owner_id: int = Field(description="User ID of the business owner")
-    street_address: str = Field(min_length=1, max_length=200)
-    city: str = Field(min_length=1, max_length=100)
-    postal_code: str = Field(min_length=1, max_length=20)
-    country_code: str = Field(default="FI", min_length=2, max_length=2)
-    latitude: Optional[float] = Field(default=None, ge=-90, le=90)
-    longitude: Optional[float] = Field(default=None, ge=-180, le=180)
+    venue: Venue
     phone: Optional[str] = Field(default=None, max_length=20)
     logo_url: Optional[str] = None
 
@@ -57,3 +52,11 @@ class Business(BaseModel):
     verified_by: Optional[int] = None
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]) -> Self:
+        """Build from an already-validated database row, skipping validation.
+
+        venue is expected as a mapping of Venue fields.
+        """
+        return cls.model_construct(**{**row, "venue": Venue.model_construct(**row["venue"])})
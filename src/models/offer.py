@@ -3,10 +3,10 @@
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Optional
+from typing import Any, Mapping, Optional, Self
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 
 class OfferStatus(str, Enum):
@@ -28,6 +28,10 @@ class OfferCategory(str, Enum):
     OTHER = "OTHER"
 
 
+# Bound once so availability checks skip the Enum metaclass lookup
+_ACTIVE = OfferStatus.ACTIVE
+
+
 class Offer(BaseModel):
     """Offer entity."""
 
@@ -48,38 +52,42 @@ class Offer(BaseModel):
     published_at: Optional[datetime] = None
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
-    @field_validator("pickup_end_time")
-    @classmethod
-    def validate_time_range(cls, v: datetime, info) -> datetime:
-        """Ensure pickup_start_time < pickup_end_time."""
-        values = info.data
-        if "pickup_start_time" in values and v <= values["pickup_start_time"]:
+    @model_validator(mode="after")
+    def validate_invariants(self) -> "Offer":
+        """Ensure pickup_start_time < pickup_end_time and quantity_remaining <= quantity_total."""
+        if self.pickup_end_time <= self.pickup_start_time:
             raise ValueError("pickup_end_time must be after pickup_start_time")
-        return v
-
-    @field_validator("quantity_remaining")
-    @classmethod
-    def validate_quantity(cls, v: int, info) -> int:
-        """Ensure quantity_remaining <= quantity_total."""
-        values = info.data
-        if "quantity_total" in values and v > values["quantity_total"]:
+        if self.quantity_remaining > self.quantity_total:
             raise ValueError("quantity_remaining cannot exceed quantity_total")
-        return v
+        return self
 
     @property
     def is_expired(self) -> bool:
         """Check if offer has expired based on end_time."""
-        return datetime.utcnow() >= self.pickup_end_time
+        return self.is_expired_at(datetime.utcnow())
 
     @property
     def available_for_reservation(self) -> bool:
         """Check if offer is available for reservation."""
+        return self.is_available_at(datetime.utcnow())
+
+    def is_expired_at(self, now: datetime) -> bool:
+        """Check if offer has expired as of now (for callers reusing one timestamp)."""
+        return now >= self.pickup_end_time
+
+    def is_available_at(self, now: datetime) -> bool:
+        """Check if offer is available for reservation as of now."""
         return (
-            self.state == OfferStatus.ACTIVE
+            self.state == _ACTIVE
             and self.quantity_remaining > 0
-            and not self.is_expired
+            and not self.is_expired_at(now)
         )
 
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]) -> Self:
+        """Build from an already-validated database row, skipping validation."""
+        return cls.model_construct(**row)
+
 
 class OfferInput(BaseModel):
     """Input model for offer creation."""
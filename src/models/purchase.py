@@ -3,10 +3,10 @@
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Optional
+from typing import Any, Mapping, Optional, Self
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, model_validator
 
 
 class PurchaseStatus(str, Enum):
@@ -42,9 +42,25 @@ class PurchaseInput(BaseModel):
     payment_provider: Optional[PaymentProvider] = None
     payment_session_id: Optional[str] = None
 
+    @model_validator(mode="after")
+    def validate_total(self) -> "PurchaseInput":
+        """Ensure total matches sum of item selections."""
+        calculated = sum(
+            item.quantity * item.unit_price for item in self.item_selections
+        )
+        if self.total_amount != calculated:
+            raise ValueError(
+                f"total_amount {self.total_amount} does not match calculated total {calculated}"
+            )
+        return self
+
 
 class Purchase(BaseModel):
-    """Purchase entity."""
+    """Purchase entity.
+
+    total_amount is checked against item_selections on PurchaseInput and
+    trusted here, so reloading stored purchases does not re-sum every item.
+    """
 
     id: UUID = Field(default_factory=uuid4)
     offer_id: UUID
@@ -56,20 +72,16 @@ class Purchase(BaseModel):
     status: PurchaseStatus = PurchaseStatus.PENDING
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
-    @field_validator("total_amount")
     @classmethod
-    def validate_total(cls, v: Decimal, info) -> Decimal:
-        """Ensure total matches sum of item selections."""
-        values = info.data
-        if "item_selections" in values:
-            calculated = sum(
-                item.quantity * item.unit_price for item in values["item_selections"]
-            )
-            if v != calculated:
-                raise ValueError(
-                    f"total_amount {v} does not match calculated total {calculated}"
-                )
-        return v
+    def from_row(cls, row: Mapping[str, Any]) -> Self:
+        """Build from an already-validated database row, skipping validation.
+
+        item_selections is expected as stored: a list of item dicts.
+        """
+        item_selections = [
+            PurchaseItem.model_construct(**item) for item in row["item_selections"]
+        ]
+        return cls.model_construct(**{**row, "item_selections": item_selections})
 
 
 class Customer(BaseModel):
@@ -80,20 +92,16 @@ class Customer(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
 
+class PurchaseRequestItem(BaseModel):
+    """Single item selection in a purchase request."""
+
+    item_name: str
+    quantity: int = Field(gt=0, strict=True)
+
+
 class PurchaseRequest(BaseModel):
     """Purchase initiation request."""
 
-    items: list[dict[str, int | str]] = Field(
+    items: list[PurchaseRequestItem] = Field(
         min_length=1, description="List of {item_name, quantity}"
     )
-
-    @field_validator("items")
-    @classmethod
-    def validate_items(cls, v: list[dict]) -> list[dict]:
-        """Ensure each item has required fields."""
-        for item in v:
-            if "item_name" not in item or "quantity" not in item:
-                raise ValueError("Each item must have item_name and quantity")
-            if not isinstance(item["quantity"], int) or item["quantity"] <= 0:
-                raise ValueError("quantity must be a positive integer")
-        return v
@@ -3,10 +3,10 @@
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Optional
+from typing import Annotated, Any, Mapping, Optional, Self
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, StringConstraints
 
 
 class ReservationStatus(str, Enum):
@@ -16,11 +16,18 @@ class ReservationStatus(str, Enum):
     CANCELLED = "CANCELLED"
 
 
+# Module-level alias avoids the Enum class attribute lookup in is_cancellable
+_CONFIRMED = ReservationStatus.CONFIRMED
+
+# Customer-facing order ID, always "RES-" plus 8 hex characters
+OrderIdStr = Annotated[str, StringConstraints(min_length=12, max_length=12)]
+
+
 class Reservation(BaseModel):
     """Reservation entity for on-site payment pickups."""
 
     id: UUID = Field(default_factory=uuid4)
-    order_id: str = Field(min_length=12, max_length=12, description="Customer-facing order ID (e.g., RES-A3F2B8C1)")
+    order_id: OrderIdStr = Field(description="Customer-facing order ID (e.g., RES-A3F2B8C1)")
     offer_id: UUID = Field(description="Reserved offer")
     customer_id: int = Field(gt=0, description="Customer's telegram user ID")
     quantity: int = Field(gt=0, description="Number of units reserved")
@@ -38,7 +45,16 @@ class Reservation(BaseModel):
     @property
     def is_cancellable(self) -> bool:
         """Check if reservation can still be cancelled."""
-        return self.status == ReservationStatus.CONFIRMED and datetime.utcnow() < self.pickup_end_time
+        return self.is_cancellable_at(datetime.utcnow())
+
+    def is_cancellable_at(self, now: datetime) -> bool:
+        """Check if reservation can still be cancelled as of now."""
+        return self.status == _CONFIRMED and now < self.pickup_end_time
+
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]) -> Self:
+        """Build from an already-validated database row, skipping validation."""
+        return cls.model_construct(**row)
 
 
 class ReservationInput(BaseModel):
@@ -48,7 +64,6 @@ class ReservationInput(BaseModel):
     customer_id: int = Field(gt=0)
     quantity: int = Field(gt=0)
     unit_price: Decimal = Field(ge=0)
-    total_price: Decimal = Field(ge=0)
     currency: str = Field(default="EUR", min_length=3, max_length=3)
     pickup_start_time: datetime
     pickup_end_time: datetime
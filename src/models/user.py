@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Any, Mapping, Optional, Self
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel, Field
@@ -30,6 +30,11 @@ class User(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]) -> Self:
+        """Build from an already-validated database row, skipping validation."""
+        return cls.model_construct(**row)
+
 
 class UserInput(BaseModel):
     """Input model for user creation."""
@@ -17,12 +17,21 @@ class Permission(str, Enum):
     MAKE_RESERVATION = "make_reservation"
 
 
+# Enum member lookups go through the Enum metaclass; bind the ones compared
+# on every check once at import time.
+_BUSINESS = UserRole.BUSINESS
+_CUSTOMER = UserRole.CUSTOMER
+_APPROVED = VerificationStatus.APPROVED
+
+
 class PermissionChecker:
     """Check user permissions for actions."""
 
+    __slots__ = ("admin_user_ids",)
+
     def __init__(self, admin_user_ids: list[int] | None = None):
         """Initialize permission checker."""
-        self.admin_user_ids = admin_user_ids or []
+        self.admin_user_ids: frozenset[int] = frozenset(admin_user_ids or ())
 
     def is_admin(self, telegram_user_id: int) -> bool:
         """Check if user is admin by telegram ID."""
@@ -31,17 +40,17 @@ class PermissionChecker:
     def can_post_offer(self, user: User, business: Business) -> bool:
         """Check if user can post offers."""
         return (
-            user.role == UserRole.BUSINESS
+            user.role == _BUSINESS
             and business.owner_id == user.id
-            and business.verification_status == VerificationStatus.APPROVED
+            and business.verification_status == _APPROVED
         )
 
     def can_edit_offer(self, user: User, business: Business, offer_business_id: UUID) -> bool:
         """Check if user can edit offer."""
         return (
-            user.role == UserRole.BUSINESS
+            user.role == _BUSINESS
             and business.owner_id == user.id
-            and business.verification_status == VerificationStatus.APPROVED
+            and business.verification_status == _APPROVED
             and business.id == offer_business_id
         )
 
@@ -51,4 +60,4 @@ class PermissionChecker:
 
     def can_make_reservation(self, user: User) -> bool:
         """Check if user can make reservations (customers only)."""
-        return user.role == UserRole.CUSTOMER
+        return user.role == _CUSTOMER
@@ -1,9 +1,20 @@
 """Rate limiting for bot commands and API calls."""
 
-from datetime import datetime, timedelta
 from typing import Optional
 
 import redis.asyncio as redis
+from redis.commands.core import AsyncScript
+
+# Fixed-window counter in one round-trip.
+# KEYS[1] = key; ARGV[1] = window_seconds
+# Returns {request_count, seconds_until_window_resets}.
+_FIXED_WINDOW_LUA = """
+local count = redis.call('INCR', KEYS[1])
+if count == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return {count, redis.call('TTL', KEYS[1])}
+"""
 
 
 class RateLimiter:
@@ -20,10 +31,17 @@ class RateLimiter:
         self.max_requests = max_requests
         self.window_seconds = window_seconds
         self._client: redis.Redis | None = None
+        self._check_script: AsyncScript | None = None
 
     async def connect(self) -> None:
         """Establish Redis connection."""
         self._client = await redis.from_url(self.redis_url, encoding="utf-8")
+        self._check_script = self._client.register_script(_FIXED_WINDOW_LUA)
+
+    @staticmethod
+    def _key(user_id: int, action: str) -> str:
+        """Build the Redis key holding a user's count for action."""
+        return f"tmkt:ratelimit:fw:{action}:{user_id}"
 
     async def disconnect(self) -> None:
         """Close Redis connection."""
@@ -33,41 +51,26 @@ class RateLimiter:
     async def check_rate_limit(self, user_id: int, action: str) -> tuple[bool, Optional[int]]:
         """Check if user has exceeded rate limit.
 
+        Counts requests in fixed windows of window_seconds, starting at a
+        user's first request.
+
         Returns:
             (is_allowed, retry_after_seconds)
         """
         if not self._client:
             raise RuntimeError("Redis client not connected")
 
-        key = f"tmkt:ratelimit:{action}:{user_id}"
-        now = datetime.utcnow()
-        window_start = now - timedelta(seconds=self.window_seconds)
-
-        # Remove old entries outside window
-        await self._client.zremrangebyscore(key, 0, window_start.timestamp())
-
-        # Count requests in current window
-        count = await self._client.zcard(key)
-
-        if count >= self.max_requests:
-            # Get oldest request in window to calculate retry_after
-            oldest = await self._client.zrange(key, 0, 0, withscores=True)
-            if oldest:
-                oldest_time = datetime.fromtimestamp(oldest[0][1])
-                retry_after = int((oldest_time + timedelta(seconds=self.window_seconds) - now).total_seconds())
-                return False, retry_after
-            return False, self.window_seconds
-
-        # Add current request
-        await self._client.zadd(key, {str(now.timestamp()): now.timestamp()})
-        await self._client.expire(key, self.window_seconds)
+        count, ttl = await self._check_script(
+            keys=[self._key(user_id, action)], args=[self.window_seconds]
+        )
 
-        return True, None
+        if count <= self.max_requests:
+            return True, None
+        return False, ttl if ttl > 0 else self.window_seconds
 
     async def reset_limit(self, user_id: int, action: str) -> None:
         """Reset rate limit for user action."""
         if not self._client:
             raise RuntimeError("Redis client not connected")
 
-        key = f"tmkt:ratelimit:{action}:{user_id}"
-        await self._client.delete(key)
+        await self._client.delete(self._key(user_id, action))
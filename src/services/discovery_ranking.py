@@ -1,10 +1,14 @@
 """Discovery ranking service with geolocation filtering."""
 
 import math
+from operator import itemgetter
 from typing import Optional
 
 from src.models.offer import Offer
 
+# Earth's radius in kilometers
+EARTH_RADIUS_KM = 6371.0
+
 
 class DiscoveryRankingService:
     """Service for ranking and filtering offers based on geolocation."""
@@ -24,9 +28,6 @@ class DiscoveryRankingService:
         
         Returns distance in kilometers.
         """
-        # Earth's radius in kilometers
-        R = 6371.0
-
         # Convert degrees to radians
         lat1_rad = math.radians(lat1)
         lon1_rad = math.radians(lon1)
@@ -43,7 +44,7 @@ class DiscoveryRankingService:
         )
         c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
 
-        distance = R * c
+        distance = EARTH_RADIUS_KM * c
         return distance
 
     def is_within_radius(
@@ -65,17 +66,36 @@ class DiscoveryRankingService:
         user_lat: float,
         user_lon: float,
     ) -> list[tuple[Offer, float]]:  # (offer, distance_km)
-        """Filter offers by proximity and return with distances."""
+        """Filter offers by proximity and return with distances.
+
+        Same Haversine formula as calculate_distance, with the user-side
+        terms computed once rather than per offer. The great-circle distance
+        is never shorter than the latitude difference alone, so offers
+        outside that band are skipped before any trig.
+        """
+        radians, sin, cos, asin, sqrt = math.radians, math.sin, math.cos, math.asin, math.sqrt
+        user_lat_rad = radians(user_lat)
+        user_lon_rad = radians(user_lon)
+        cos_user_lat = cos(user_lat_rad)
+        radius_km = self.nearby_radius_km
+        max_dlat_rad = radius_km / EARTH_RADIUS_KM
+        diameter_km = 2 * EARTH_RADIUS_KM
+
         results = []
         for offer, business_lat, business_lon in offers:
-            distance = self.calculate_distance(
-                user_lat, user_lon, business_lat, business_lon
+            lat_rad = radians(business_lat)
+            if abs(lat_rad - user_lat_rad) > max_dlat_rad:
+                continue
+            a = (
+                sin((lat_rad - user_lat_rad) / 2) ** 2
+                + cos_user_lat * cos(lat_rad) * sin((radians(business_lon) - user_lon_rad) / 2) ** 2
             )
-            if distance <= self.nearby_radius_km:
+            distance = diameter_km * asin(min(1.0, sqrt(a)))
+            if distance <= radius_km:
                 results.append((offer, distance))
 
         # Sort by distance (closest first)
-        results.sort(key=lambda x: x[1])
+        results.sort(key=itemgetter(1))
         return results
 
     def rank_offers(
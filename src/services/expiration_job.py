@@ -7,7 +7,6 @@ Runs on a schedule and updates offer status from ACTIVE to EXPIRED.
 from datetime import datetime
 
 from src.logging import get_logger
-from src.models.offer import OfferStatus
 from src.storage.postgres_offer_repo import PostgresOfferRepository
 
 logger = get_logger(__name__)
@@ -30,60 +29,34 @@ class ExpirationJob:
         Execute expiration job.
 
         Queries for offers past their end time and updates status to EXPIRED.
+        Errors propagate so a failed sweep is not mistaken for an idle one.
 
         Returns:
-            Dictionary with counts: {"expired": count, "failed": count}
+            Dictionary with counts: {"expired": count}
         """
         logger.info("expiration_job_started")
 
-        try:
-            # Get offers that have passed their end time
-            expired_offers = await self.offer_repo.get_expired_offers()
-
-            expired_count = 0
-            failed_count = 0
-
-            for offer in expired_offers:
-                try:
-                    # Update status to EXPIRED
-                    await self.offer_repo.update_status(offer.id, OfferStatus.EXPIRED)
-                    expired_count += 1
-
-                    logger.info(
-                        "offer_expired",
-                        offer_id=str(offer.id),
-                        business_id=str(offer.business_id),
-                        end_time=offer.end_time.isoformat(),
-                    )
-
-                except Exception as e:
-                    failed_count += 1
-                    logger.error(
-                        "offer_expiration_failed",
-                        offer_id=str(offer.id),
-                        error=str(e),
-                        exc_info=True,
-                    )
-
-            result = {"expired": expired_count, "failed": failed_count}
+        # Expire all offers past their end time in a single UPDATE
+        expired_offers = await self.offer_repo.bulk_expire_due()
 
+        for offer in expired_offers:
             logger.info(
-                "expiration_job_completed",
-                expired=expired_count,
-                failed=failed_count,
+                "offer_expired",
+                offer_id=str(offer.id),
+                business_id=str(offer.business_id),
+                end_time=offer.pickup_end_time.isoformat(),
             )
 
-            return result
+        expired_count = len(expired_offers)
+        logger.info("expiration_job_completed", expired=expired_count)
 
-        except Exception as e:
-            logger.error("expiration_job_error", error=str(e), exc_info=True)
-            return {"expired": 0, "failed": 0}
+        return {"expired": expired_count}
 
     async def run_once(self) -> dict[str, int]:
         """
         Run expiration job once (for manual trigger or testing).
 
         Returns:
-            Dictionary with counts: {"expired": count, "failed": count}
+            Dictionary with counts: {"expired": count}
         """
         return await self.run()
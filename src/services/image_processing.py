@@ -7,11 +7,11 @@ Handles:
 - Storage to filesystem or S3
 """
 
+import asyncio
 from io import BytesIO
-from pathlib import Path
 from uuid import uuid4
 
-from PIL import Image
+from PIL import Image, UnidentifiedImageError
 
 from src.logging import get_logger
 from src.storage.image_store import ImageStoreProtocol
@@ -23,6 +23,8 @@ MAX_FILE_SIZE_MB = 5
 MAX_DIMENSION = 2048
 THUMBNAIL_SIZE = (400, 400)
 ALLOWED_FORMATS = {"JPEG", "PNG", "WEBP"}
+# Image.open only accepts a list or tuple here
+_OPEN_FORMATS = tuple(sorted(ALLOWED_FORMATS))
 
 
 class ImageProcessor:
@@ -53,16 +55,64 @@ class ImageProcessor:
         if size_mb > MAX_FILE_SIZE_MB:
             raise ValueError(f"Image too large: {size_mb:.2f}MB (max {MAX_FILE_SIZE_MB}MB)")
 
-        # Load and validate image
-        try:
-            image = Image.open(BytesIO(file_bytes))
-        except Exception as e:
-            raise ValueError(f"Invalid image file: {e}")
+        # Decoding and resizing are CPU-bound; run them in a worker thread so
+        # other handlers keep being served while a large upload is processed
+        image = await asyncio.to_thread(self._decode_image, file_bytes, file_id)
+
+        # Save images; both files share one id so a thumbnail can be found
+        # from its image
+        base_name = uuid4().hex
+        image_filename = f"{base_name}.jpg"
+        thumbnail_filename = f"{base_name}_thumb.jpg"
+
+        # Encode the image and build the thumbnail in parallel; Pillow releases
+        # the GIL while resizing and encoding
+        image_bytes, thumbnail_bytes = await asyncio.gather(
+            asyncio.to_thread(self._to_jpeg_bytes, image),
+            asyncio.to_thread(self._thumbnail_jpeg_bytes, image),
+        )
+
+        # Store images; the two writes are independent, but if one fails the
+        # other is removed so no orphaned file is left behind
+        results = await asyncio.gather(
+            self.image_store.save(image_filename, image_bytes),
+            self.image_store.save(thumbnail_filename, thumbnail_bytes),
+            return_exceptions=True,
+        )
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            for result in results:
+                if not isinstance(result, BaseException):
+                    await self.delete_image(result)
+            raise errors[0]
+
+        image_url, thumbnail_url = results
+
+        logger.info(
+            "image_processed",
+            file_id=file_id,
+            image_url=image_url,
+            thumbnail_url=thumbnail_url,
+        )
 
-        if image.format not in ALLOWED_FORMATS:
+        return image_url, thumbnail_url
+
+    def _decode_image(self, file_bytes: bytes, file_id: str) -> Image.Image:
+        """Decode and validate an upload, capping it at MAX_DIMENSION.
+
+        The returned image is fully loaded, so it can be read from several
+        threads at once without racing on Pillow's lazy decoding.
+        """
+        # Open only reads the header; restricting formats means other codecs are
+        # never probed, and pixels are not decoded until load() below
+        try:
+            image = Image.open(BytesIO(file_bytes), formats=_OPEN_FORMATS)
+        except UnidentifiedImageError:
             raise ValueError(
-                f"Unsupported format: {image.format}. Allowed: {', '.join(ALLOWED_FORMATS)}"
+                f"Unsupported format. Allowed: {', '.join(_OPEN_FORMATS)}"
             )
+        except Exception as e:
+            raise ValueError(f"Invalid image file: {e}")
 
         logger.info(
             "image_received",
@@ -71,34 +121,18 @@ class ImageProcessor:
             size=f"{image.width}x{image.height}",
         )
 
+        # JPEG can be decoded directly at 1/2, 1/4 or 1/8 scale, which skips most
+        # of the IDCT work and leaves the Lanczos pass a smaller buffer to read
+        if image.format == "JPEG":
+            image.draft("RGB", (MAX_DIMENSION, MAX_DIMENSION))
+
         # Resize if needed
         if image.width > MAX_DIMENSION or image.height > MAX_DIMENSION:
             image = self._resize_image(image, MAX_DIMENSION)
             logger.info("image_resized", new_size=f"{image.width}x{image.height}")
 
-        # Create thumbnail
-        thumbnail = self._create_thumbnail(image)
-
-        # Save images
-        image_filename = f"{uuid4()}.jpg"
-        thumbnail_filename = f"{uuid4()}_thumb.jpg"
-
-        # Convert to JPEG bytes
-        image_bytes = self._to_jpeg_bytes(image)
-        thumbnail_bytes = self._to_jpeg_bytes(thumbnail)
-
-        # Store images
-        image_url = await self.image_store.save(image_filename, image_bytes)
-        thumbnail_url = await self.image_store.save(thumbnail_filename, thumbnail_bytes)
-
-        logger.info(
-            "image_processed",
-            file_id=file_id,
-            image_url=image_url,
-            thumbnail_url=thumbnail_url,
-        )
-
-        return image_url, thumbnail_url
+        image.load()
+        return image
 
     def _resize_image(self, image: Image.Image, max_dimension: int) -> Image.Image:
         """Resize image maintaining aspect ratio."""
@@ -108,27 +142,39 @@ class ImageProcessor:
 
     def _create_thumbnail(self, image: Image.Image) -> Image.Image:
         """Create thumbnail maintaining aspect ratio."""
-        thumbnail = image.copy()
-        thumbnail.thumbnail(THUMBNAIL_SIZE, Image.Resampling.LANCZOS)
-        return thumbnail
+        # resize() returns a new image, so there is no need to copy the source
+        # first as Image.thumbnail() (which works in place) would require
+        ratio = min(THUMBNAIL_SIZE[0] / image.width, THUMBNAIL_SIZE[1] / image.height, 1.0)
+        new_size = (max(1, round(image.width * ratio)), max(1, round(image.height * ratio)))
+        return image.resize(new_size, Image.Resampling.LANCZOS, reducing_gap=2.0)
+
+    def _thumbnail_jpeg_bytes(self, image: Image.Image) -> bytes:
+        """Create thumbnail and convert it to JPEG bytes."""
+        return self._to_jpeg_bytes(self._create_thumbnail(image))
 
     def _to_jpeg_bytes(self, image: Image.Image, quality: int = 85) -> bytes:
         """Convert image to JPEG bytes."""
-        # Convert RGBA to RGB if needed
-        if image.mode in ("RGBA", "P"):
+        # Flatten transparency onto white; only the alpha band is extracted for
+        # the mask rather than splitting every channel
+        if image.mode == "RGBA":
             rgb_image = Image.new("RGB", image.size, (255, 255, 255))
-            rgb_image.paste(image, mask=image.split()[-1] if image.mode == "RGBA" else None)
+            rgb_image.paste(image, mask=image.getchannel("A"))
             image = rgb_image
+        elif image.mode == "P":
+            image = image.convert("RGB")
 
-        buffer = BytesIO()
-        image.save(buffer, format="JPEG", quality=quality, optimize=True)
-        return buffer.getvalue()
+        # Pillow already encodes through libjpeg-turbo; optimize=True would add a
+        # second Huffman pass that doubles encode time for a ~5% smaller file.
+        # 4:2:0 chroma subsampling is pinned so uploads never inherit the source's.
+        with BytesIO() as buffer:
+            image.save(buffer, format="JPEG", quality=quality, subsampling=2)
+            return buffer.getvalue()
 
     async def delete_image(self, image_url: str) -> bool:
         """Delete image from storage."""
         try:
             # Extract filename from URL
-            filename = Path(image_url).name
+            filename = image_url.rsplit("/", 1)[-1]
             await self.image_store.delete(filename)
             logger.info("image_deleted", image_url=image_url)
             return True
@@ -1,7 +1,7 @@
 """Inventory reservation service.
 
-Manages temporary reservations of offer items during purchase flow
-using Redis locks to prevent overselling.
+Manages temporary reservations of offer items during purchase flow.
+Overselling is prevented by the conditional decrement in the repository.
 """
 
 from contextlib import asynccontextmanager
@@ -12,7 +12,6 @@ from uuid import UUID
 from src.logging import get_logger
 from src.models.offer import Offer
 from src.storage.postgres_offer_repo import PostgresOfferRepository
-from src.storage.redis_locks import RedisLockHelper
 
 logger = get_logger(__name__)
 
@@ -21,22 +20,16 @@ RESERVATION_TIMEOUT_SECONDS = 300
 
 
 class InventoryReservation:
-    """Manages inventory reservations with locks."""
+    """Manages inventory reservations."""
 
-    def __init__(
-        self,
-        offer_repo: PostgresOfferRepository,
-        lock_helper: RedisLockHelper,
-    ):
+    def __init__(self, offer_repo: PostgresOfferRepository):
         """
         Initialize inventory reservation service.
 
         Args:
             offer_repo: Offer repository for updating quantities
-            lock_helper: Redis lock helper for preventing race conditions
         """
         self.offer_repo = offer_repo
-        self.lock_helper = lock_helper
 
     @asynccontextmanager
     async def reserve_items(
@@ -45,10 +38,10 @@ class InventoryReservation:
         item_requests: list[dict],
     ) -> AsyncIterator[dict]:
         """
-        Reserve items from an offer with distributed lock.
+        Reserve items from an offer.
 
-        Context manager that acquires lock, reserves items, and releases
-        on exit (commit or rollback).
+        Context manager that validates the request, then takes the stock in
+        one atomic decrement before yielding.
 
         Args:
             offer_id: Offer to reserve from
@@ -62,113 +55,103 @@ class InventoryReservation:
         """
         reservation = {"success": False, "items": [], "error": None}
 
-        # Acquire distributed lock on offer
-        async with self.lock_helper.acquire_offer_lock(offer_id) as lock_acquired:
-            if not lock_acquired:
-                reservation["error"] = "Could not acquire lock (offer busy)"
-                logger.warning("reservation_lock_failed", offer_id=str(offer_id))
-                yield reservation
-                return
-
-            try:
-                # Get current offer state
-                offer = await self.offer_repo.get_by_id(offer_id)
-
-                if not offer:
-                    reservation["error"] = "Offer not found"
-                    yield reservation
-                    return
-
-                # Check offer is still active
-                if offer.is_expired:
-                    reservation["error"] = "Offer has expired"
-                    yield reservation
-                    return
-
-                # Validate item requests against available inventory
-                for item_req in item_requests:
-                    item_name = item_req["item_name"]
-                    requested_qty = item_req["quantity"]
-
-                    # Find item in offer
-                    offer_item = next(
-                        (item for item in offer.items if item.name == item_name),
-                        None,
-                    )
-
-                    if not offer_item:
-                        reservation["error"] = f"Item '{item_name}' not found in offer"
-                        yield reservation
-                        return
-
-                    if offer_item.quantity < requested_qty:
-                        reservation["error"] = (
-                            f"Insufficient quantity for '{item_name}'. "
-                            f"Available: {offer_item.quantity}, "
-                            f"Requested: {requested_qty}"
-                        )
-                        yield reservation
-                        return
-
-                    reservation["items"].append(
-                        {
-                            "name": item_name,
-                            "quantity": requested_qty,
-                            "unit_price": offer_item.discounted_price,
-                        }
-                    )
+        try:
+            reservation["error"] = await self._validate_request(
+                offer_id, item_requests, reservation["items"]
+            )
 
-                # Decrement quantities atomically
-                for item_req in item_requests:
-                    success = await self.offer_repo.decrement_quantity(
-                        offer_id,
-                        item_req["item_name"],
-                        item_req["quantity"],
+            # No offer lock: the conditional UPDATE re-checks stock itself, so
+            # the whole request is taken atomically or not at all
+            if reservation["error"] is None:
+                if await self.offer_repo.decrement_quantity(
+                    offer_id,
+                    sum(item_req["quantity"] for item_req in item_requests),
+                ):
+                    reservation["success"] = True
+                    logger.info(
+                        "inventory_reserved",
+                        offer_id=str(offer_id),
+                        items=len(item_requests),
                     )
+                else:
+                    reservation["error"] = "Failed to reserve inventory"
 
-                    if not success:
-                        reservation["error"] = "Failed to reserve inventory"
-                        # TODO: Rollback previous decrements
-                        yield reservation
-                        return
+        except Exception as e:
+            # Exception during reservation setup (before yield)
+            reservation["error"] = f"Reservation failed: {str(e)}"
+            logger.error(
+                "reservation_error",
+                offer_id=str(offer_id),
+                error=str(e),
+                exc_info=True,
+            )
 
-                reservation["success"] = True
-                logger.info(
-                    "inventory_reserved",
+        # Yield control to caller (purchase flow)
+        try:
+            yield reservation
+        except Exception as e:
+            if reservation["success"]:
+                # Exception occurred in caller code after successful reservation
+                logger.error(
+                    "reservation_context_error",
                     offer_id=str(offer_id),
-                    items=len(item_requests),
+                    error=str(e),
+                    exc_info=True,
                 )
+            raise
 
-                # Yield control to caller (purchase flow)
-                try:
-                    yield reservation
-                except Exception as e:
-                    # Exception occurred in caller code after successful reservation
-                    # Log it but don't re-yield (would cause "generator didn't stop" error)
-                    logger.error(
-                        "reservation_context_error",
-                        offer_id=str(offer_id),
-                        error=str(e),
-                        exc_info=True,
-                    )
-                    raise
+    async def _validate_request(
+        self,
+        offer_id: UUID,
+        item_requests: list[dict],
+        reserved_items: list[dict],
+    ) -> str | None:
+        """
+        Check a request against the current offer.
 
-                # Lock released on context exit
+        Appends an entry to reserved_items for each valid item request.
 
-            except Exception as e:
-                # Exception during reservation setup (before yield)
-                if not reservation["success"]:
-                    reservation["error"] = f"Reservation failed: {str(e)}"
-                    logger.error(
-                        "reservation_error",
-                        offer_id=str(offer_id),
-                        error=str(e),
-                        exc_info=True,
-                    )
-                    yield reservation
-                else:
-                    # Exception after successful reservation, already logged above
-                    raise
+        Returns:
+            Error message, or None if every item can be reserved
+        """
+        # Get current offer state
+        offer = await self.offer_repo.get_by_id(offer_id)
+
+        if not offer:
+            return "Offer not found"
+
+        # Check offer is still active
+        if offer.is_expired:
+            return "Offer has expired"
+
+        # Validate item requests against available inventory
+        items_by_name = {item.name: item for item in offer.items}
+        for item_req in item_requests:
+            item_name = item_req["item_name"]
+            requested_qty = item_req["quantity"]
+
+            # Find item in offer
+            offer_item = items_by_name.get(item_name)
+
+            if not offer_item:
+                return f"Item '{item_name}' not found in offer"
+
+            if offer_item.quantity < requested_qty:
+                return (
+                    f"Insufficient quantity for '{item_name}'. "
+                    f"Available: {offer_item.quantity}, "
+                    f"Requested: {requested_qty}"
+                )
+
+            reserved_items.append(
+                {
+                    "name": item_name,
+                    "quantity": requested_qty,
+                    "unit_price": offer_item.discounted_price,
+                }
+            )
+
+        return None
 
     async def release_reservation(
         self,
@@ -20,6 +20,10 @@ logger = get_logger(__name__)
 MIN_OFFER_DURATION_HOURS = 1
 MAX_OFFER_DURATION_DAYS = 7
 MAX_ITEMS_PER_OFFER = 20
+MAX_ITEM_ERRORS = 3
+
+_MIN_DURATION = timedelta(hours=MIN_OFFER_DURATION_HOURS)
+_MAX_DURATION = timedelta(days=MAX_OFFER_DURATION_DAYS)
 
 
 class ValidationResult:
@@ -80,31 +84,35 @@ class OfferValidator:
 
         duration = offer.end_time - offer.start_time
 
-        if duration < timedelta(hours=MIN_OFFER_DURATION_HOURS):
+        if duration < _MIN_DURATION:
             result.add_error(
                 f"Offer duration must be at least {MIN_OFFER_DURATION_HOURS} hour(s)"
             )
 
-        if duration > timedelta(days=MAX_OFFER_DURATION_DAYS):
+        if duration > _MAX_DURATION:
             result.add_error(
                 f"Offer duration cannot exceed {MAX_OFFER_DURATION_DAYS} days"
             )
 
-        # Validate items
+        # Validate items; per-item checks are skipped when the list itself is
+        # rejected and stop after MAX_ITEM_ERRORS findings
         if not offer.items:
             result.add_error("Offer must have at least one item")
-
-        if len(offer.items) > MAX_ITEMS_PER_OFFER:
+        elif len(offer.items) > MAX_ITEMS_PER_OFFER:
             result.add_error(
                 f"Offer cannot have more than {MAX_ITEMS_PER_OFFER} items"
             )
+        else:
+            errors_before_items = len(result.errors)
+            for item in offer.items:
+                if item.quantity_available <= 0:
+                    result.add_error(f"Item '{item.name}' must have positive quantity")
 
-        for item in offer.items:
-            if item.quantity_available <= 0:
-                result.add_error(f"Item '{item.name}' must have positive quantity")
+                if item.unit_price <= 0:
+                    result.add_error(f"Item '{item.name}' must have positive price")
 
-            if item.unit_price <= 0:
-                result.add_error(f"Item '{item.name}' must have positive price")
+                if len(result.errors) - errors_before_items >= MAX_ITEM_ERRORS:
+                    break
 
         # Validate total inventory
         total_quantity = offer.remaining_quantity
@@ -178,12 +186,12 @@ class OfferValidator:
 
         duration = new_end - new_start
 
-        if duration < timedelta(hours=MIN_OFFER_DURATION_HOURS):
+        if duration < _MIN_DURATION:
             result.add_error(
                 f"Offer duration must be at least {MIN_OFFER_DURATION_HOURS} hour(s)"
             )
 
-        if duration > timedelta(days=MAX_OFFER_DURATION_DAYS):
+        if duration > _MAX_DURATION:
             result.add_error(
                 f"Offer duration cannot exceed {MAX_OFFER_DURATION_DAYS} days"
             )
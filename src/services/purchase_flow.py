@@ -99,7 +99,7 @@ class PurchaseFlowService:
 
             # Reserve inventory with distributed lock
             async with self.inventory_reservation.reserve_items(
-                offer_id, purchase_request.items
+                offer_id, [item.model_dump() for item in purchase_request.items]
             ) as reservation:
                 if not reservation["success"]:
                     return PurchaseResult(
@@ -108,20 +108,18 @@ class PurchaseFlowService:
                     )
 
                 # Calculate total from reserved items
-                total_amount = Decimal("0")
-                purchase_items = []
-
-                for item_info in reservation["items"]:
-                    item_total = item_info["unit_price"] * item_info["quantity"]
-                    total_amount += item_total
-
-                    purchase_items.append(
-                        PurchaseItem(
-                            name=item_info["name"],
-                            quantity=item_info["quantity"],
-                            unit_price=item_info["unit_price"],
-                        )
+                purchase_items = [
+                    PurchaseItem(
+                        name=item_info["name"],
+                        quantity=item_info["quantity"],
+                        unit_price=item_info["unit_price"],
                     )
+                    for item_info in reservation["items"]
+                ]
+                total_amount = sum(
+                    (item.unit_price * item.quantity for item in purchase_items),
+                    Decimal("0"),
+                )
 
                 # Create purchase record
                 purchase = Purchase(
@@ -1,13 +1,11 @@
 """Reservation flow service with atomic inventory management."""
 
-from decimal import Decimal
+from datetime import datetime
 from uuid import UUID
 
 from src.logging import get_logger
-from src.models.reservation import ReservationInput
 from src.storage.postgres_offer_repo import PostgresOfferRepository
 from src.storage.postgres_reservation_repo import PostgresReservationRepository
-from src.storage.redis_locks import RedisLockHelper
 
 logger = get_logger(__name__)
 
@@ -19,12 +17,10 @@ class ReservationFlowService:
         self,
         offer_repo: PostgresOfferRepository,
         reservation_repo: PostgresReservationRepository,
-        redis_locks: RedisLockHelper,
     ):
         """Initialize reservation flow service."""
         self.offer_repo = offer_repo
         self.reservation_repo = reservation_repo
-        self.redis_locks = redis_locks
 
     async def create_reservation(
         self,
@@ -37,73 +33,43 @@ class ReservationFlowService:
         
         Returns: (success, message, order_id)
         """
-        # Acquire lock on offer
-        async with self.redis_locks.acquire_offer_lock(offer_id) as acquired:
-            if not acquired:
-                logger.warning("lock_acquisition_failed", offer_id=str(offer_id))
-                return False, "Offer is currently locked. Please try again.", None
+        # No offer lock is needed: create_with_decrement checks and takes stock
+        # in the same statement that inserts the reservation, so concurrent
+        # buyers cannot oversell and a failed insert leaves stock untouched
 
-            # Get offer details
-            offer = await self.offer_repo.get_by_id(offer_id)
-            if not offer:
-                return False, "Offer not found", None
-            
-            # Check if offer has expired (T069 - expiration validation)
-            if offer.is_expired:
-                from src.handlers import ERROR_TEMPLATES
-                error_msg = ERROR_TEMPLATES["offer_expired"](
-                    offer.pickup_end_time.strftime("%H:%M")
-                )
-                return False, error_msg, None
-
-            # Validate offer is available
-            if not offer.available_for_reservation:
-                return False, "Offer is no longer available", None
-
-            # Validate quantity
-            if quantity > offer.quantity_remaining:
-                return (
-                    False,
-                    f"Only {offer.quantity_remaining} units available",
-                    None,
-                )
+        # Get offer details
+        offer = await self.offer_repo.get_by_id(offer_id)
+        if not offer:
+            return False, "Offer not found", None
+        
+        # Check if offer has expired (T069 - expiration validation)
+        now = datetime.utcnow()
+        if offer.is_expired_at(now):
+            from src.handlers import ERROR_TEMPLATES
+            error_msg = ERROR_TEMPLATES["offer_expired"](
+                offer.pickup_end_time.strftime("%H:%M")
+            )
+            return False, error_msg, None
 
-            # Decrement inventory
-            success = await self.offer_repo.decrement_quantity(offer_id, quantity)
-            if not success:
-                logger.error("inventory_decrement_failed", offer_id=str(offer_id))
-                return False, "Failed to reserve units. Please try again.", None
+        # Validate offer is available
+        if not offer.is_available_at(now):
+            return False, "Offer is no longer available", None
 
-            # Create reservation
-            total_price = Decimal(str(quantity)) * offer.price_per_unit
-            reservation_input = ReservationInput(
-                offer_id=offer_id,
-                customer_id=customer_id,
-                quantity=quantity,
-                unit_price=offer.price_per_unit,
-                total_price=total_price,
-                currency=offer.currency,
-                pickup_start_time=offer.pickup_start_time,
-                pickup_end_time=offer.pickup_end_time,
+        # Validate quantity
+        if quantity > offer.quantity_remaining:
+            return (
+                False,
+                f"Only {offer.quantity_remaining} units available",
+                None,
             )
 
-            try:
-                reservation = await self.reservation_repo.create(reservation_input)
-                logger.info(
-                    "reservation_created",
-                    reservation_id=str(reservation.id),
-                    order_id=reservation.order_id,
-                    customer_id=customer_id,
-                    offer_id=str(offer_id),
-                    quantity=quantity,
-                )
-                return True, "Reservation confirmed!", reservation.order_id
-            except Exception as e:
-                logger.error(
-                    "reservation_creation_failed",
-                    offer_id=str(offer_id),
-                    error=str(e),
-                )
-                # Rollback inventory decrement
-                await self.offer_repo.increment_quantity(offer_id, quantity)
-                return False, "Failed to create reservation. Please try again.", None
+        # Take stock and record the reservation in one round-trip
+        created = await self.reservation_repo.create_with_decrement(
+            offer_id, customer_id, quantity
+        )
+        if created is None:
+            logger.error("inventory_decrement_failed", offer_id=offer_id)
+            return False, "Failed to reserve units. Please try again.", None
+
+        order_id, _, _ = created
+        return True, "Reservation confirmed!", order_id
@@ -4,48 +4,79 @@ import asyncio
 from datetime import datetime
 
 from src.logging import get_logger
-from src.models.offer import OfferStatus
 from src.storage.postgres_offer_repo import PostgresOfferRepository
 
 logger = get_logger(__name__)
 
+# Lower bound on the sleep so clock skew around an expiry cannot spin the loop
+MIN_SLEEP_SECONDS = 1.0
+
 
 class SchedulerService:
     """Background task scheduler for offer lifecycle."""
 
     def __init__(self, offer_repo: PostgresOfferRepository, interval_seconds: int = 60):
-        """Initialize scheduler service."""
+        """Initialize scheduler service.
+
+        interval_seconds is the longest the loop sleeps; it wakes earlier when
+        an active offer is due to expire sooner. After a failed pass it retries
+        with exponential backoff from MIN_SLEEP_SECONDS, capped at the interval.
+        """
         self.offer_repo = offer_repo
         self.interval_seconds = interval_seconds
         self._running = False
+        self._wake = asyncio.Event()
 
     async def start(self) -> None:
         """Start scheduler loop."""
         self._running = True
         logger.info("Scheduler started", interval_seconds=self.interval_seconds)
 
+        backoff = MIN_SLEEP_SECONDS
         while self._running:
             try:
                 await self.expire_offers()
-                await asyncio.sleep(self.interval_seconds)
-            except Exception as e:
-                logger.error("Scheduler error", error=str(e))
-                await asyncio.sleep(self.interval_seconds)
+                delay = await self._seconds_until_next_expiry()
+                backoff = MIN_SLEEP_SECONDS
+            except Exception:
+                delay = backoff
+                backoff = min(backoff * 2, self.interval_seconds)
+                logger.exception("Scheduler error", retry_in_seconds=delay)
+            await self._sleep(delay)
 
     async def stop(self) -> None:
         """Stop scheduler loop."""
         self._running = False
+        self._wake.set()
         logger.info("Scheduler stopped")
 
-    async def expire_offers(self) -> None:
-        """Mark expired offers as EXPIRED."""
+    def wake(self) -> None:
+        """Re-check expirations now, e.g. after an offer's end time changed."""
+        self._wake.set()
+
+    async def _seconds_until_next_expiry(self) -> float:
+        next_expiry = await self.offer_repo.next_expiry()
+        if next_expiry is None:
+            return self.interval_seconds
+        remaining = (next_expiry - datetime.utcnow()).total_seconds()
+        return min(max(remaining, MIN_SLEEP_SECONDS), self.interval_seconds)
+
+    async def _sleep(self, seconds: float) -> None:
+        """Sleep for up to seconds, returning early if woken."""
         try:
-            expired = await self.offer_repo.get_expired_offers()
-            for offer in expired:
-                await self.offer_repo.update_status(offer.id, OfferStatus.EXPIRED)
-                logger.info("Offer expired", offer_id=str(offer.id), title=offer.title)
-
-            if expired:
-                logger.info("Expired offers processed", count=len(expired))
-        except Exception as e:
-            logger.error("Failed to expire offers", error=str(e))
+            await asyncio.wait_for(self._wake.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+        self._wake.clear()
+
+    async def expire_offers(self) -> None:
+        """Mark expired offers as EXPIRED.
+
+        Errors propagate so the loop in start() can back off and retry.
+        """
+        expired = await self.offer_repo.bulk_expire_due()
+        for offer in expired:
+            logger.info("Offer expired", offer_id=str(offer.id), title=offer.title)
+
+        if expired:
+            logger.info("Expired offers processed", count=len(expired))
@@ -1,7 +1,7 @@
 """Sold-out transition service.
 
-Automatically transitions offers to SOLD_OUT status when
-all item inventory is depleted.
+Automatically transitions offers to SOLD_OUT state when
+their remaining quantity is depleted.
 """
 
 from uuid import UUID
@@ -21,7 +21,7 @@ class SoldOutTransitionService:
         Initialize sold-out transition service.
 
         Args:
-            offer_repo: Offer repository for status updates
+            offer_repo: Offer repository for state updates
         """
         self.offer_repo = offer_repo
 
@@ -45,55 +45,50 @@ class SoldOutTransitionService:
             if not offer:
                 logger.warning(
                     "sold_out_check_offer_not_found",
-                    offer_id=str(offer_id),
+                    offer_id=offer_id,
                 )
                 return False
 
             # Skip if offer is not active or paused
-            if offer.status not in [OfferStatus.ACTIVE, OfferStatus.PAUSED]:
+            if offer.state not in (OfferStatus.ACTIVE, OfferStatus.PAUSED):
                 logger.debug(
                     "sold_out_check_skipped",
-                    offer_id=str(offer_id),
-                    status=offer.status.value,
-                    reason="Offer not in active or paused status",
+                    offer_id=offer_id,
+                    state=offer.state.value,
+                    reason="Offer not in active or paused state",
                 )
                 return False
 
-            # Check if all items are depleted
-            total_remaining = sum(item.quantity for item in offer.items)
+            # Remaining stock is kept on the offer row itself
+            total_remaining = offer.quantity_remaining
 
             if total_remaining > 0:
                 logger.debug(
                     "sold_out_check_items_available",
-                    offer_id=str(offer_id),
+                    offer_id=offer_id,
                     remaining=total_remaining,
                 )
                 return False
 
             # Transition to sold out
-            await self.offer_repo.update_status(offer_id, OfferStatus.SOLD_OUT)
+            await self.offer_repo.update_state(offer_id, OfferStatus.SOLD_OUT)
 
             logger.info(
                 "offer_sold_out",
-                offer_id=str(offer_id),
+                offer_id=offer_id,
                 offer_title=offer.title,
-                previous_status=offer.status.value,
+                previous_state=offer.state.value,
             )
 
             return True
 
-        except Exception as e:
-            logger.error(
-                "sold_out_transition_failed",
-                offer_id=str(offer_id),
-                error=str(e),
-                exc_info=True,
-            )
+        except Exception:
+            logger.exception("sold_out_transition_failed", offer_id=offer_id)
             return False
 
     async def force_sold_out(self, offer_id: UUID) -> bool:
         """
-        Force an offer to sold-out status (manual business action).
+        Force an offer to sold-out state (manual business action).
 
         Allows business owners to manually mark offers as sold out
         even if inventory remains.
@@ -110,45 +105,40 @@ class SoldOutTransitionService:
             if not offer:
                 logger.warning(
                     "force_sold_out_offer_not_found",
-                    offer_id=str(offer_id),
+                    offer_id=offer_id,
                 )
                 return False
 
-            # Check current status allows transition
-            if offer.status == OfferStatus.SOLD_OUT:
+            # Check current state allows transition
+            if offer.state == OfferStatus.SOLD_OUT:
                 logger.debug(
                     "force_sold_out_already_sold_out",
-                    offer_id=str(offer_id),
+                    offer_id=offer_id,
                 )
                 return True
 
-            if offer.status in [OfferStatus.EXPIRED, OfferStatus.DRAFT]:
+            if offer.state in (OfferStatus.EXPIRED, OfferStatus.EXPIRED_EARLY):
                 logger.warning(
-                    "force_sold_out_invalid_status",
-                    offer_id=str(offer_id),
-                    status=offer.status.value,
+                    "force_sold_out_invalid_state",
+                    offer_id=offer_id,
+                    state=offer.state.value,
                 )
                 return False
 
-            # Update status
-            await self.offer_repo.update_status(offer_id, OfferStatus.SOLD_OUT)
+            # Update state
+            await self.offer_repo.update_state(offer_id, OfferStatus.SOLD_OUT)
 
             logger.info(
                 "offer_force_sold_out",
-                offer_id=str(offer_id),
+                offer_id=offer_id,
                 offer_title=offer.title,
-                previous_status=offer.status.value,
+                previous_state=offer.state.value,
             )
 
             return True
 
-        except Exception as e:
-            logger.error(
-                "force_sold_out_failed",
-                offer_id=str(offer_id),
-                error=str(e),
-                exc_info=True,
-            )
+        except Exception:
+            logger.exception("force_sold_out_failed", offer_id=offer_id)
             return False
 
     async def can_transition_to_sold_out(self, offer_id: UUID) -> tuple[bool, str]:
@@ -167,18 +157,15 @@ class SoldOutTransitionService:
             if not offer:
                 return False, "Offer not found"
 
-            # Check status
-            if offer.status == OfferStatus.SOLD_OUT:
+            # Check state
+            if offer.state == OfferStatus.SOLD_OUT:
                 return False, "Offer is already sold out"
 
-            if offer.status == OfferStatus.EXPIRED:
+            if offer.state in (OfferStatus.EXPIRED, OfferStatus.EXPIRED_EARLY):
                 return False, "Offer has expired"
 
-            if offer.status == OfferStatus.DRAFT:
-                return False, "Offer is still in draft"
-
             # Check inventory
-            total_remaining = sum(item.quantity for item in offer.items)
+            total_remaining = offer.quantity_remaining
 
             if total_remaining == 0:
                 return True, "All items depleted"
@@ -186,10 +173,5 @@ class SoldOutTransitionService:
             return True, "Can be manually marked as sold out"
 
         except Exception as e:
-            logger.error(
-                "can_transition_check_failed",
-                offer_id=str(offer_id),
-                error=str(e),
-                exc_info=True,
-            )
-            return False, f"Check failed: {str(e)}"
+            logger.exception("can_transition_check_failed", offer_id=offer_id)
+            return False, f"Check failed: {e}"
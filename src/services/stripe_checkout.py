@@ -1,12 +1,15 @@
 """Stripe checkout session service."""
 
 from datetime import datetime, timedelta
-from decimal import Decimal
+from decimal import ROUND_HALF_UP, Decimal
 from typing import Any
 from uuid import UUID
 
 import stripe
 
+# Stripe checkout sessions expire after 24 hours
+_CHECKOUT_TTL = timedelta(hours=24)
+
 
 class StripeCheckoutService:
     """Service for creating Stripe checkout sessions."""
@@ -25,11 +28,15 @@ class StripeCheckoutService:
         currency: str = "usd",
     ) -> tuple[str, datetime]:
         """Create Stripe checkout session and return URL + expiration."""
-        # Convert amount to cents
-        amount_cents = int(total_amount * 100)
+        # Convert amount to cents; a float would carry binary rounding error
+        # into the charged amount, so only Decimal is accepted
+        if not isinstance(total_amount, Decimal):
+            raise TypeError(f"total_amount must be Decimal, got {type(total_amount).__name__}")
+        amount_cents = int((total_amount * 100).to_integral_value(rounding=ROUND_HALF_UP))
 
-        # Create checkout session
-        session = stripe.checkout.Session.create(
+        # Create checkout session; the async variant keeps the HTTPS round trip
+        # off the event loop
+        session = await stripe.checkout.Session.create_async(
             payment_method_types=["card"],
             line_items=[
                 {
@@ -51,14 +58,13 @@ class StripeCheckoutService:
             },
         )
 
-        # Checkout sessions expire after 24 hours
-        expires_at = datetime.utcnow() + timedelta(hours=24)
+        expires_at = datetime.utcnow() + _CHECKOUT_TTL
 
         return session.url, expires_at  # type: ignore
 
     async def verify_payment(self, session_id: str) -> dict[str, Any]:
         """Verify payment completion and retrieve session details."""
-        session = stripe.checkout.Session.retrieve(session_id)
+        session = await stripe.checkout.Session.retrieve_async(session_id)
         return {
             "purchase_id": session.metadata.get("purchase_id"),
             "payment_status": session.payment_status,
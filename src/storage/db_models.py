@@ -21,6 +21,7 @@ from sqlalchemy import (
     Numeric,
     String,
     Text,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import DeclarativeBase, relationship
@@ -43,12 +44,11 @@ class UserTable(Base):
     __tablename__ = "users"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    telegram_user_id = Column(BigInteger, nullable=False, unique=True, index=True)
+    telegram_user_id = Column(BigInteger, nullable=False)
     telegram_username = Column(String(100), nullable=True)
     role = Column(
         Enum(UserRole, native_enum=True),
         nullable=False,
-        index=True,
     )
     language_code = Column(String(2), nullable=False, default="en")
     notification_enabled = Column(Boolean, nullable=False, default=True)
@@ -63,7 +63,7 @@ class UserTable(Base):
     reservations = relationship("ReservationTable", back_populates="customer", foreign_keys="ReservationTable.customer_id")
 
     __table_args__ = (
-        Index("ix_users_telegram_user_id", telegram_user_id),
+        Index("ix_users_telegram_user_id", telegram_user_id, unique=True),
         Index("ix_users_role", role),
     )
 
@@ -74,8 +74,8 @@ class BusinessTable(Base):
     __tablename__ = "businesses"
 
     id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid4)
-    owner_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
-    business_name = Column(String(200), nullable=False, index=True)
+    owner_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    business_name = Column(String(200), nullable=False)
     street_address = Column(String(200), nullable=False)
     city = Column(String(100), nullable=False)
     postal_code = Column(String(20), nullable=False)
@@ -88,7 +88,6 @@ class BusinessTable(Base):
         Enum(VerificationStatus, native_enum=True),
         nullable=False,
         default=VerificationStatus.PENDING,
-        index=True,
     )
     verification_notes = Column(Text, nullable=True)
     verified_at = Column(DateTime, nullable=True)
@@ -114,7 +113,7 @@ class OfferTable(Base):
     __tablename__ = "offers"
 
     id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid4)
-    business_id = Column(PG_UUID(as_uuid=True), ForeignKey("businesses.id", ondelete="CASCADE"), nullable=False, index=True)
+    business_id = Column(PG_UUID(as_uuid=True), ForeignKey("businesses.id", ondelete="CASCADE"), nullable=False)
     title = Column(String(100), nullable=False)
     description = Column(Text, nullable=False)
     photo_url = Column(String(500), nullable=True)
@@ -129,7 +128,6 @@ class OfferTable(Base):
         Enum(OfferStatus, native_enum=True),
         nullable=False,
         default=OfferStatus.ACTIVE,
-        index=True,
     )
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
     published_at = Column(DateTime, nullable=True)
@@ -145,8 +143,18 @@ class OfferTable(Base):
         CheckConstraint("quantity_total > 0", name="check_positive_total_quantity"),
         CheckConstraint("quantity_remaining >= 0", name="check_nonnegative_remaining"),
         CheckConstraint("quantity_remaining <= quantity_total", name="check_remaining_le_total"),
-        Index("ix_offers_state_pickup_end", state, pickup_end_time),
-        Index("ix_offers_state_created", state, created_at.desc()),
+        # Expiry sweeps and listings only ever look at ACTIVE offers
+        Index(
+            "ix_offers_active_pickup_end",
+            pickup_end_time,
+            postgresql_where=text("state = 'ACTIVE'"),
+        ),
+        Index(
+            "ix_offers_active_created",
+            created_at.desc(),
+            postgresql_where=text("state = 'ACTIVE'"),
+        ),
+        # Also serves business_id-only lookups as its left prefix
         Index("ix_offers_business_state", business_id, state),
         Index("ix_offers_category", category),
     )
@@ -158,9 +166,16 @@ class ReservationTable(Base):
     __tablename__ = "reservations"
 
     id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid4)
-    order_id = Column(String(12), nullable=False, unique=True, index=True)
-    offer_id = Column(PG_UUID(as_uuid=True), ForeignKey("offers.id", ondelete="CASCADE"), nullable=False, index=True)
-    customer_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    # "RES-" plus 8 random hex characters, generated by the database on insert
+    order_id = Column(
+        String(12),
+        nullable=False,
+        server_default=text(
+            "'RES-' || upper(left(replace(gen_random_uuid()::text, '-', ''), 8))"
+        ),
+    )
+    offer_id = Column(PG_UUID(as_uuid=True), ForeignKey("offers.id", ondelete="CASCADE"), nullable=False)
+    customer_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     quantity = Column(Integer, nullable=False)
     unit_price = Column(Numeric(10, 2), nullable=False)
     total_price = Column(Numeric(10, 2), nullable=False)
@@ -169,7 +184,6 @@ class ReservationTable(Base):
         Enum(ReservationStatus, native_enum=True),
         nullable=False,
         default=ReservationStatus.CONFIRMED,
-        index=True,
     )
     pickup_start_time = Column(DateTime, nullable=False)
     pickup_end_time = Column(DateTime, nullable=False)
@@ -187,8 +201,8 @@ class ReservationTable(Base):
         CheckConstraint("unit_price > 0", name="check_positive_unit_price"),
         CheckConstraint("total_price > 0", name="check_positive_total_price"),
         Index("ix_reservations_offer_id", offer_id),
-        Index("ix_reservations_customer_id", customer_id),
         Index("ix_reservations_order_id", order_id, unique=True),
+        # Also serves customer_id-only lookups as its left prefix
         Index("ix_reservations_customer_created", customer_id, created_at.desc()),
         Index("ix_reservations_status", status),
     )
@@ -1,5 +1,6 @@
 """Image storage abstraction for business pictures."""
 
+import asyncio
 from pathlib import Path
 from typing import Protocol
 from uuid import UUID, uuid4
@@ -12,6 +13,10 @@ class ImageStoreProtocol(Protocol):
         """Upload image and return public URL."""
         ...
 
+    async def save(self, filename: str, image_data: bytes) -> str:
+        """Store image under filename and return public URL."""
+        ...
+
     async def delete(self, image_url: str) -> bool:
         """Delete image by URL."""
         ...
@@ -30,11 +35,14 @@ class LocalImageStore:
         """Save image locally and return relative URL."""
         # Generate unique filename
         ext = content_type.split("/")[-1] if "/" in content_type else "jpg"
-        filename = f"{uuid4()}.{ext}"
+        return await self.save(f"{uuid4()}.{ext}", image_data)
+
+    async def save(self, filename: str, image_data: bytes) -> str:
+        """Save image locally under filename and return relative URL."""
         filepath = self.base_path / filename
 
-        # Write file
-        filepath.write_bytes(image_data)
+        # Write file off the event loop
+        await asyncio.to_thread(filepath.write_bytes, image_data)
 
         return f"{self.base_url}/{filename}"
 
@@ -43,14 +51,21 @@ class LocalImageStore:
         try:
             filename = image_url.split("/")[-1]
             filepath = self.base_path / filename
-            if filepath.exists():
-                filepath.unlink()
-                return True
+            return await asyncio.to_thread(_unlink_if_exists, filepath)
         except Exception:
             pass
         return False
 
 
+def _unlink_if_exists(filepath: Path) -> bool:
+    """Remove filepath, reporting whether it existed."""
+    try:
+        filepath.unlink()
+    except FileNotFoundError:
+        return False
+    return True
+
+
 class S3ImageStore:
     """S3-compatible object storage (future implementation)."""
 
@@ -65,6 +80,10 @@ class S3ImageStore:
         """Upload to S3 and return public URL."""
         raise NotImplementedError("S3 storage not yet implemented")
 
+    async def save(self, filename: str, image_data: bytes) -> str:
+        """Store in S3 under filename and return public URL."""
+        raise NotImplementedError("S3 storage not yet implemented")
+
     async def delete(self, image_url: str) -> bool:
         """Delete from S3."""
         raise NotImplementedError("S3 storage not yet implemented")
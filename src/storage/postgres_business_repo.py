@@ -4,11 +4,11 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import delete, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.logging import get_logger
-from src.models.business import Business, BusinessInput, VerificationStatus, Venue
+from src.models.business import Business, BusinessInput, VerificationStatus
 from src.storage.db_models import BusinessTable
 from src.storage.repository_base import RepositoryBase
 
@@ -33,17 +33,33 @@ class PostgresBusinessRepository(RepositoryBase[Business]):
 
         return self._to_domain_model(db_business)
 
+    async def get_by_ids(self, ids: list[UUID]) -> dict[UUID, Business]:
+        """Retrieve several businesses in one query, keyed by ID.
+
+        IDs with no matching business are absent from the result.
+        """
+        if not ids:
+            return {}
+
+        stmt = select(BusinessTable).where(BusinessTable.id.in_(set(ids)))
+        result = await self.session.execute(stmt)
+
+        return {
+            db_business.id: self._to_domain_model(db_business)
+            for db_business in result.scalars()
+        }
+
     async def create(self, entity: BusinessInput) -> Business:
         """Create new business."""
         db_business = BusinessTable(
             owner_id=entity.owner_id,
             business_name=entity.business_name,
-            street_address=entity.street_address,
-            city=entity.city,
-            postal_code=entity.postal_code,
-            country_code=entity.country_code,
-            latitude=entity.latitude,
-            longitude=entity.longitude,
+            street_address=entity.venue.street_address,
+            city=entity.venue.city,
+            postal_code=entity.venue.postal_code,
+            country_code=entity.venue.country_code,
+            latitude=entity.venue.latitude,
+            longitude=entity.venue.longitude,
             contact_phone=entity.phone,
             logo_url=entity.logo_url,
         )
@@ -93,17 +109,14 @@ class PostgresBusinessRepository(RepositoryBase[Business]):
 
     async def delete(self, id: UUID) -> bool:
         """Delete business by ID."""
-        stmt = select(BusinessTable).where(BusinessTable.id == id)
+        stmt = delete(BusinessTable).where(BusinessTable.id == id).returning(BusinessTable.id)
         result = await self.session.execute(stmt)
-        db_business = result.scalar_one_or_none()
+        deleted = result.scalar_one_or_none()
+        await self.session.commit()
 
-        if not db_business:
+        if deleted is None:
             return False
 
-        await self.session.delete(db_business)
-        await self.session.flush()
-        await self.session.commit()
-
         logger.info("business_deleted", business_id=str(id))
 
         return True
@@ -135,19 +148,23 @@ class PostgresBusinessRepository(RepositoryBase[Business]):
         return [self._to_domain_model(db_business) for db_business in db_businesses]
 
     async def approve_business(self, id: UUID, approved_by: int) -> Business:
-        """Approve pending business."""
-        stmt = select(BusinessTable).where(BusinessTable.id == id)
+        """Approve pending business in a single UPDATE ... RETURNING."""
+        stmt = (
+            update(BusinessTable)
+            .where(BusinessTable.id == id)
+            .values(
+                verification_status=VerificationStatus.APPROVED,
+                verified_at=datetime.utcnow(),
+                verified_by=approved_by,
+            )
+            .returning(BusinessTable)
+        )
         result = await self.session.execute(stmt)
         db_business = result.scalar_one_or_none()
 
         if not db_business:
             raise ValueError(f"Business not found: {id}")
 
-        db_business.verification_status = VerificationStatus.APPROVED
-        db_business.verified_at = datetime.utcnow()
-        db_business.verified_by = approved_by
-
-        await self.session.flush()
         await self.session.commit()
 
         logger.info("business_approved", business_id=str(id), approved_by=approved_by)
@@ -156,26 +173,26 @@ class PostgresBusinessRepository(RepositoryBase[Business]):
 
     def _to_domain_model(self, db_business: BusinessTable) -> Business:
         """Convert database model to domain model."""
-        venue = Venue(
-            street_address=db_business.street_address,
-            city=db_business.city,
-            postal_code=db_business.postal_code,
-            country_code=db_business.country_code,
-            latitude=float(db_business.latitude) if db_business.latitude else None,
-            longitude=float(db_business.longitude) if db_business.longitude else None,
-        )
-
-        return Business(
-            id=db_business.id,
-            owner_id=db_business.owner_id,
-            business_name=db_business.business_name,
-            venue=venue,
-            contact_phone=db_business.contact_phone,
-            logo_url=db_business.logo_url,
-            verification_status=db_business.verification_status,
-            verification_notes=db_business.verification_notes,
-            verified_at=db_business.verified_at,
-            verified_by=db_business.verified_by,
-            created_at=db_business.created_at,
-            updated_at=db_business.updated_at,
-        )
+        venue = {
+            "street_address": db_business.street_address,
+            "city": db_business.city,
+            "postal_code": db_business.postal_code,
+            "country_code": db_business.country_code,
+            "latitude": float(db_business.latitude) if db_business.latitude else None,
+            "longitude": float(db_business.longitude) if db_business.longitude else None,
+        }
+
+        return Business.from_row({
+            "id": db_business.id,
+            "owner_id": db_business.owner_id,
+            "business_name": db_business.business_name,
+            "venue": venue,
+            "contact_phone": db_business.contact_phone,
+            "logo_url": db_business.logo_url,
+            "verification_status": db_business.verification_status,
+            "verification_notes": db_business.verification_notes,
+            "verified_at": db_business.verified_at,
+            "verified_by": db_business.verified_by,
+            "created_at": db_business.created_at,
+            "updated_at": db_business.updated_at,
+        })
@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import select, update
+from sqlalchemy import Row, Update, case, delete, func, literal, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.logging import get_logger
@@ -15,6 +15,34 @@ from src.storage.repository_base import RepositoryBase
 logger = get_logger(__name__)
 
 
+def build_decrement_stmt(id: UUID, quantity: int, now: datetime) -> Update:
+    """Build the conditional UPDATE that takes quantity units from an offer.
+
+    The row only matches while the offer is active, unexpired and has enough
+    stock, and the last units flip it to SOLD_OUT in the same statement.
+    """
+    # SET expressions see the pre-update row, so the CASE compares the
+    # old quantity against the amount being taken
+    return (
+        update(OfferTable)
+        .where(OfferTable.id == id)
+        .where(OfferTable.state == OfferStatus.ACTIVE)
+        .where(OfferTable.pickup_end_time > now)
+        .where(OfferTable.quantity_remaining >= quantity)
+        .values(
+            quantity_remaining=OfferTable.quantity_remaining - quantity,
+            state=case(
+                (
+                    OfferTable.quantity_remaining == quantity,
+                    literal(OfferStatus.SOLD_OUT, OfferTable.state.type),
+                ),
+                else_=OfferTable.state,
+            ),
+            updated_at=now,
+        )
+    )
+
+
 class PostgresOfferRepository(RepositoryBase[Offer]):
     """Offer repository using PostgreSQL."""
 
@@ -88,17 +116,14 @@ class PostgresOfferRepository(RepositoryBase[Offer]):
 
     async def delete(self, id: UUID) -> bool:
         """Delete offer by ID."""
-        stmt = select(OfferTable).where(OfferTable.id == id)
+        stmt = delete(OfferTable).where(OfferTable.id == id).returning(OfferTable.id)
         result = await self.session.execute(stmt)
-        db_offer = result.scalar_one_or_none()
+        deleted = result.scalar_one_or_none()
+        await self.session.commit()
 
-        if not db_offer:
+        if deleted is None:
             return False
 
-        await self.session.delete(db_offer)
-        await self.session.flush()
-        await self.session.commit()
-
         logger.info("offer_deleted", offer_id=str(id))
 
         return True
@@ -130,17 +155,52 @@ class PostgresOfferRepository(RepositoryBase[Offer]):
 
         return [self._to_domain_model(db_offer) for db_offer in db_offers]
 
+    async def next_expiry(self) -> Optional[datetime]:
+        """Get the earliest pickup_end_time among active offers."""
+        stmt = select(func.min(OfferTable.pickup_end_time)).where(
+            OfferTable.state == OfferStatus.ACTIVE
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def bulk_expire_due(self) -> list[Row]:
+        """Mark every active offer past pickup_end_time as EXPIRED in one UPDATE.
+
+        Returns rows with id, title, business_id and pickup_end_time only, so
+        callers logging the sweep don't pay for full offer hydration.
+        """
+        stmt = (
+            update(OfferTable)
+            .where(OfferTable.state == OfferStatus.ACTIVE)
+            .where(OfferTable.pickup_end_time <= datetime.utcnow())
+            .values(state=OfferStatus.EXPIRED)
+            .returning(
+                OfferTable.id,
+                OfferTable.title,
+                OfferTable.business_id,
+                OfferTable.pickup_end_time,
+            )
+        )
+        result = await self.session.execute(stmt)
+        expired = list(result.all())
+        await self.session.commit()
+
+        return expired
+
     async def update_state(self, id: UUID, state: OfferStatus) -> Offer:
-        """Update offer state."""
-        stmt = select(OfferTable).where(OfferTable.id == id)
+        """Update offer state in a single UPDATE ... RETURNING."""
+        stmt = (
+            update(OfferTable)
+            .where(OfferTable.id == id)
+            .values(state=state)
+            .returning(OfferTable)
+        )
         result = await self.session.execute(stmt)
         db_offer = result.scalar_one_or_none()
 
         if not db_offer:
             raise ValueError(f"Offer not found: {id}")
 
-        db_offer.state = state
-        await self.session.flush()
         await self.session.commit()
 
         logger.info("offer_state_updated", offer_id=str(id), state=state.value)
@@ -148,67 +208,77 @@ class PostgresOfferRepository(RepositoryBase[Offer]):
         return self._to_domain_model(db_offer)
 
     async def decrement_quantity(self, id: UUID, quantity: int) -> bool:
-        """Atomically decrement quantity_remaining."""
-        stmt = select(OfferTable).where(OfferTable.id == id)
+        """Atomically decrement quantity_remaining.
+
+        The availability check and the decrement are a single conditional
+        UPDATE, so concurrent buyers can never take the count below zero, and
+        an offer paused or expired after the caller read it is not sold.
+        """
+        stmt = build_decrement_stmt(id, quantity, datetime.utcnow()).returning(
+            OfferTable.quantity_remaining
+        )
         result = await self.session.execute(stmt)
-        db_offer = result.scalar_one_or_none()
-
-        if not db_offer:
-            return False
+        remaining = result.scalar_one_or_none()
+        await self.session.commit()
 
-        if db_offer.quantity_remaining < quantity:
+        if remaining is None:
             logger.warning(
                 "insufficient_quantity",
                 offer_id=str(id),
-                available=db_offer.quantity_remaining,
                 requested=quantity,
             )
             return False
 
-        db_offer.quantity_remaining -= quantity
-
         # Auto-transition to SOLD_OUT if quantity reaches 0
-        if db_offer.quantity_remaining == 0:
-            db_offer.state = OfferStatus.SOLD_OUT
+        if remaining == 0:
             logger.info("offer_sold_out", offer_id=str(id))
 
-        await self.session.flush()
-        await self.session.commit()
-
         logger.info(
             "quantity_decremented",
             offer_id=str(id),
             quantity_removed=quantity,
-            remaining=db_offer.quantity_remaining,
+            remaining=remaining,
         )
 
         return True
 
     async def increment_quantity(self, id: UUID, quantity: int) -> bool:
-        """Increment quantity_remaining (for cancellations)."""
-        stmt = select(OfferTable).where(OfferTable.id == id)
+        """Increment quantity_remaining (for cancellations).
+
+        A SOLD_OUT offer whose pickup window is still open goes back to ACTIVE
+        in the same UPDATE.
+        """
+        stmt = (
+            update(OfferTable)
+            .where(OfferTable.id == id)
+            .values(
+                quantity_remaining=OfferTable.quantity_remaining + quantity,
+                state=case(
+                    (
+                        (OfferTable.state == OfferStatus.SOLD_OUT)
+                        & (OfferTable.quantity_remaining + quantity > 0)
+                        & (OfferTable.pickup_end_time > datetime.utcnow()),
+                        literal(OfferStatus.ACTIVE, OfferTable.state.type),
+                    ),
+                    else_=OfferTable.state,
+                ),
+            )
+            .returning(OfferTable.quantity_remaining, OfferTable.state)
+        )
         result = await self.session.execute(stmt)
-        db_offer = result.scalar_one_or_none()
+        row = result.one_or_none()
+        await self.session.commit()
 
-        if not db_offer:
+        if row is None:
             return False
 
-        db_offer.quantity_remaining += quantity
-
-        # If was SOLD_OUT and now has inventory, revert to ACTIVE
-        if db_offer.state == OfferStatus.SOLD_OUT and db_offer.quantity_remaining > 0:
-            if db_offer.pickup_end_time > datetime.utcnow():
-                db_offer.state = OfferStatus.ACTIVE
-                logger.info("offer_reactivated_from_sold_out", offer_id=str(id))
-
-        await self.session.flush()
-        await self.session.commit()
-
+        remaining, state = row
         logger.info(
             "quantity_incremented",
             offer_id=str(id),
             quantity_added=quantity,
-            remaining=db_offer.quantity_remaining,
+            remaining=remaining,
+            state=state.value,
         )
 
         return True
@@ -231,21 +301,21 @@ class PostgresOfferRepository(RepositoryBase[Offer]):
 
     def _to_domain_model(self, db_offer: OfferTable) -> Offer:
         """Convert database model to domain model."""
-        return Offer(
-            id=db_offer.id,
-            business_id=db_offer.business_id,
-            title=db_offer.title,
-            description=db_offer.description,
-            photo_url=db_offer.photo_url,
-            category=db_offer.category,
-            price_per_unit=db_offer.price_per_unit,
-            currency=db_offer.currency,
-            quantity_total=db_offer.quantity_total,
-            quantity_remaining=db_offer.quantity_remaining,
-            pickup_start_time=db_offer.pickup_start_time,
-            pickup_end_time=db_offer.pickup_end_time,
-            state=db_offer.state,
-            created_at=db_offer.created_at,
-            published_at=db_offer.published_at,
-            updated_at=db_offer.updated_at,
-        )
+        return Offer.from_row({
+            "id": db_offer.id,
+            "business_id": db_offer.business_id,
+            "title": db_offer.title,
+            "description": db_offer.description,
+            "photo_url": db_offer.photo_url,
+            "category": db_offer.category,
+            "price_per_unit": db_offer.price_per_unit,
+            "currency": db_offer.currency,
+            "quantity_total": db_offer.quantity_total,
+            "quantity_remaining": db_offer.quantity_remaining,
+            "pickup_start_time": db_offer.pickup_start_time,
+            "pickup_end_time": db_offer.pickup_end_time,
+            "state": db_offer.state,
+            "created_at": db_offer.created_at,
+            "published_at": db_offer.published_at,
+            "updated_at": db_offer.updated_at,
+        })
@@ -1,5 +1,6 @@
 """PostgreSQL repository for Purchase entities."""
 
+from decimal import Decimal
 from typing import Optional
 from uuid import UUID
 
@@ -7,7 +8,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.logging import get_logger
-from src.models.purchase import Purchase, PurchaseInput, PurchaseStatus, PurchaseItem, Customer
+from src.models.purchase import Purchase, PurchaseInput, PurchaseStatus, Customer
 from src.storage.db_models import PurchaseTable, CustomerTable
 from src.storage.repository_base import RepositoryBase
 
@@ -196,23 +197,24 @@ class PostgresPurchaseRepository(RepositoryBase[Purchase]):
 
     def _to_domain_model(self, db_purchase: PurchaseTable) -> Purchase:
         """Convert database model to domain model."""
+        # unit_price is stored as a JSON float
         item_selections = [
-            PurchaseItem(
-                name=item["name"],
-                quantity=item["quantity"],
-                unit_price=item["unit_price"],
-            )
+            {
+                "name": item["name"],
+                "quantity": item["quantity"],
+                "unit_price": Decimal(str(item["unit_price"])),
+            }
             for item in db_purchase.item_selections
         ]
 
-        return Purchase(
-            id=db_purchase.id,
-            offer_id=db_purchase.offer_id,
-            customer_id=db_purchase.customer_id,
-            item_selections=item_selections,
-            total_amount=db_purchase.total_amount,
-            status=db_purchase.status,
-            payment_provider=db_purchase.payment_provider,
-            payment_session_id=db_purchase.payment_session_id,
-            created_at=db_purchase.created_at,
-        )
+        return Purchase.from_row({
+            "id": db_purchase.id,
+            "offer_id": db_purchase.offer_id,
+            "customer_id": db_purchase.customer_id,
+            "item_selections": item_selections,
+            "total_amount": db_purchase.total_amount,
+            "status": db_purchase.status,
+            "payment_provider": db_purchase.payment_provider,
+            "payment_session_id": db_purchase.payment_session_id,
+            "created_at": db_purchase.created_at,
+        })
@@ -1,16 +1,16 @@
 """PostgreSQL repository for Reservation entities."""
 
-import secrets
 from datetime import datetime
 from typing import Optional
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from sqlalchemy import select
+from sqlalchemy import delete, insert, literal, select, true
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.logging import get_logger
 from src.models.reservation import Reservation, ReservationInput, ReservationStatus
-from src.storage.db_models import ReservationTable
+from src.storage.db_models import OfferTable, ReservationTable
+from src.storage.postgres_offer_repo import build_decrement_stmt
 from src.storage.repository_base import RepositoryBase
 
 logger = get_logger(__name__)
@@ -35,16 +35,14 @@ class PostgresReservationRepository(RepositoryBase[Reservation]):
         return self._to_domain_model(db_reservation)
 
     async def create(self, entity: ReservationInput) -> Reservation:
-        """Create new reservation with unique order ID."""
-        order_id = self._generate_order_id()
-
+        """Create new reservation; the database assigns its order ID."""
+        total_price = entity.unit_price * entity.quantity
         db_reservation = ReservationTable(
-            order_id=order_id,
             offer_id=entity.offer_id,
             customer_id=entity.customer_id,
             quantity=entity.quantity,
             unit_price=entity.unit_price,
-            total_price=entity.total_price,
+            total_price=total_price,
             currency=entity.currency,
             status=ReservationStatus.CONFIRMED,
             pickup_start_time=entity.pickup_start_time,
@@ -58,15 +56,107 @@ class PostgresReservationRepository(RepositoryBase[Reservation]):
         logger.info(
             "reservation_created",
             reservation_id=str(db_reservation.id),
-            order_id=order_id,
+            order_id=db_reservation.order_id,
             offer_id=str(entity.offer_id),
             customer_id=entity.customer_id,
             quantity=entity.quantity,
-            total_price=float(entity.total_price),
+            total_price=float(total_price),
         )
 
         return self._to_domain_model(db_reservation)
 
+    async def create_with_decrement(
+        self, offer_id: UUID, customer_id: int, quantity: int
+    ) -> Optional[tuple[str, UUID, int]]:
+        """Take stock from an offer and record the reservation in one statement.
+
+        The offer decrement is a data-modifying CTE feeding the INSERT, so the
+        reservation exists exactly when the stock was taken.
+
+        Returns: (order_id, reservation_id, quantity_remaining), or None when
+        the offer is unavailable or short of stock.
+        """
+        now = datetime.utcnow()
+
+        decremented = (
+            build_decrement_stmt(offer_id, quantity, now)
+            .returning(
+                OfferTable.price_per_unit,
+                OfferTable.currency,
+                OfferTable.pickup_start_time,
+                OfferTable.pickup_end_time,
+                OfferTable.quantity_remaining,
+            )
+            .cte("decremented")
+        )
+        inserted = (
+            insert(ReservationTable)
+            .from_select(
+                [
+                    ReservationTable.id,
+                    ReservationTable.offer_id,
+                    ReservationTable.customer_id,
+                    ReservationTable.quantity,
+                    ReservationTable.unit_price,
+                    ReservationTable.total_price,
+                    ReservationTable.currency,
+                    ReservationTable.status,
+                    ReservationTable.pickup_start_time,
+                    ReservationTable.pickup_end_time,
+                    ReservationTable.created_at,
+                    ReservationTable.updated_at,
+                ],
+                select(
+                    literal(uuid4(), ReservationTable.id.type),
+                    literal(offer_id, ReservationTable.offer_id.type),
+                    literal(customer_id, ReservationTable.customer_id.type),
+                    literal(quantity, ReservationTable.quantity.type),
+                    decremented.c.price_per_unit,
+                    decremented.c.price_per_unit * quantity,
+                    decremented.c.currency,
+                    literal(ReservationStatus.CONFIRMED, ReservationTable.status.type),
+                    decremented.c.pickup_start_time,
+                    decremented.c.pickup_end_time,
+                    literal(now, ReservationTable.created_at.type),
+                    literal(now, ReservationTable.updated_at.type),
+                ),
+                include_defaults=False,
+            )
+            .returning(ReservationTable.order_id, ReservationTable.id)
+            .cte("inserted")
+        )
+        stmt = select(
+            inserted.c.order_id, inserted.c.id, decremented.c.quantity_remaining
+        ).join_from(inserted, decremented, true())
+
+        result = await self.session.execute(stmt)
+        row = result.one_or_none()
+        await self.session.commit()
+
+        if row is None:
+            logger.warning(
+                "insufficient_quantity",
+                offer_id=str(offer_id),
+                requested=quantity,
+            )
+            return None
+
+        order_id, reservation_id, remaining = row
+        if remaining == 0:
+            logger.info("offer_sold_out", offer_id=str(offer_id))
+
+        logger.info(
+            "reservation_created",
+            reservation_id=str(reservation_id),
+            order_id=order_id,
+            offer_id=str(offer_id),
+            customer_id=customer_id,
+            quantity=quantity,
+            remaining=remaining,
+        )
+
+        return order_id, reservation_id, remaining
+
     async def update(self, entity: Reservation) -> Reservation:
         """Update existing reservation."""
         stmt = select(ReservationTable).where(ReservationTable.id == entity.id)
@@ -89,17 +179,14 @@ class PostgresReservationRepository(RepositoryBase[Reservation]):
 
     async def delete(self, id: UUID) -> bool:
         """Delete reservation by ID."""
-        stmt = select(ReservationTable).where(ReservationTable.id == id)
+        stmt = delete(ReservationTable).where(ReservationTable.id == id).returning(ReservationTable.id)
         result = await self.session.execute(stmt)
-        db_reservation = result.scalar_one_or_none()
+        deleted = result.scalar_one_or_none()
+        await self.session.commit()
 
-        if not db_reservation:
+        if deleted is None:
             return False
 
-        await self.session.delete(db_reservation)
-        await self.session.flush()
-        await self.session.commit()
-
         logger.info("reservation_deleted", reservation_id=str(id))
 
         return True
@@ -186,27 +273,22 @@ class PostgresReservationRepository(RepositoryBase[Reservation]):
 
         return self._to_domain_model(db_reservation)
 
-    def _generate_order_id(self) -> str:
-        """Generate unique order ID in format RES-XXXXXXXX."""
-        random_hex = secrets.token_hex(4).upper()
-        return f"RES-{random_hex}"
-
     def _to_domain_model(self, db_reservation: ReservationTable) -> Reservation:
         """Convert database model to domain model."""
-        return Reservation(
-            id=db_reservation.id,
-            order_id=db_reservation.order_id,
-            offer_id=db_reservation.offer_id,
-            customer_id=db_reservation.customer_id,
-            quantity=db_reservation.quantity,
-            unit_price=db_reservation.unit_price,
-            total_price=db_reservation.total_price,
-            currency=db_reservation.currency,
-            status=db_reservation.status,
-            pickup_start_time=db_reservation.pickup_start_time,
-            pickup_end_time=db_reservation.pickup_end_time,
-            cancellation_reason=db_reservation.cancellation_reason,
-            cancelled_at=db_reservation.cancelled_at,
-            created_at=db_reservation.created_at,
-            updated_at=db_reservation.updated_at,
-        )
+        return Reservation.from_row({
+            "id": db_reservation.id,
+            "order_id": db_reservation.order_id,
+            "offer_id": db_reservation.offer_id,
+            "customer_id": db_reservation.customer_id,
+            "quantity": db_reservation.quantity,
+            "unit_price": db_reservation.unit_price,
+            "total_price": db_reservation.total_price,
+            "currency": db_reservation.currency,
+            "status": db_reservation.status,
+            "pickup_start_time": db_reservation.pickup_start_time,
+            "pickup_end_time": db_reservation.pickup_end_time,
+            "cancellation_reason": db_reservation.cancellation_reason,
+            "cancelled_at": db_reservation.cancelled_at,
+            "created_at": db_reservation.created_at,
+            "updated_at": db_reservation.updated_at,
+        })
@@ -2,7 +2,7 @@
 
 from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import delete, not_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.logging import get_logger
@@ -78,17 +78,14 @@ class PostgresUserRepository(RepositoryBase[User]):
 
     async def delete(self, id: int) -> bool:
         """Delete user by ID."""
-        stmt = select(UserTable).where(UserTable.id == id)
+        stmt = delete(UserTable).where(UserTable.id == id).returning(UserTable.id)
         result = await self.session.execute(stmt)
-        db_user = result.scalar_one_or_none()
+        deleted = result.scalar_one_or_none()
+        await self.session.commit()
 
-        if not db_user:
+        if deleted is None:
             return False
 
-        await self.session.delete(db_user)
-        await self.session.flush()
-        await self.session.commit()
-
         logger.info("user_deleted", user_id=id)
 
         return True
@@ -112,6 +109,30 @@ class PostgresUserRepository(RepositoryBase[User]):
 
         return [self._to_domain_model(db_user) for db_user in db_users]
 
+    async def toggle_notifications(self, user_id: int) -> Optional[User]:
+        """Flip a user's notification setting in a single UPDATE ... RETURNING."""
+        stmt = (
+            update(UserTable)
+            .where(UserTable.id == user_id)
+            .values(notification_enabled=not_(UserTable.notification_enabled))
+            .returning(UserTable)
+        )
+        result = await self.session.execute(stmt)
+        db_user = result.scalar_one_or_none()
+
+        if not db_user:
+            return None
+
+        await self.session.commit()
+
+        logger.info(
+            "user_notifications_toggled",
+            user_id=user_id,
+            enabled=db_user.notification_enabled,
+        )
+
+        return self._to_domain_model(db_user)
+
     async def update_location(
         self, user_id: int, latitude: float, longitude: float
     ) -> User:
@@ -138,20 +159,20 @@ class PostgresUserRepository(RepositoryBase[User]):
 
     def _to_domain_model(self, db_user: UserTable) -> User:
         """Convert database model to domain model."""
-        return User(
-            id=db_user.id,
-            telegram_user_id=db_user.telegram_user_id,
-            telegram_username=db_user.telegram_username,
-            role=db_user.role,
-            language_code=db_user.language_code,
-            notification_enabled=db_user.notification_enabled,
-            last_location_lat=float(db_user.last_location_lat)
+        return User.from_row({
+            "id": db_user.id,
+            "telegram_user_id": db_user.telegram_user_id,
+            "telegram_username": db_user.telegram_username,
+            "role": db_user.role,
+            "language_code": db_user.language_code,
+            "notification_enabled": db_user.notification_enabled,
+            "last_location_lat": float(db_user.last_location_lat)
             if db_user.last_location_lat
             else None,
-            last_location_lon=float(db_user.last_location_lon)
+            "last_location_lon": float(db_user.last_location_lon)
             if db_user.last_location_lon
             else None,
-            last_location_updated=db_user.last_location_updated,
-            created_at=db_user.created_at,
-            updated_at=db_user.updated_at,
-        )
+            "last_location_updated": db_user.last_location_updated,
+            "created_at": db_user.created_at,
+            "updated_at": db_user.updated_at,
+        })
@@ -8,7 +8,8 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 import pytest
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
+from sqlalchemy.dialects import postgresql
 
 
 @pytest.fixture
@@ -17,6 +18,23 @@ def mock_db():
     return Mock()
 
 
+@pytest.fixture
+def db_session():
+    """Mock AsyncSession; configure results on db_session.execute.return_value."""
+    session = AsyncMock()
+    session.execute = AsyncMock(return_value=Mock())
+    return session
+
+
+@pytest.fixture
+def executed_sql(db_session):
+    """Return a callable compiling the last statement db_session executed."""
+    def compile_last() -> str:
+        stmt = db_session.execute.await_args.args[0]
+        return str(stmt.compile(dialect=postgresql.dialect()))
+    return compile_last
+
+
 @pytest.fixture
 def mock_redis():
     """Mock Redis connection fixture."""
@@ -182,19 +182,18 @@ async def test_toggle_notifications_changes_setting():
     update = MockUpdate(has_message=False, callback_data=f"toggle_notifications:{user_id}")
     context = MockContext()
     
-    # Mock user with notifications enabled
-    user = MockUser(user_id=user_id, notifications=True)
+    # Mock user with notifications toggled off
     updated_user = MockUser(user_id=user_id, notifications=False)
     
     user_repo_mock = AsyncMock()
-    user_repo_mock.get_by_id = AsyncMock(return_value=user)
-    user_repo_mock.update = AsyncMock(return_value=updated_user)
+    user_repo_mock.toggle_notifications = AsyncMock(return_value=updated_user)
     context.bot_data["user_repo"] = user_repo_mock
     
     await handle_toggle_notifications(update, context)
     
-    # Should update user
-    user_repo_mock.update.assert_called_once()
+    # Should toggle in a single repository call
+    user_repo_mock.toggle_notifications.assert_called_once_with(user_id)
+    user_repo_mock.get_by_id.assert_not_called()
     
     # Should show updated settings
     update.callback_query.edit_message_text.assert_called_once()
@@ -8,7 +8,7 @@ from datetime import datetime, timedelta
 from unittest.mock import Mock, AsyncMock
 from uuid import uuid4
 
-from src.models.reservation import ReservationStatus
+from src.models.reservation import Reservation, ReservationStatus
 
 
 class MockUpdate:
@@ -51,6 +51,8 @@ class MockReservation:
         else:
             self.pickup_end_time = datetime.utcnow() - timedelta(hours=1)
 
+    is_cancellable_at = Reservation.is_cancellable_at
+
 
 class MockOffer:
     """Mock Offer model."""
@@ -200,6 +202,27 @@ async def test_confirm_cancel_returns_inventory():
     assert "returned to inventory" in call_args or "available" in call_args
 
 
+@pytest.mark.asyncio
+async def test_confirm_cancel_rejects_already_cancelled_reservation():
+    """Test confirming twice does not cancel the reservation again."""
+    from src.handlers.purchasing.cancel_reservation_handler import handle_confirm_cancel_reservation
+    
+    reservation = MockReservation(status=ReservationStatus.CANCELLED, pickup_in_future=True)
+    update = MockUpdate(callback_data=f"confirm_cancel_reservation:{reservation.id}")
+    context = MockContext()
+    
+    reservation_repo_mock = AsyncMock()
+    reservation_repo_mock.get_by_id = AsyncMock(return_value=reservation)
+    context.bot_data["reservation_repo"] = reservation_repo_mock
+    context.bot_data["offer_repo"] = AsyncMock()
+    
+    await handle_confirm_cancel_reservation(update, context)
+    
+    reservation_repo_mock.cancel.assert_not_called()
+    call_args = update.callback_query.edit_message_text.call_args[0][0]
+    assert "can no longer be cancelled" in call_args
+
+
 @pytest.mark.asyncio
 async def test_myreservations_shows_cancel_button_when_valid():
     """Test /myreservations shows cancel button only before pickup time."""
@@ -10,7 +10,7 @@ import pytest
 import random
 
 from src.models.offer import OfferInput, OfferStatus
-from src.models.business import BusinessInput
+from src.models.business import BusinessInput, Venue
 from src.models.user import UserInput, UserRole
 from src.storage.postgres_offer_repo import PostgresOfferRepository
 from src.storage.postgres_business_repo import PostgresBusinessRepository
@@ -38,12 +38,14 @@ async def test_offer_lifecycle_management_flow():
             business_input = BusinessInput(
                 business_name="Lifecycle Test Bakery",
                 owner_id=user.id,
-                street_address="123 Lifecycle St",
-                city="Helsinki",
-                postal_code="00100",
-                country_code="FI",
-                latitude=60.1699,
-                longitude=24.9384,
+                venue=Venue(
+                    street_address="123 Lifecycle St",
+                    city="Helsinki",
+                    postal_code="00100",
+                    country_code="FI",
+                    latitude=60.1699,
+                    longitude=24.9384,
+                ),
             )
             business = await business_repo.create(business_input)
             await session.commit()
@@ -142,12 +144,14 @@ async def test_myoffers_listing_with_mixed_states():
             business_input = BusinessInput(
                 business_name="Multi-Offer Bakery",
                 owner_id=user.id,
-                street_address="456 Multi St",
-                city="Helsinki",
-                postal_code="00100",
-                country_code="FI",
-                latitude=60.1699,
-                longitude=24.9384,
+                venue=Venue(
+                    street_address="456 Multi St",
+                    city="Helsinki",
+                    postal_code="00100",
+                    country_code="FI",
+                    latitude=60.1699,
+                    longitude=24.9384,
+                ),
             )
             business = await business_repo.create(business_input)
             await session.commit()
@@ -240,12 +244,14 @@ async def test_edit_cannot_set_invalid_pickup_time():
             business_input = BusinessInput(
                 business_name="Time Test Cafe",
                 owner_id=user.id,
-                street_address="789 Time St",
-                city="Helsinki",
-                postal_code="00100",
-                country_code="FI",
-                latitude=60.1699,
-                longitude=24.9384,
+                venue=Venue(
+                    street_address="789 Time St",
+                    city="Helsinki",
+                    postal_code="00100",
+                    country_code="FI",
+                    latitude=60.1699,
+                    longitude=24.9384,
+                ),
             )
             business = await business_repo.create(business_input)
             
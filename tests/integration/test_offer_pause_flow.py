@@ -10,14 +10,12 @@ import pytest
 import random
 
 from src.models.offer import OfferInput, OfferStatus
-from src.models.business import BusinessInput
+from src.models.business import BusinessInput, Venue
 from src.services.reservation_flow import ReservationFlowService
 from src.storage.postgres_offer_repo import PostgresOfferRepository
 from src.storage.postgres_business_repo import PostgresBusinessRepository
 from src.storage.postgres_reservation_repo import PostgresReservationRepository
-from src.storage.redis_locks import RedisLockHelper
 from src.storage.database import get_database
-from src.config.settings import load_settings
 
 
 @pytest.mark.asyncio
@@ -33,12 +31,14 @@ async def test_pause_offer_prevents_reservations():
             business_input = BusinessInput(
                 business_name="Pause Test Cafe",
                 owner_id=random.randint(100000, 999999),
-                street_address="456 Pause St",
-                city="Helsinki",
-                postal_code="00100",
-                country_code="FI",
-                latitude=40.7450,
-                longitude=-73.9800,
+                venue=Venue(
+                    street_address="456 Pause St",
+                    city="Helsinki",
+                    postal_code="00100",
+                    country_code="FI",
+                    latitude=40.7450,
+                    longitude=-73.9800,
+                ),
             )
             business = await business_repo.create(business_input)
             
@@ -57,17 +57,12 @@ async def test_pause_offer_prevents_reservations():
             await session.commit()
         
         # 2. Verify reservation works when active
-        settings = load_settings()
-        lock_helper = RedisLockHelper(redis_url=settings.redis_url)
-        await lock_helper.connect()
-        
         async with db.session() as session:
             offer_repo = PostgresOfferRepository(session)
             reservation_repo = PostgresReservationRepository(session)
             reservation_service = ReservationFlowService(
                 offer_repo,
                 reservation_repo,
-                lock_helper,
             )
             
             result = await reservation_service.create_reservation(
@@ -111,12 +106,14 @@ async def test_resume_offer_allows_reservations():
             business_input = BusinessInput(
                 business_name="Resume Test Shop",
                 owner_id=random.randint(100000, 999999),
-                street_address="789 Resume Ave",
-                city="Helsinki",
-                postal_code="00100",
-                country_code="FI",
-                latitude=40.7550,
-                longitude=-73.9650,
+                venue=Venue(
+                    street_address="789 Resume Ave",
+                    city="Helsinki",
+                    postal_code="00100",
+                    country_code="FI",
+                    latitude=40.7550,
+                    longitude=-73.9650,
+                ),
             )
             business = await business_repo.create(business_input)
             
@@ -144,17 +141,12 @@ async def test_resume_offer_allows_reservations():
             await session.commit()
         
         # 3. Verify reservation works after resume
-        settings = load_settings()
-        lock_helper = RedisLockHelper(redis_url=settings.redis_url)
-        await lock_helper.connect()
-        
         async with db.session() as session:
             offer_repo = PostgresOfferRepository(session)
             reservation_repo = PostgresReservationRepository(session)
             reservation_service = ReservationFlowService(
                 offer_repo,
                 reservation_repo,
-                lock_helper,
             )
             
             result = await reservation_service.create_reservation(
@@ -183,12 +175,14 @@ async def test_pause_preserves_inventory():
             business_input = BusinessInput(
                 business_name="Inventory Test",
                 owner_id=random.randint(100000, 999999),
-                street_address="321 Inventory Rd",
-                city="Helsinki",
-                postal_code="00100",
-                country_code="FI",
-                latitude=40.7350,
-                longitude=-73.9750,
+                venue=Venue(
+                    street_address="321 Inventory Rd",
+                    city="Helsinki",
+                    postal_code="00100",
+                    country_code="FI",
+                    latitude=40.7350,
+                    longitude=-73.9750,
+                ),
             )
             business = await business_repo.create(business_input)
             
@@ -238,12 +232,14 @@ async def test_cannot_resume_expired_offer():
             business_input = BusinessInput(
                 business_name="Expired Test",
                 owner_id=random.randint(100000, 999999),
-                street_address="654 Expired Ln",
-                city="Helsinki",
-                postal_code="00100",
-                country_code="FI",
-                latitude=40.7250,
-                longitude=-73.9850,
+                venue=Venue(
+                    street_address="654 Expired Ln",
+                    city="Helsinki",
+                    postal_code="00100",
+                    country_code="FI",
+                    latitude=40.7250,
+                    longitude=-73.9850,
+                ),
             )
             business = await business_repo.create(business_input)
             
@@ -289,12 +285,14 @@ async def test_pause_resume_cycle():
             business_input = BusinessInput(
                 business_name="Cycle Test",
                 owner_id=random.randint(100000, 999999),
-                street_address="987 Cycle Blvd",
-                city="Helsinki",
-                postal_code="00100",
-                country_code="FI",
-                latitude=40.7650,
-                longitude=-73.9550,
+                venue=Venue(
+                    street_address="987 Cycle Blvd",
+                    city="Helsinki",
+                    postal_code="00100",
+                    country_code="FI",
+                    latitude=40.7650,
+                    longitude=-73.9550,
+                ),
             )
             business = await business_repo.create(business_input)
             
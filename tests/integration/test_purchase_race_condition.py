@@ -11,14 +11,12 @@ import pytest
 import random
 
 from src.models.offer import OfferInput
-from src.models.business import BusinessInput
+from src.models.business import BusinessInput, Venue
 from src.services.reservation_flow import ReservationFlowService
 from src.storage.postgres_offer_repo import PostgresOfferRepository
 from src.storage.postgres_business_repo import PostgresBusinessRepository
 from src.storage.postgres_reservation_repo import PostgresReservationRepository
-from src.storage.redis_locks import RedisLockHelper
 from src.storage.database import get_database
-from src.config.settings import load_settings
 
 
 @pytest.mark.asyncio
@@ -34,12 +32,14 @@ async def test_concurrent_reservation_prevents_overselling():
             business_input = BusinessInput(
                 business_name="Race Test Restaurant",
                 owner_id=random.randint(100000, 999999),
-                street_address="789 Race St",
-                city="Helsinki",
-                postal_code="00100",
-                country_code="FI",
-                latitude=40.7480,
-                longitude=-73.9862,
+                venue=Venue(
+                    street_address="789 Race St",
+                    city="Helsinki",
+                    postal_code="00100",
+                    country_code="FI",
+                    latitude=40.7480,
+                    longitude=-73.9862,
+                ),
             )
             business = await business_repo.create(business_input)
             
@@ -58,10 +58,6 @@ async def test_concurrent_reservation_prevents_overselling():
             await session.commit()
             
         # 2. Initialize reservation services
-        settings = load_settings()
-        lock_helper = RedisLockHelper(redis_url=settings.redis_url)
-        await lock_helper.connect()
-        
         async def attempt_reservation(customer_id: int, quantity: int):
             """Simulate reservation attempt."""
             async with db.session() as session:
@@ -70,7 +66,6 @@ async def test_concurrent_reservation_prevents_overselling():
                 reservation_service = ReservationFlowService(
                     offer_repo,
                     reservation_repo,
-                    lock_helper,
                 )
                 
                 result = await reservation_service.create_reservation(
@@ -120,12 +115,14 @@ async def test_lock_prevents_simultaneous_reservation():
             business_input = BusinessInput(
                 business_name="Lock Test Shop",
                 owner_id=random.randint(100000, 999999),
-                street_address="456 Lock Ave",
-                city="Helsinki",
-                postal_code="00100",
-                country_code="FI",
-                latitude=40.7580,
-                longitude=-73.9700,
+                venue=Venue(
+                    street_address="456 Lock Ave",
+                    city="Helsinki",
+                    postal_code="00100",
+                    country_code="FI",
+                    latitude=40.7580,
+                    longitude=-73.9700,
+                ),
             )
             business = await business_repo.create(business_input)
             
@@ -143,10 +140,6 @@ async def test_lock_prevents_simultaneous_reservation():
             offer = await offer_repo.create(offer_input)
             await session.commit()
         
-        settings = load_settings()
-        lock_helper = RedisLockHelper(redis_url=settings.redis_url)
-        await lock_helper.connect()
-        
         async def reserve_with_delay(customer_id: int):
             """Reserve with artificial delay to test lock behavior."""
             async with db.session() as session:
@@ -155,7 +148,6 @@ async def test_lock_prevents_simultaneous_reservation():
                 reservation_service = ReservationFlowService(
                     offer_repo,
                     reservation_repo,
-                    lock_helper,
                 )
                 
                 # Try to reserve 2 units with delay
@@ -199,12 +191,14 @@ async def test_reservation_after_inventory_depleted():
             business_input = BusinessInput(
                 business_name="Depleted Test Cafe",
                 owner_id=random.randint(100000, 999999),
-                street_address="321 Empty St",
-                city="Helsinki",
-                postal_code="00100",
-                country_code="FI",
-                latitude=40.7280,
-                longitude=-73.9500,
+                venue=Venue(
+                    street_address="321 Empty St",
+                    city="Helsinki",
+                    postal_code="00100",
+                    country_code="FI",
+                    latitude=40.7280,
+                    longitude=-73.9500,
+                ),
             )
             business = await business_repo.create(business_input)
             
@@ -226,9 +220,6 @@ async def test_reservation_after_inventory_depleted():
             await session.commit()
         
         # Try to reserve when inventory is 0
-        settings = load_settings()
-        lock_helper = RedisLockHelper(redis_url=settings.redis_url)
-        await lock_helper.connect()
         
         async with db.session() as session:
             offer_repo = PostgresOfferRepository(session)
@@ -236,7 +227,6 @@ async def test_reservation_after_inventory_depleted():
             reservation_service = ReservationFlowService(
                 offer_repo,
                 reservation_repo,
-                lock_helper,
             )
             
             result = await reservation_service.create_reservation(
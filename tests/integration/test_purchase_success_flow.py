@@ -35,12 +35,14 @@ async def test_complete_reservation_flow():
             business_input = BusinessInput(
                 business_name="Flow Test Restaurant",
                 owner_id=random.randint(100000, 999999),
-                street_address="321 Flow St",
-                city="Helsinki",
-                postal_code="00100",
-                country_code="FI",
-                latitude=40.7306,
-                longitude=-73.9352,
+                venue=Venue(
+                    street_address="321 Flow St",
+                    city="Helsinki",
+                    postal_code="00100",
+                    country_code="FI",
+                    latitude=40.7306,
+                    longitude=-73.9352,
+                ),
             )
             business = await business_repo.create(business_input)
             
@@ -9,7 +9,7 @@ import pytest
 import random
 
 from src.models.offer import OfferInput, OfferStatus
-from src.models.business import BusinessInput
+from src.models.business import BusinessInput, Venue
 from src.models.user import UserInput, UserRole
 from src.models.reservation import ReservationStatus
 from src.services.reservation_flow import ReservationFlowService
@@ -17,9 +17,7 @@ from src.storage.postgres_offer_repo import PostgresOfferRepository
 from src.storage.postgres_business_repo import PostgresBusinessRepository
 from src.storage.postgres_user_repo import PostgresUserRepository
 from src.storage.postgres_reservation_repo import PostgresReservationRepository
-from src.storage.redis_locks import RedisLockHelper
 from src.storage.database import get_database
-from src.config.settings import load_settings
 
 
 @pytest.mark.asyncio
@@ -51,12 +49,14 @@ async def test_reservation_cancellation_returns_inventory():
             business_input = BusinessInput(
                 business_name="Cancel Test Bakery",
                 owner_id=business_user.id,
-                street_address="123 Cancel St",
-                city="Helsinki",
-                postal_code="00100",
-                country_code="FI",
-                latitude=60.1699,
-                longitude=24.9384,
+                venue=Venue(
+                    street_address="123 Cancel St",
+                    city="Helsinki",
+                    postal_code="00100",
+                    country_code="FI",
+                    latitude=60.1699,
+                    longitude=24.9384,
+                ),
             )
             business = await business_repo.create(business_input)
             await session.commit()
@@ -81,10 +81,6 @@ async def test_reservation_cancellation_returns_inventory():
             assert initial_quantity == 10
         
         # 3. Create reservation for 3 units
-        settings = load_settings()
-        lock_helper = RedisLockHelper(redis_url=settings.redis_url)
-        await lock_helper.connect()
-        
         reservation_id = None
         async with db.session() as session:
             offer_repo = PostgresOfferRepository(session)
@@ -92,7 +88,6 @@ async def test_reservation_cancellation_returns_inventory():
             reservation_service = ReservationFlowService(
                 offer_repo,
                 reservation_repo,
-                lock_helper,
             )
             
             success, message, order_id = await reservation_service.create_reservation(
@@ -136,8 +131,6 @@ async def test_reservation_cancellation_returns_inventory():
             assert offer_after_cancel.quantity_remaining == 10, \
                 "Inventory should be returned after cancellation"
         
-        await lock_helper.disconnect()
-        
     finally:
         await db.disconnect()
 
@@ -169,12 +162,14 @@ async def test_cannot_cancel_after_pickup_time():
             business_input = BusinessInput(
                 business_name="Past Time Bakery",
                 owner_id=business_user.id,
-                street_address="456 Past St",
-                city="Helsinki",
-                postal_code="00100",
-                country_code="FI",
-                latitude=60.1699,
-                longitude=24.9384,
+                venue=Venue(
+                    street_address="456 Past St",
+                    city="Helsinki",
+                    postal_code="00100",
+                    country_code="FI",
+                    latitude=60.1699,
+                    longitude=24.9384,
+                ),
             )
             business = await business_repo.create(business_input)
             
@@ -241,12 +236,14 @@ async def test_multiple_reservations_cancellation():
             business_input = BusinessInput(
                 business_name="Multi Cancel Bakery",
                 owner_id=business_user.id,
-                street_address="789 Multi St",
-                city="Helsinki",
-                postal_code="00100",
-                country_code="FI",
-                latitude=60.1699,
-                longitude=24.9384,
+                venue=Venue(
+                    street_address="789 Multi St",
+                    city="Helsinki",
+                    postal_code="00100",
+                    country_code="FI",
+                    latitude=60.1699,
+                    longitude=24.9384,
+                ),
             )
             business = await business_repo.create(business_input)
             
@@ -265,10 +262,6 @@ async def test_multiple_reservations_cancellation():
             await session.commit()
         
         # Create two reservations
-        settings = load_settings()
-        lock_helper = RedisLockHelper(redis_url=settings.redis_url)
-        await lock_helper.connect()
-        
         reservation1_id = None
         reservation2_id = None
         
@@ -278,7 +271,6 @@ async def test_multiple_reservations_cancellation():
             reservation_service = ReservationFlowService(
                 offer_repo,
                 reservation_repo,
-                lock_helper,
             )
             
             # Customer 1 reserves 5 units
@@ -331,7 +323,5 @@ async def test_multiple_reservations_cancellation():
             res2_check = await reservation_repo.get_by_id(reservation2_id)
             assert res2_check.status == ReservationStatus.CONFIRMED
         
-        await lock_helper.disconnect()
-        
     finally:
         await db.disconnect()
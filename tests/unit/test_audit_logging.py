@@ -0,0 +1,102 @@
+"""Unit tests for audit event logging."""
+
+import asyncio
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+
+from src.logging import audit
+from src.logging.audit import AuditEventType, AuditLogger, run_audit_drain
+
+
+@pytest.fixture
+def audit_logger(monkeypatch):
+    mock_logger = Mock()
+    monkeypatch.setattr(audit, "logger", mock_logger)
+    return mock_logger
+
+
+def test_log_event_writes_inline_without_drain(audit_logger):
+    AuditLogger.log_permission_denied(42, "offer", uuid4(), "edit_offer")
+
+    audit_logger.info.assert_called_once()
+    args, kwargs = audit_logger.info.call_args
+    assert args == ("audit_event",)
+    assert kwargs["event_type"] == AuditEventType.PERMISSION_DENIED.value
+    assert kwargs["success"] is False
+
+
+@pytest.mark.asyncio
+async def test_log_event_is_written_by_drain(audit_logger):
+    drain = asyncio.create_task(run_audit_drain())
+    await asyncio.sleep(0)
+
+    AuditLogger.log_purchase_canceled(42, uuid4(), "changed mind")
+    audit_logger.info.assert_not_called()
+
+    await asyncio.sleep(0)
+    drain.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await drain
+
+    audit_logger.info.assert_called_once()
+    assert audit_logger.info.call_args.kwargs["metadata"] == {"reason": "changed mind"}
+
+
+def test_error_field_only_present_when_set(audit_logger):
+    AuditLogger.log_event(AuditEventType.PURCHASE_FAILED, 42, "purchase", "p1", "Purchase failed")
+    AuditLogger.log_event(
+        AuditEventType.PURCHASE_FAILED, 42, "purchase", "p1", "Purchase failed",
+        success=False, error="card declined",
+    )
+
+    first, second = audit_logger.info.call_args_list
+    assert "error" not in first.kwargs
+    assert second.kwargs["error"] == "card declined"
+
+
+def test_missing_metadata_uses_shared_empty_dict(audit_logger):
+    AuditLogger.log_event(AuditEventType.OFFER_EXPIRED, 42, "offer", "o1", "Offer expired")
+    AuditLogger.log_event(AuditEventType.OFFER_EXPIRED, 42, "offer", "o2", "Offer expired")
+
+    first, second = audit_logger.info.call_args_list
+    assert first.kwargs["metadata"] == {}
+    assert first.kwargs["metadata"] is second.kwargs["metadata"]
+
+
+@pytest.mark.asyncio
+async def test_timestamp_is_taken_when_event_is_logged(audit_logger, monkeypatch):
+    drain = asyncio.create_task(run_audit_drain())
+    await asyncio.sleep(0)
+
+    monkeypatch.setattr(audit.time, "time", lambda: 0.0)
+    AuditLogger.log_purchase_canceled(42, uuid4(), "changed mind")
+    monkeypatch.setattr(audit.time, "time", lambda: 60.0)
+
+    await asyncio.sleep(0)
+    drain.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await drain
+
+    assert audit_logger.info.call_args.kwargs["timestamp"] == "1970-01-01T00:00:00Z"
+
+
+@pytest.mark.asyncio
+async def test_drain_survives_failed_write(audit_logger):
+    audit_logger.info.side_effect = [RuntimeError("disk full"), None]
+    drain = asyncio.create_task(run_audit_drain())
+    await asyncio.sleep(0)
+
+    AuditLogger.log_purchase_canceled(42, uuid4(), "first")
+    await asyncio.sleep(0)
+    AuditLogger.log_purchase_canceled(42, uuid4(), "second")
+    await asyncio.sleep(0)
+
+    assert not drain.done()
+    drain.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await drain
+
+    audit_logger.exception.assert_called_once()
+    assert audit_logger.info.call_args.kwargs["metadata"] == {"reason": "second"}
@@ -0,0 +1,36 @@
+"""Unit tests for PostgresBusinessRepository statements."""
+
+from uuid import uuid4
+
+import pytest
+
+from src.storage.postgres_business_repo import PostgresBusinessRepository
+
+
+@pytest.mark.asyncio
+async def test_get_by_ids_uses_one_in_query(db_session, executed_sql):
+    db_session.execute.return_value.scalars.return_value = []
+    business_id = uuid4()
+
+    found = await PostgresBusinessRepository(db_session).get_by_ids([business_id, business_id])
+
+    assert found == {}
+    db_session.execute.assert_awaited_once()
+    assert "businesses.id IN" in executed_sql()
+
+
+@pytest.mark.asyncio
+async def test_get_by_ids_skips_query_for_no_ids(db_session):
+    assert await PostgresBusinessRepository(db_session).get_by_ids([]) == {}
+    db_session.execute.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_approve_business_is_single_update_returning(db_session, executed_sql):
+    db_session.execute.return_value.scalar_one_or_none.return_value = None
+
+    with pytest.raises(ValueError, match="Business not found"):
+        await PostgresBusinessRepository(db_session).approve_business(uuid4(), 42)
+
+    db_session.execute.assert_awaited_once()
+    assert executed_sql().startswith("UPDATE businesses SET")
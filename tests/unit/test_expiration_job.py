@@ -0,0 +1,38 @@
+"""Unit tests for the offer expiration job."""
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from src.services.expiration_job import ExpirationJob
+
+
+def _expired_offer():
+    offer = Mock()
+    offer.id = uuid4()
+    offer.business_id = uuid4()
+    offer.pickup_end_time = datetime.utcnow() - timedelta(minutes=5)
+    return offer
+
+
+@pytest.mark.asyncio
+async def test_run_expires_offers_in_one_repository_call():
+    offer_repo = AsyncMock()
+    offer_repo.bulk_expire_due = AsyncMock(return_value=[_expired_offer(), _expired_offer()])
+
+    result = await ExpirationJob(offer_repo).run()
+
+    assert result == {"expired": 2}
+    offer_repo.bulk_expire_due.assert_awaited_once()
+    offer_repo.update_state.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_run_propagates_errors():
+    offer_repo = AsyncMock()
+    offer_repo.bulk_expire_due = AsyncMock(side_effect=RuntimeError("db down"))
+
+    with pytest.raises(RuntimeError, match="db down"):
+        await ExpirationJob(offer_repo).run()
@@ -0,0 +1,111 @@
+"""Unit tests for the image processing service."""
+
+from io import BytesIO
+
+import pytest
+from PIL import Image
+
+from src.services.image_processing import MAX_DIMENSION, THUMBNAIL_SIZE, ImageProcessor
+from src.storage.image_store import LocalImageStore
+
+
+def _image_bytes(size, mode="RGB", format="PNG"):
+    buffer = BytesIO()
+    Image.new(mode, size, (200, 100, 50, 255)[: len(mode)]).save(buffer, format=format)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def store(tmp_path):
+    return LocalImageStore(base_path=str(tmp_path), base_url="/static")
+
+
+def _saved_images(store, *urls):
+    return [Image.open(store.base_path / url.rsplit("/", 1)[-1]) for url in urls]
+
+
+@pytest.mark.asyncio
+async def test_process_photo_stores_jpeg_image_and_thumbnail(store):
+    urls = await ImageProcessor(store).process_telegram_photo(
+        _image_bytes((800, 600), mode="RGBA"), "file-1"
+    )
+
+    image_url, thumbnail_url = urls
+    assert image_url.startswith("/static/") and image_url.endswith(".jpg")
+    assert thumbnail_url == image_url.replace(".jpg", "_thumb.jpg")
+    image, thumbnail = _saved_images(store, *urls)
+    assert (image.format, image.mode, image.size) == ("JPEG", "RGB", (800, 600))
+    assert (thumbnail.format, thumbnail.size) == ("JPEG", (400, 300))
+
+
+@pytest.mark.asyncio
+async def test_process_photo_downscales_large_images(store):
+    urls = await ImageProcessor(store).process_telegram_photo(
+        _image_bytes((4096, 1024)), "file-2"
+    )
+
+    image, thumbnail = _saved_images(store, *urls)
+    assert image.size == (MAX_DIMENSION, MAX_DIMENSION // 4)
+    assert max(thumbnail.size) == THUMBNAIL_SIZE[0]
+
+
+@pytest.mark.asyncio
+async def test_process_photo_decodes_large_jpeg_at_reduced_scale(store):
+    urls = await ImageProcessor(store).process_telegram_photo(
+        _image_bytes((6000, 3000), format="JPEG"), "file-3"
+    )
+
+    image, _ = _saved_images(store, *urls)
+    assert image.size == (MAX_DIMENSION, MAX_DIMENSION // 2)
+
+
+@pytest.mark.asyncio
+async def test_process_photo_never_upscales_thumbnail(store):
+    urls = await ImageProcessor(store).process_telegram_photo(
+        _image_bytes((200, 100)), "file-4"
+    )
+
+    image, thumbnail = _saved_images(store, *urls)
+    assert image.size == thumbnail.size == (200, 100)
+
+
+@pytest.mark.asyncio
+async def test_process_photo_rejects_invalid_image(store):
+    with pytest.raises(ValueError, match="Unsupported format"):
+        await ImageProcessor(store).process_telegram_photo(b"not an image", "file-5")
+
+    assert list(store.base_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_process_photo_rejects_disallowed_format(store):
+    with pytest.raises(ValueError, match="Unsupported format"):
+        await ImageProcessor(store).process_telegram_photo(
+            _image_bytes((10, 10), format="GIF"), "file-6"
+        )
+
+
+@pytest.mark.asyncio
+async def test_delete_image_uses_filename_from_url(store):
+    await store.save("abc.jpg", b"data")
+
+    assert await ImageProcessor(store).delete_image("https://cdn.example/static/abc.jpg")
+
+    assert list(store.base_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_process_photo_removes_image_when_thumbnail_save_fails(store, monkeypatch):
+    save = store.save
+
+    async def failing_save(filename, image_data):
+        if filename.endswith("_thumb.jpg"):
+            raise OSError("disk full")
+        return await save(filename, image_data)
+
+    monkeypatch.setattr(store, "save", failing_save)
+
+    with pytest.raises(OSError, match="disk full"):
+        await ImageProcessor(store).process_telegram_photo(_image_bytes((200, 100)), "file-7")
+
+    assert list(store.base_path.iterdir()) == []
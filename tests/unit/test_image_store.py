@@ -0,0 +1,37 @@
+"""Unit tests for LocalImageStore."""
+
+import pytest
+
+from src.storage.image_store import LocalImageStore
+
+
+@pytest.mark.asyncio
+async def test_upload_writes_file_and_returns_url(tmp_path):
+    store = LocalImageStore(base_path=str(tmp_path), base_url="/static")
+
+    url = await store.upload(b"\xff\xd8data", "image/jpeg")
+
+    filename = url.rsplit("/", 1)[-1]
+    assert url.startswith("/static/")
+    assert filename.endswith(".jpeg")
+    assert (tmp_path / filename).read_bytes() == b"\xff\xd8data"
+
+
+@pytest.mark.asyncio
+async def test_delete_reports_whether_file_existed(tmp_path):
+    store = LocalImageStore(base_path=str(tmp_path), base_url="/static")
+    url = await store.upload(b"data", "image/png")
+
+    assert await store.delete(url) is True
+    assert await store.delete(url) is False
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_save_uses_given_filename(tmp_path):
+    store = LocalImageStore(base_path=str(tmp_path), base_url="/static")
+
+    url = await store.save("abc_thumb.jpg", b"data")
+
+    assert url == "/static/abc_thumb.jpg"
+    assert (tmp_path / "abc_thumb.jpg").read_bytes() == b"data"
@@ -1,12 +1,12 @@
 """Unit tests for inventory reservation service.
 
 Tests the InventoryReservation service in isolation using mocks
-to verify reservation logic, lock acquisition, and error handling.
+to verify reservation logic and error handling.
 """
 
 from datetime import datetime, timedelta
 from decimal import Decimal
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 from uuid import UUID, uuid4
 import pytest
 
@@ -21,13 +21,6 @@ def mock_offer_repo():
     return repo
 
 
-@pytest.fixture
-def mock_lock_helper():
-    """Mock Redis lock helper."""
-    helper = MagicMock()
-    return helper
-
-
 @pytest.fixture
 def sample_offer():
     """Sample offer for testing."""
@@ -46,17 +39,13 @@ def sample_offer():
 
 
 @pytest.mark.asyncio
-async def test_reserve_items_success(mock_offer_repo, mock_lock_helper, sample_offer):
+async def test_reserve_items_success(mock_offer_repo, sample_offer):
     """Test successful item reservation."""
     # Setup
     mock_offer_repo.get_by_id.return_value = sample_offer
     mock_offer_repo.decrement_quantity.return_value = True
     
-    # Mock lock context manager
-    mock_lock_helper.acquire_offer_lock.return_value.__aenter__ = AsyncMock(return_value=True)
-    mock_lock_helper.acquire_offer_lock.return_value.__aexit__ = AsyncMock(return_value=None)
-    
-    service = InventoryReservation(mock_offer_repo, mock_lock_helper)
+    service = InventoryReservation(mock_offer_repo)
     
     # Execute
     item_requests = [
@@ -76,22 +65,17 @@ async def test_reserve_items_success(mock_offer_repo, mock_lock_helper, sample_o
         assert reservation["items"][1]["name"] == "Salad"
         assert reservation["items"][1]["quantity"] == 1
     
-    # Verify lock was acquired
-    mock_lock_helper.acquire_offer_lock.assert_called_once_with(sample_offer.id)
-    
     # Verify quantities decremented
     assert mock_offer_repo.decrement_quantity.call_count == 2
 
 
 @pytest.mark.asyncio
-async def test_reserve_items_insufficient_quantity(mock_offer_repo, mock_lock_helper, sample_offer):
+async def test_reserve_items_insufficient_quantity(mock_offer_repo, sample_offer):
     """Test reservation fails when insufficient quantity."""
     # Setup
     mock_offer_repo.get_by_id.return_value = sample_offer
-    mock_lock_helper.acquire_offer_lock.return_value.__aenter__ = AsyncMock(return_value=True)
-    mock_lock_helper.acquire_offer_lock.return_value.__aexit__ = AsyncMock(return_value=None)
     
-    service = InventoryReservation(mock_offer_repo, mock_lock_helper)
+    service = InventoryReservation(mock_offer_repo)
     
     # Execute: Request more than available (Salad only has 5)
     item_requests = [{"item_name": "Salad", "quantity": 6}]
@@ -107,14 +91,12 @@ async def test_reserve_items_insufficient_quantity(mock_offer_repo, mock_lock_he
 
 
 @pytest.mark.asyncio
-async def test_reserve_items_nonexistent_item(mock_offer_repo, mock_lock_helper, sample_offer):
+async def test_reserve_items_nonexistent_item(mock_offer_repo, sample_offer):
     """Test reservation fails for non-existent item."""
     # Setup
     mock_offer_repo.get_by_id.return_value = sample_offer
-    mock_lock_helper.acquire_offer_lock.return_value.__aenter__ = AsyncMock(return_value=True)
-    mock_lock_helper.acquire_offer_lock.return_value.__aexit__ = AsyncMock(return_value=None)
     
-    service = InventoryReservation(mock_offer_repo, mock_lock_helper)
+    service = InventoryReservation(mock_offer_repo)
     
     # Execute: Request non-existent item
     item_requests = [{"item_name": "Pizza", "quantity": 1}]
@@ -128,7 +110,7 @@ async def test_reserve_items_nonexistent_item(mock_offer_repo, mock_lock_helper,
 
 
 @pytest.mark.asyncio
-async def test_reserve_items_expired_offer(mock_offer_repo, mock_lock_helper):
+async def test_reserve_items_expired_offer(mock_offer_repo):
     """Test reservation fails for expired offer."""
     # Setup: Create expired offer
     expired_offer = Offer(
@@ -144,10 +126,8 @@ async def test_reserve_items_expired_offer(mock_offer_repo, mock_lock_helper):
     )
     
     mock_offer_repo.get_by_id.return_value = expired_offer
-    mock_lock_helper.acquire_offer_lock.return_value.__aenter__ = AsyncMock(return_value=True)
-    mock_lock_helper.acquire_offer_lock.return_value.__aexit__ = AsyncMock(return_value=None)
     
-    service = InventoryReservation(mock_offer_repo, mock_lock_helper)
+    service = InventoryReservation(mock_offer_repo)
     
     # Execute
     item_requests = [{"item_name": "Bread", "quantity": 2}]
@@ -161,37 +141,12 @@ async def test_reserve_items_expired_offer(mock_offer_repo, mock_lock_helper):
 
 
 @pytest.mark.asyncio
-async def test_reserve_items_lock_not_acquired(mock_offer_repo, mock_lock_helper, sample_offer):
-    """Test reservation fails when lock cannot be acquired."""
-    # Setup: Lock acquisition fails
-    mock_offer_repo.get_by_id.return_value = sample_offer
-    mock_lock_helper.acquire_offer_lock.return_value.__aenter__ = AsyncMock(return_value=False)
-    mock_lock_helper.acquire_offer_lock.return_value.__aexit__ = AsyncMock(return_value=None)
-    
-    service = InventoryReservation(mock_offer_repo, mock_lock_helper)
-    
-    # Execute
-    item_requests = [{"item_name": "Sandwich", "quantity": 1}]
-    
-    async with service.reserve_items(sample_offer.id, item_requests) as reservation:
-        # Verify
-        assert reservation["success"] is False
-        assert "lock" in reservation["error"].lower()
-    
-    # Should not attempt to get offer or decrement
-    mock_offer_repo.get_by_id.assert_not_called()
-    mock_offer_repo.decrement_quantity.assert_not_called()
-
-
-@pytest.mark.asyncio
-async def test_reserve_items_offer_not_found(mock_offer_repo, mock_lock_helper):
+async def test_reserve_items_offer_not_found(mock_offer_repo):
     """Test reservation fails when offer doesn't exist."""
     # Setup
     mock_offer_repo.get_by_id.return_value = None
-    mock_lock_helper.acquire_offer_lock.return_value.__aenter__ = AsyncMock(return_value=True)
-    mock_lock_helper.acquire_offer_lock.return_value.__aexit__ = AsyncMock(return_value=None)
     
-    service = InventoryReservation(mock_offer_repo, mock_lock_helper)
+    service = InventoryReservation(mock_offer_repo)
     
     # Execute
     offer_id = uuid4()
@@ -206,15 +161,13 @@ async def test_reserve_items_offer_not_found(mock_offer_repo, mock_lock_helper):
 
 
 @pytest.mark.asyncio
-async def test_reserve_items_decrement_fails(mock_offer_repo, mock_lock_helper, sample_offer):
+async def test_reserve_items_decrement_fails(mock_offer_repo, sample_offer):
     """Test reservation fails when decrement operation fails."""
     # Setup
     mock_offer_repo.get_by_id.return_value = sample_offer
     mock_offer_repo.decrement_quantity.return_value = False  # Decrement fails
-    mock_lock_helper.acquire_offer_lock.return_value.__aenter__ = AsyncMock(return_value=True)
-    mock_lock_helper.acquire_offer_lock.return_value.__aexit__ = AsyncMock(return_value=None)
     
-    service = InventoryReservation(mock_offer_repo, mock_lock_helper)
+    service = InventoryReservation(mock_offer_repo)
     
     # Execute
     item_requests = [{"item_name": "Sandwich", "quantity": 2}]
@@ -228,10 +181,10 @@ async def test_reserve_items_decrement_fails(mock_offer_repo, mock_lock_helper,
 
 
 @pytest.mark.asyncio
-async def test_release_reservation(mock_offer_repo, mock_lock_helper):
+async def test_release_reservation(mock_offer_repo):
     """Test inventory release logs properly."""
     # Setup
-    service = InventoryReservation(mock_offer_repo, mock_lock_helper)
+    service = InventoryReservation(mock_offer_repo)
     
     # Execute
     offer_id = uuid4()
@@ -245,14 +198,12 @@ async def test_release_reservation(mock_offer_repo, mock_lock_helper):
 
 
 @pytest.mark.asyncio
-async def test_reserve_multiple_items_validates_all(mock_offer_repo, mock_lock_helper, sample_offer):
+async def test_reserve_multiple_items_validates_all(mock_offer_repo, sample_offer):
     """Test that all items are validated before any decrement."""
     # Setup
     mock_offer_repo.get_by_id.return_value = sample_offer
-    mock_lock_helper.acquire_offer_lock.return_value.__aenter__ = AsyncMock(return_value=True)
-    mock_lock_helper.acquire_offer_lock.return_value.__aexit__ = AsyncMock(return_value=None)
     
-    service = InventoryReservation(mock_offer_repo, mock_lock_helper)
+    service = InventoryReservation(mock_offer_repo)
     
     # Execute: Second item has too much quantity requested
     item_requests = [
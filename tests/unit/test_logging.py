@@ -0,0 +1,101 @@
+"""Unit tests for logging: bot token redaction and buffered output."""
+
+import io
+import logging
+import time
+
+import src.logging as src_logging
+from src.logging import BufferedWriteLogger, TokenRedactingFilter, _maybe_has_token, _redact, _redact_tokens
+
+TOKEN = "8392205405:AAGcX5QLzoD6l7gSh4RahBAdYpY8jsSorSI"
+
+
+def test_redact_tokens_replaces_token_in_url():
+    event_dict = {"event": "http_request", "url": f"https://api.telegram.org/bot{TOKEN}/getMe"}
+
+    result = _redact_tokens(None, "info", event_dict)
+
+    assert TOKEN not in result["url"]
+    assert "<BOT_TOKEN_REDACTED>" in result["url"]
+
+
+def test_redact_tokens_leaves_other_values_untouched():
+    event_dict = {"event": "offer_created", "offer_id": "abc", "count": 3, "time": "12:30"}
+
+    result = _redact_tokens(None, "info", dict(event_dict))
+
+    assert result == event_dict
+
+
+def test_filter_redacts_message_and_args():
+    record = logging.LogRecord(
+        "httpx", logging.INFO, __file__, 1, f"POST bot{TOKEN} %s", (f"bot{TOKEN}",), None
+    )
+
+    assert TokenRedactingFilter().filter(record) is True
+    assert TOKEN not in record.getMessage()
+
+
+def test_maybe_has_token_prefilter():
+    assert _maybe_has_token(f"https://api.telegram.org/bot{TOKEN}/getUpdates")
+    assert _maybe_has_token(TOKEN)
+    assert not _maybe_has_token("https://example.com:8443/path")
+    assert not _maybe_has_token("pickup at 12:30")
+
+
+def test_redact_returns_none_without_token():
+    assert _redact("pickup at 12:30") is None
+    assert _redact(f"bot{TOKEN}/getMe") == "bot<BOT_TOKEN_REDACTED>/getMe"
+
+
+def test_buffered_logger_batches_until_threshold(monkeypatch):
+    monkeypatch.setattr(src_logging, "LOG_FLUSH_INTERVAL_SECONDS", 3600)
+    out = io.StringIO()
+    buffered = BufferedWriteLogger(out)
+
+    for i in range(src_logging.LOG_FLUSH_LINES - 1):
+        buffered.info(f"line {i}")
+    assert out.getvalue() == ""
+
+    buffered.info("last")
+    assert out.getvalue().count("\n") == src_logging.LOG_FLUSH_LINES
+
+
+def test_buffered_logger_writes_errors_immediately(monkeypatch):
+    monkeypatch.setattr(src_logging, "LOG_FLUSH_INTERVAL_SECONDS", 3600)
+    out = io.StringIO()
+    buffered = BufferedWriteLogger(out)
+
+    buffered.info("queued")
+    buffered.error("boom")
+
+    assert out.getvalue() == "queued\nboom\n"
+
+
+def test_buffered_logger_flushes_pending_lines_when_idle(monkeypatch):
+    monkeypatch.setattr(src_logging, "LOG_FLUSH_INTERVAL_SECONDS", 0.01)
+    out = io.StringIO()
+    buffered = BufferedWriteLogger(out)
+    buffered.flush()
+
+    buffered.info("pending")
+    for _ in range(100):
+        if out.getvalue():
+            break
+        time.sleep(0.01)
+
+    assert out.getvalue() == "pending\n"
+
+
+def test_stdlib_records_share_the_buffered_writer(monkeypatch):
+    monkeypatch.setattr(src_logging, "LOG_FLUSH_INTERVAL_SECONDS", 3600)
+    out = io.StringIO()
+    monkeypatch.setattr(src_logging, "_writer", BufferedWriteLogger(out))
+    handler = src_logging._SharedWriterHandler()
+
+    src_logging._get_writer().info("structlog line")
+    handler.handle(logging.makeLogRecord({"msg": "stdlib line", "levelno": logging.INFO}))
+    assert out.getvalue() == ""
+
+    handler.handle(logging.makeLogRecord({"msg": "stdlib error", "levelno": logging.ERROR}))
+    assert out.getvalue() == "structlog line\nstdlib line\nstdlib error\n"
@@ -0,0 +1,114 @@
+"""Unit tests for PostgresOfferRepository statements."""
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from src.models.offer import OfferStatus
+from src.storage.db_models import OfferTable
+from src.storage.postgres_offer_repo import PostgresOfferRepository
+
+
+@pytest.mark.asyncio
+async def test_decrement_quantity_is_single_conditional_update(db_session, executed_sql):
+    db_session.execute.return_value.scalar_one_or_none.return_value = 4
+
+    assert await PostgresOfferRepository(db_session).decrement_quantity(uuid4(), 2) is True
+
+    db_session.execute.assert_awaited_once()
+    sql = executed_sql()
+    assert sql.startswith("UPDATE offers SET")
+    assert "offers.state =" in sql
+    assert "offers.pickup_end_time >" in sql
+    assert "offers.quantity_remaining >=" in sql
+    assert "CASE WHEN" in sql
+    db_session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_decrement_quantity_reports_insufficient_stock(db_session):
+    db_session.execute.return_value.scalar_one_or_none.return_value = None
+
+    assert await PostgresOfferRepository(db_session).decrement_quantity(uuid4(), 5) is False
+
+
+@pytest.mark.asyncio
+async def test_bulk_expire_due_returns_only_logged_columns(db_session, executed_sql):
+    db_session.execute.return_value.all.return_value = []
+
+    assert await PostgresOfferRepository(db_session).bulk_expire_due() == []
+
+    assert executed_sql().endswith(
+        "RETURNING offers.id, offers.title, offers.business_id, offers.pickup_end_time"
+    )
+    db_session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_update_state_returns_updated_offer(db_session):
+    now = datetime.utcnow()
+    db_offer = OfferTable(
+        id=uuid4(),
+        business_id=uuid4(),
+        title="Bread bag",
+        description="Day-old loaves and rolls",
+        price_per_unit=Decimal("3.50"),
+        currency="EUR",
+        quantity_total=5,
+        quantity_remaining=2,
+        pickup_start_time=now,
+        pickup_end_time=now + timedelta(hours=2),
+        state=OfferStatus.PAUSED,
+        created_at=now,
+        updated_at=now,
+    )
+    db_session.execute.return_value.scalar_one_or_none.return_value = db_offer
+
+    offer = await PostgresOfferRepository(db_session).update_state(
+        db_offer.id, OfferStatus.PAUSED
+    )
+
+    db_session.execute.assert_awaited_once()
+    assert (offer.id, offer.state, offer.quantity_remaining) == (
+        db_offer.id, OfferStatus.PAUSED, 2
+    )
+    db_session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_update_state_reports_missing_offer(db_session):
+    db_session.execute.return_value.scalar_one_or_none.return_value = None
+
+    with pytest.raises(ValueError, match="Offer not found"):
+        await PostgresOfferRepository(db_session).update_state(uuid4(), OfferStatus.PAUSED)
+
+
+@pytest.mark.asyncio
+async def test_increment_quantity_reactivates_in_same_update(db_session, executed_sql):
+    db_session.execute.return_value.one_or_none.return_value = (3, OfferStatus.ACTIVE)
+
+    assert await PostgresOfferRepository(db_session).increment_quantity(uuid4(), 3) is True
+
+    db_session.execute.assert_awaited_once()
+    assert "CASE WHEN" in executed_sql()
+    db_session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_delete_is_single_delete_returning(db_session, executed_sql):
+    db_session.execute.return_value.scalar_one_or_none.return_value = uuid4()
+
+    assert await PostgresOfferRepository(db_session).delete(uuid4()) is True
+
+    db_session.execute.assert_awaited_once()
+    assert executed_sql().startswith("DELETE FROM offers WHERE offers.id =")
+    db_session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_delete_reports_missing_offer(db_session):
+    db_session.execute.return_value.scalar_one_or_none.return_value = None
+
+    assert await PostgresOfferRepository(db_session).delete(uuid4()) is False
@@ -4,7 +4,13 @@ from decimal import Decimal
 
 import pytest
 
-from src.models.purchase import Purchase, PurchaseItem, PurchaseRequest, PurchaseStatus
+from src.models.purchase import (
+    Purchase,
+    PurchaseInput,
+    PurchaseItem,
+    PurchaseRequest,
+    PurchaseStatus,
+)
 
 
 def test_purchase_item_validation():
@@ -27,31 +33,42 @@ def test_purchase_item_quantity_positive():
 
 
 def test_purchase_total_validation():
-    """Test Purchase total_amount matches item selections."""
+    """Test PurchaseInput total_amount matches item selections."""
     items = [
         PurchaseItem(name="Bread", quantity=2, unit_price=Decimal("2.50")),
         PurchaseItem(name="Cake", quantity=1, unit_price=Decimal("3.00")),
     ]
 
     # Correct total
-    purchase = Purchase(
+    purchase_input = PurchaseInput(
         offer_id="00000000-0000-0000-0000-000000000001",
         customer_id=123456789,  # Telegram user ID
         item_selections=items,
         total_amount=Decimal("8.00"),  # 2*2.50 + 1*3.00
     )
-    assert purchase.total_amount == Decimal("8.00")
+    assert purchase_input.total_amount == Decimal("8.00")
 
     # Incorrect total
     with pytest.raises(ValueError, match="total_amount .* does not match calculated total"):
-        Purchase(
+        PurchaseInput(
             offer_id="00000000-0000-0000-0000-000000000001",
-            customer_id="00000000-0000-0000-0000-000000000002",
+            customer_id=123456789,
             item_selections=items,
             total_amount=Decimal("10.00"),  # Wrong
         )
 
 
+def test_purchase_trusts_stored_total():
+    """Test Purchase does not re-check total_amount when rehydrated."""
+    purchase = Purchase(
+        offer_id="00000000-0000-0000-0000-000000000001",
+        customer_id=123456789,
+        item_selections=[PurchaseItem(name="Bread", quantity=2, unit_price=Decimal("2.50"))],
+        total_amount=Decimal("4.50"),  # Trusted as stored
+    )
+    assert purchase.total_amount == Decimal("4.50")
+
+
 def test_purchase_request_validation():
     """Test PurchaseRequest validation."""
     # Valid request
@@ -64,17 +81,21 @@ def test_purchase_request_validation():
     assert len(request.items) == 2
 
     # Missing item_name
-    with pytest.raises(ValueError, match="item_name and quantity"):
+    with pytest.raises(ValueError, match=r"items\.0\.item_name\n\s+Field required"):
         PurchaseRequest(items=[{"quantity": 2}])
 
     # Missing quantity
-    with pytest.raises(ValueError, match="item_name and quantity"):
+    with pytest.raises(ValueError, match=r"items\.0\.quantity\n\s+Field required"):
         PurchaseRequest(items=[{"item_name": "Bread"}])
 
     # Invalid quantity
-    with pytest.raises(ValueError, match="positive integer"):
+    with pytest.raises(ValueError, match="greater than 0"):
         PurchaseRequest(items=[{"item_name": "Bread", "quantity": 0}])
 
+    # Quantity must be an actual integer
+    with pytest.raises(ValueError, match="valid integer"):
+        PurchaseRequest(items=[{"item_name": "Bread", "quantity": "2"}])
+
     # Empty items list
     with pytest.raises(ValueError):
         PurchaseRequest(items=[])
@@ -85,3 +106,18 @@ def test_purchase_status_transitions():
     assert PurchaseStatus.PENDING.value == "pending"
     assert PurchaseStatus.CONFIRMED.value == "confirmed"
     assert PurchaseStatus.CANCELED.value == "canceled"
+
+
+def test_purchase_from_row_builds_items():
+    """Test Purchase.from_row rehydrates stored item dicts without validation."""
+    purchase = Purchase.from_row({
+        "offer_id": "00000000-0000-0000-0000-000000000001",
+        "customer_id": 123456789,
+        "item_selections": [{"name": "Bread", "quantity": 2, "unit_price": Decimal("2.50")}],
+        "total_amount": Decimal("5.00"),
+        "status": PurchaseStatus.CONFIRMED,
+    })
+
+    assert isinstance(purchase.item_selections[0], PurchaseItem)
+    assert purchase.item_selections[0].quantity == 2
+    assert purchase.status == PurchaseStatus.CONFIRMED
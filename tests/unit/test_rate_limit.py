@@ -0,0 +1,86 @@
+"""Unit tests for the Redis rate limiter."""
+
+import asyncio
+
+import fakeredis
+import pytest
+
+from src.security import rate_limit
+from src.security.rate_limit import RateLimiter
+
+
+@pytest.fixture
+async def limiter(monkeypatch):
+    client = fakeredis.FakeAsyncRedis()
+    monkeypatch.setattr(rate_limit.redis, "from_url", lambda *args, **kwargs: client)
+    limiter = RateLimiter("redis://test", max_requests=3, window_seconds=60)
+    await limiter.connect()
+    yield limiter
+    await limiter.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_allows_requests_up_to_limit(limiter):
+    for _ in range(3):
+        assert await limiter.check_rate_limit(42, "reserve") == (True, None)
+
+
+@pytest.mark.asyncio
+async def test_denies_request_over_limit_with_window_ttl(limiter):
+    for _ in range(3):
+        await limiter.check_rate_limit(42, "reserve")
+
+    allowed, retry_after = await limiter.check_rate_limit(42, "reserve")
+
+    assert allowed is False
+    assert 0 < retry_after <= 60
+
+
+@pytest.mark.asyncio
+async def test_limits_are_per_user_and_action(limiter):
+    for _ in range(4):
+        await limiter.check_rate_limit(42, "reserve")
+
+    assert await limiter.check_rate_limit(43, "reserve") == (True, None)
+    assert await limiter.check_rate_limit(42, "browse") == (True, None)
+
+
+@pytest.mark.asyncio
+async def test_reset_limit_clears_count(limiter):
+    for _ in range(4):
+        await limiter.check_rate_limit(42, "reserve")
+
+    await limiter.reset_limit(42, "reserve")
+
+    assert await limiter.check_rate_limit(42, "reserve") == (True, None)
+
+
+@pytest.mark.asyncio
+async def test_window_expiry_is_set_only_on_first_request(limiter):
+    key = RateLimiter._key(42, "reserve")
+    await limiter.check_rate_limit(42, "reserve")
+    assert 0 < await limiter._client.ttl(key) <= 60
+
+    # A later request must not push the window end back out
+    await limiter._client.expire(key, 5)
+    await limiter.check_rate_limit(42, "reserve")
+
+    assert 0 < await limiter._client.ttl(key) <= 5
+
+
+@pytest.mark.asyncio
+async def test_count_restarts_after_window_expires(limiter):
+    limiter.window_seconds = 1
+    for _ in range(4):
+        await limiter.check_rate_limit(42, "reserve")
+    assert (await limiter.check_rate_limit(42, "reserve"))[0] is False
+
+    await asyncio.sleep(1.1)
+
+    assert await limiter.check_rate_limit(42, "reserve") == (True, None)
+
+
+@pytest.mark.asyncio
+async def test_check_requires_connection():
+    with pytest.raises(RuntimeError, match="not connected"):
+        await RateLimiter("redis://test").check_rate_limit(42, "reserve")
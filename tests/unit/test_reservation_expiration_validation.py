@@ -31,6 +31,12 @@ class MockOffer:
         
         self.pickup_start_time = self.pickup_end_time - timedelta(hours=3)
 
+    def is_expired_at(self, now):
+        return self.is_expired
+
+    def is_available_at(self, now):
+        return self.available_for_reservation
+
 
 @pytest.mark.asyncio
 async def test_reservation_flow_rejects_expired_offer():
@@ -40,23 +46,15 @@ async def test_reservation_flow_rejects_expired_offer():
     # Setup mocks
     offer_repo_mock = AsyncMock()
     reservation_repo_mock = AsyncMock()
-    redis_locks_mock = Mock()
     
     # Mock expired offer
     expired_offer = MockOffer(expired=True)
     offer_repo_mock.get_by_id = AsyncMock(return_value=expired_offer)
     
-    # Mock lock acquisition
-    lock_context = Mock()
-    lock_context.__aenter__ = AsyncMock(return_value=True)
-    lock_context.__aexit__ = AsyncMock(return_value=None)
-    redis_locks_mock.acquire_offer_lock = Mock(return_value=lock_context)
-    
     # Create service
     service = ReservationFlowService(
         offer_repo_mock,
         reservation_repo_mock,
-        redis_locks_mock,
     )
     
     # Attempt to create reservation
@@ -72,7 +70,7 @@ async def test_reservation_flow_rejects_expired_offer():
     assert order_id is None
     
     # Should not create reservation
-    reservation_repo_mock.create.assert_not_called()
+    reservation_repo_mock.create_with_decrement.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -84,30 +82,20 @@ async def test_reservation_flow_accepts_valid_offer():
     # Setup mocks
     offer_repo_mock = AsyncMock()
     reservation_repo_mock = AsyncMock()
-    redis_locks_mock = Mock()
     
     # Mock valid offer
     valid_offer = MockOffer(expired=False)
     offer_repo_mock.get_by_id = AsyncMock(return_value=valid_offer)
-    offer_repo_mock.decrement_quantity = AsyncMock(return_value=True)
-    
-    # Mock reservation creation
-    mock_reservation = Mock()
-    mock_reservation.id = uuid4()
-    mock_reservation.order_id = "RES-ABC123"
-    reservation_repo_mock.create = AsyncMock(return_value=mock_reservation)
     
-    # Mock lock acquisition
-    lock_context = Mock()
-    lock_context.__aenter__ = AsyncMock(return_value=True)
-    lock_context.__aexit__ = AsyncMock(return_value=None)
-    redis_locks_mock.acquire_offer_lock = Mock(return_value=lock_context)
+    # Mock combined decrement and reservation insert
+    reservation_repo_mock.create_with_decrement = AsyncMock(
+        return_value=("RES-ABC12345", uuid4(), 8)
+    )
     
     # Create service
     service = ReservationFlowService(
         offer_repo_mock,
         reservation_repo_mock,
-        redis_locks_mock,
     )
     
     # Attempt to create reservation
@@ -119,10 +107,41 @@ async def test_reservation_flow_accepts_valid_offer():
     
     # Should succeed
     assert success
-    assert order_id == "RES-ABC123"
+    assert order_id == "RES-ABC12345"
     
-    # Should create reservation
-    reservation_repo_mock.create.assert_called_once()
+    # Stock and reservation are written in one statement
+    reservation_repo_mock.create_with_decrement.assert_awaited_once_with(
+        valid_offer.id, 1, 2
+    )
+    offer_repo_mock.decrement_quantity.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_reservation_flow_reports_lost_stock_race():
+    """Test that a failed combined decrement is reported without rollback."""
+    from src.services.reservation_flow import ReservationFlowService
+    
+    offer_repo_mock = AsyncMock()
+    reservation_repo_mock = AsyncMock()
+    
+    valid_offer = MockOffer(expired=False)
+    offer_repo_mock.get_by_id = AsyncMock(return_value=valid_offer)
+    reservation_repo_mock.create_with_decrement = AsyncMock(return_value=None)
+    
+    service = ReservationFlowService(
+        offer_repo_mock,
+        reservation_repo_mock,
+    )
+    
+    success, message, order_id = await service.create_reservation(
+        customer_id=1,
+        offer_id=valid_offer.id,
+        quantity=2,
+    )
+    
+    assert not success
+    assert order_id is None
+    offer_repo_mock.increment_quantity.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -133,24 +152,16 @@ async def test_reservation_flow_checks_expiration_before_quantity():
     # Setup mocks
     offer_repo_mock = AsyncMock()
     reservation_repo_mock = AsyncMock()
-    redis_locks_mock = Mock()
     
     # Mock expired offer with available quantity
     expired_offer = MockOffer(expired=True)
     expired_offer.quantity_remaining = 100  # Plenty available
     offer_repo_mock.get_by_id = AsyncMock(return_value=expired_offer)
     
-    # Mock lock acquisition
-    lock_context = Mock()
-    lock_context.__aenter__ = AsyncMock(return_value=True)
-    lock_context.__aexit__ = AsyncMock(return_value=None)
-    redis_locks_mock.acquire_offer_lock = Mock(return_value=lock_context)
-    
     # Create service
     service = ReservationFlowService(
         offer_repo_mock,
         reservation_repo_mock,
-        redis_locks_mock,
     )
     
     # Attempt to reserve
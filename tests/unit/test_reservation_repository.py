@@ -0,0 +1,35 @@
+"""Unit tests for PostgresReservationRepository statements."""
+
+from uuid import uuid4
+
+import pytest
+
+from src.storage.postgres_reservation_repo import PostgresReservationRepository
+
+
+@pytest.mark.asyncio
+async def test_create_with_decrement_returns_inserted_row(db_session, executed_sql):
+    reservation_id = uuid4()
+    db_session.execute.return_value.one_or_none.return_value = (
+        "RES-0A1B2C3D", reservation_id, 3
+    )
+
+    created = await PostgresReservationRepository(db_session).create_with_decrement(
+        uuid4(), 1, 2
+    )
+
+    assert created == ("RES-0A1B2C3D", reservation_id, 3)
+    db_session.execute.assert_awaited_once()
+    assert executed_sql().startswith("WITH decremented AS")
+    db_session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_create_with_decrement_reports_insufficient_stock(db_session):
+    db_session.execute.return_value.one_or_none.return_value = None
+
+    created = await PostgresReservationRepository(db_session).create_with_decrement(
+        uuid4(), 1, 5
+    )
+
+    assert created is None
@@ -0,0 +1,86 @@
+"""Unit tests for the offer expiration scheduler."""
+
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.services.scheduler import MIN_SLEEP_SECONDS, SchedulerService
+
+
+def _repo(next_expiry):
+    offer_repo = AsyncMock()
+    offer_repo.bulk_expire_due = AsyncMock(return_value=[])
+    offer_repo.next_expiry = AsyncMock(return_value=next_expiry)
+    return offer_repo
+
+
+@pytest.mark.asyncio
+async def test_sleeps_until_next_expiry():
+    scheduler = SchedulerService(
+        _repo(datetime.utcnow() + timedelta(seconds=20)), interval_seconds=60
+    )
+
+    delay = await scheduler._seconds_until_next_expiry()
+
+    assert 18 < delay <= 20
+
+
+@pytest.mark.asyncio
+async def test_sleep_is_capped_by_interval_and_floor():
+    far = SchedulerService(_repo(datetime.utcnow() + timedelta(hours=2)), interval_seconds=60)
+    past = SchedulerService(_repo(datetime.utcnow() - timedelta(seconds=5)), interval_seconds=60)
+    idle = SchedulerService(_repo(None), interval_seconds=60)
+
+    assert await far._seconds_until_next_expiry() == 60
+    assert await past._seconds_until_next_expiry() == MIN_SLEEP_SECONDS
+    assert await idle._seconds_until_next_expiry() == 60
+
+
+@pytest.mark.asyncio
+async def test_stop_interrupts_sleep():
+    offer_repo = _repo(None)
+    scheduler = SchedulerService(offer_repo, interval_seconds=3600)
+
+    task = asyncio.create_task(scheduler.start())
+    await asyncio.sleep(0)
+    await scheduler.stop()
+    await asyncio.wait_for(task, timeout=1)
+
+    offer_repo.bulk_expire_due.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_failures_back_off_exponentially_and_reset_on_success():
+    offer_repo = _repo(None)
+    offer_repo.bulk_expire_due = AsyncMock(
+        side_effect=[ConnectionError(), ConnectionError(), ConnectionError(), [], ConnectionError()]
+    )
+    scheduler = SchedulerService(offer_repo, interval_seconds=3)
+    delays = []
+
+    async def record_sleep(seconds):
+        delays.append(seconds)
+        if len(delays) == 5:
+            await scheduler.stop()
+
+    scheduler._sleep = record_sleep
+    await scheduler.start()
+
+    assert delays == [MIN_SLEEP_SECONDS, 2.0, 3, 3, MIN_SLEEP_SECONDS]
+
+
+@pytest.mark.asyncio
+async def test_wake_rechecks_expirations_immediately():
+    offer_repo = _repo(None)
+    scheduler = SchedulerService(offer_repo, interval_seconds=3600)
+
+    task = asyncio.create_task(scheduler.start())
+    await asyncio.sleep(0)
+    scheduler.wake()
+    await asyncio.sleep(0.01)
+    await scheduler.stop()
+    await asyncio.wait_for(task, timeout=1)
+
+    assert offer_repo.bulk_expire_due.await_count == 2
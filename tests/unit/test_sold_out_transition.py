@@ -9,10 +9,25 @@ from unittest.mock import AsyncMock
 from uuid import uuid4
 import pytest
 
-from src.models.offer import Offer, OfferStatus, Item
+from src.models.offer import Offer, OfferStatus
 from src.services.sold_out_transition import SoldOutTransitionService
 
 
+def _offer(title, quantity_remaining, state=OfferStatus.ACTIVE):
+    now = datetime.utcnow()
+    return Offer(
+        business_id=uuid4(),
+        title=title,
+        description="Surplus from today's bake",
+        price_per_unit=Decimal("4.00"),
+        quantity_total=8,
+        quantity_remaining=quantity_remaining,
+        pickup_start_time=now,
+        pickup_end_time=now + timedelta(hours=4),
+        state=state,
+    )
+
+
 @pytest.fixture
 def mock_offer_repo():
     """Mock offer repository."""
@@ -22,35 +37,13 @@ def mock_offer_repo():
 @pytest.fixture
 def sample_offer_with_inventory():
     """Sample offer with remaining inventory."""
-    return Offer(
-        id=uuid4(),
-        business_id=uuid4(),
-        title="Test Offer",
-        items=[
-            Item(name="Sandwich", quantity=5, original_price=Decimal("8.00"), discounted_price=Decimal("4.00")),
-            Item(name="Salad", quantity=3, original_price=Decimal("6.00"), discounted_price=Decimal("3.00")),
-        ],
-        start_time=datetime.utcnow(),
-        end_time=datetime.utcnow() + timedelta(hours=4),
-        status=OfferStatus.ACTIVE,
-    )
+    return _offer("Test Offer", 8)
 
 
 @pytest.fixture
 def sample_offer_depleted():
     """Sample offer with all inventory depleted."""
-    return Offer(
-        id=uuid4(),
-        business_id=uuid4(),
-        title="Depleted Offer",
-        items=[
-            Item(name="Bagel", quantity=0, original_price=Decimal("2.00"), discounted_price=Decimal("1.00")),
-            Item(name="Donut", quantity=0, original_price=Decimal("1.50"), discounted_price=Decimal("0.75")),
-        ],
-        start_time=datetime.utcnow(),
-        end_time=datetime.utcnow() + timedelta(hours=2),
-        status=OfferStatus.ACTIVE,
-    )
+    return _offer("Depleted Offer", 0)
 
 
 @pytest.mark.asyncio
@@ -61,7 +54,7 @@ async def test_transition_depleted_offer_to_sold_out(
     """Test automatic transition when all inventory is depleted."""
     # Setup
     mock_offer_repo.get_by_id.return_value = sample_offer_depleted
-    mock_offer_repo.update_status.return_value = True
+    mock_offer_repo.update_state.return_value = True
     
     service = SoldOutTransitionService(mock_offer_repo)
     
@@ -70,7 +63,7 @@ async def test_transition_depleted_offer_to_sold_out(
     
     # Verify
     assert result is True
-    mock_offer_repo.update_status.assert_called_once_with(
+    mock_offer_repo.update_state.assert_called_once_with(
         sample_offer_depleted.id,
         OfferStatus.SOLD_OUT
     )
@@ -92,24 +85,14 @@ async def test_no_transition_when_inventory_remains(
     
     # Verify
     assert result is False
-    mock_offer_repo.update_status.assert_not_called()
+    mock_offer_repo.update_state.assert_not_called()
 
 
 @pytest.mark.asyncio
 async def test_no_transition_for_expired_offer(mock_offer_repo):
     """Test no transition for already expired offers."""
     # Setup: Expired offer
-    expired_offer = Offer(
-        id=uuid4(),
-        business_id=uuid4(),
-        title="Expired Offer",
-        items=[
-            Item(name="Cookie", quantity=0, original_price=Decimal("2.00"), discounted_price=Decimal("1.00")),
-        ],
-        start_time=datetime.utcnow() - timedelta(hours=5),
-        end_time=datetime.utcnow() - timedelta(hours=1),
-        status=OfferStatus.EXPIRED,
-    )
+    expired_offer = _offer("Expired Offer", 0, OfferStatus.EXPIRED)
     
     mock_offer_repo.get_by_id.return_value = expired_offer
     
@@ -120,55 +103,35 @@ async def test_no_transition_for_expired_offer(mock_offer_repo):
     
     # Verify
     assert result is False
-    mock_offer_repo.update_status.assert_not_called()
+    mock_offer_repo.update_state.assert_not_called()
 
 
 @pytest.mark.asyncio
-async def test_no_transition_for_draft_offer(mock_offer_repo):
-    """Test no transition for draft offers."""
-    # Setup: Draft offer
-    draft_offer = Offer(
-        id=uuid4(),
-        business_id=uuid4(),
-        title="Draft Offer",
-        items=[
-            Item(name="Muffin", quantity=0, original_price=Decimal("3.00"), discounted_price=Decimal("1.50")),
-        ],
-        start_time=datetime.utcnow(),
-        end_time=datetime.utcnow() + timedelta(hours=3),
-        status=OfferStatus.DRAFT,
-    )
+async def test_no_transition_for_offer_ended_early(mock_offer_repo):
+    """Test no transition for offers the business ended early."""
+    # Setup: Offer ended early
+    ended_offer = _offer("Ended Offer", 0, OfferStatus.EXPIRED_EARLY)
     
-    mock_offer_repo.get_by_id.return_value = draft_offer
+    mock_offer_repo.get_by_id.return_value = ended_offer
     
     service = SoldOutTransitionService(mock_offer_repo)
     
     # Execute
-    result = await service.check_and_transition_to_sold_out(draft_offer.id)
+    result = await service.check_and_transition_to_sold_out(ended_offer.id)
     
     # Verify
     assert result is False
-    mock_offer_repo.update_status.assert_not_called()
+    mock_offer_repo.update_state.assert_not_called()
 
 
 @pytest.mark.asyncio
 async def test_transition_paused_depleted_offer(mock_offer_repo):
     """Test transition works for paused offers with no inventory."""
     # Setup: Paused offer with no inventory
-    paused_offer = Offer(
-        id=uuid4(),
-        business_id=uuid4(),
-        title="Paused Depleted",
-        items=[
-            Item(name="Bread", quantity=0, original_price=Decimal("4.00"), discounted_price=Decimal("2.00")),
-        ],
-        start_time=datetime.utcnow(),
-        end_time=datetime.utcnow() + timedelta(hours=2),
-        status=OfferStatus.PAUSED,
-    )
+    paused_offer = _offer("Paused Depleted", 0, OfferStatus.PAUSED)
     
     mock_offer_repo.get_by_id.return_value = paused_offer
-    mock_offer_repo.update_status.return_value = True
+    mock_offer_repo.update_state.return_value = True
     
     service = SoldOutTransitionService(mock_offer_repo)
     
@@ -177,7 +140,7 @@ async def test_transition_paused_depleted_offer(mock_offer_repo):
     
     # Verify
     assert result is True
-    mock_offer_repo.update_status.assert_called_once()
+    mock_offer_repo.update_state.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -188,7 +151,7 @@ async def test_force_sold_out_with_inventory(
     """Test manual force sold-out even with inventory remaining."""
     # Setup
     mock_offer_repo.get_by_id.return_value = sample_offer_with_inventory
-    mock_offer_repo.update_status.return_value = True
+    mock_offer_repo.update_state.return_value = True
     
     service = SoldOutTransitionService(mock_offer_repo)
     
@@ -197,7 +160,7 @@ async def test_force_sold_out_with_inventory(
     
     # Verify
     assert result is True
-    mock_offer_repo.update_status.assert_called_once_with(
+    mock_offer_repo.update_state.assert_called_once_with(
         sample_offer_with_inventory.id,
         OfferStatus.SOLD_OUT
     )
@@ -207,17 +170,7 @@ async def test_force_sold_out_with_inventory(
 async def test_force_sold_out_already_sold_out(mock_offer_repo):
     """Test forcing sold-out on already sold-out offer is idempotent."""
     # Setup
-    sold_out_offer = Offer(
-        id=uuid4(),
-        business_id=uuid4(),
-        title="Already Sold Out",
-        items=[
-            Item(name="Pastry", quantity=0, original_price=Decimal("3.50"), discounted_price=Decimal("1.75")),
-        ],
-        start_time=datetime.utcnow(),
-        end_time=datetime.utcnow() + timedelta(hours=2),
-        status=OfferStatus.SOLD_OUT,
-    )
+    sold_out_offer = _offer("Already Sold Out", 0, OfferStatus.SOLD_OUT)
     
     mock_offer_repo.get_by_id.return_value = sold_out_offer
     
@@ -228,25 +181,15 @@ async def test_force_sold_out_already_sold_out(mock_offer_repo):
     
     # Verify
     assert result is True
-    # Should not call update_status since already sold out
-    mock_offer_repo.update_status.assert_not_called()
+    # Should not call update_state since already sold out
+    mock_offer_repo.update_state.assert_not_called()
 
 
 @pytest.mark.asyncio
 async def test_cannot_force_sold_out_expired_offer(mock_offer_repo):
     """Test cannot force sold-out on expired offer."""
     # Setup
-    expired_offer = Offer(
-        id=uuid4(),
-        business_id=uuid4(),
-        title="Expired",
-        items=[
-            Item(name="Cake", quantity=2, original_price=Decimal("10.00"), discounted_price=Decimal("5.00")),
-        ],
-        start_time=datetime.utcnow() - timedelta(hours=4),
-        end_time=datetime.utcnow() - timedelta(hours=1),
-        status=OfferStatus.EXPIRED,
-    )
+    expired_offer = _offer("Expired", 2, OfferStatus.EXPIRED)
     
     mock_offer_repo.get_by_id.return_value = expired_offer
     
@@ -257,35 +200,25 @@ async def test_cannot_force_sold_out_expired_offer(mock_offer_repo):
     
     # Verify
     assert result is False
-    mock_offer_repo.update_status.assert_not_called()
+    mock_offer_repo.update_state.assert_not_called()
 
 
 @pytest.mark.asyncio
-async def test_cannot_force_sold_out_draft_offer(mock_offer_repo):
-    """Test cannot force sold-out on draft offer."""
+async def test_cannot_force_sold_out_offer_ended_early(mock_offer_repo):
+    """Test cannot force sold-out on an offer ended early."""
     # Setup
-    draft_offer = Offer(
-        id=uuid4(),
-        business_id=uuid4(),
-        title="Draft",
-        items=[
-            Item(name="Soup", quantity=5, original_price=Decimal("6.00"), discounted_price=Decimal("3.00")),
-        ],
-        start_time=datetime.utcnow(),
-        end_time=datetime.utcnow() + timedelta(hours=3),
-        status=OfferStatus.DRAFT,
-    )
+    ended_offer = _offer("Ended", 5, OfferStatus.EXPIRED_EARLY)
     
-    mock_offer_repo.get_by_id.return_value = draft_offer
+    mock_offer_repo.get_by_id.return_value = ended_offer
     
     service = SoldOutTransitionService(mock_offer_repo)
     
     # Execute
-    result = await service.force_sold_out(draft_offer.id)
+    result = await service.force_sold_out(ended_offer.id)
     
     # Verify
     assert result is False
-    mock_offer_repo.update_status.assert_not_called()
+    mock_offer_repo.update_state.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -1,10 +1,13 @@
 """Unit tests for system start and fallback handlers."""
 
+from unittest.mock import AsyncMock, Mock
+
 from telegram.ext import CommandHandler, MessageHandler
 
 from src.handlers.system.start_handler import (
     get_default_message_handler,
     get_start_handler,
+    start_command,
 )
 
 
@@ -16,3 +19,57 @@ def test_get_start_handler_returns_command_handler():
 def test_get_default_message_handler_returns_message_handler():
     handler = get_default_message_handler()
     assert isinstance(handler, MessageHandler)
+
+
+async def test_start_offer_deep_link_skips_user_lookup():
+    update = AsyncMock()
+    context = Mock()
+    context.args = ["offer_1234"]
+    context.bot_data = {"user_repo": AsyncMock()}
+
+    await start_command(update, context)
+
+    context.bot_data["user_repo"].get_by_telegram_id.assert_not_called()
+    update.message.reply_text.assert_awaited_once()
+    markup = update.message.reply_text.call_args.kwargs["reply_markup"]
+    assert markup.inline_keyboard[0][0].callback_data == "view_offer:1234"
+
+
+async def test_start_unknown_deep_link_falls_back_to_welcome():
+    update = AsyncMock()
+    context = Mock()
+    context.args = ["unknown_param"]
+    context.user_data = {}
+    context.bot_data = {"user_repo": AsyncMock()}
+    context.bot_data["user_repo"].get_by_telegram_id.return_value = None
+
+    await start_command(update, context)
+
+    context.bot_data["user_repo"].get_by_telegram_id.assert_awaited_once()
+    assert context.user_data["awaiting_role_selection"] is True
+
+
+async def test_start_business_link_without_invite_falls_back_to_welcome():
+    update = AsyncMock()
+    context = Mock()
+    context.args = ["business_abc"]
+    context.user_data = {}
+    context.bot_data = {"user_repo": AsyncMock()}
+    context.bot_data["user_repo"].get_by_telegram_id.return_value = None
+
+    await start_command(update, context)
+
+    context.bot_data["user_repo"].get_by_telegram_id.assert_awaited_once()
+    assert context.user_data["awaiting_role_selection"] is True
+
+
+async def test_start_business_invite_link_skips_user_lookup():
+    update = AsyncMock()
+    context = Mock()
+    context.args = ["business_invite_tok_123"]
+    context.bot_data = {"user_repo": AsyncMock()}
+
+    await start_command(update, context)
+
+    context.bot_data["user_repo"].get_by_telegram_id.assert_not_called()
+    assert "invitation" in update.message.reply_text.call_args.args[0]
@@ -1,6 +1,8 @@
 """Unit tests for Stripe checkout service."""
 
+from datetime import datetime
 from decimal import Decimal
+from unittest.mock import AsyncMock, Mock, patch
 from uuid import uuid4
 
 import pytest
@@ -19,16 +21,20 @@ async def test_stripe_create_checkout_session(mock_stripe):
 
     purchase_id = uuid4()
 
-    # TODO: Mock stripe.checkout.Session.create
-    # checkout_url, expires_at = await service.create_checkout_session(
-    #     purchase_id=purchase_id,
-    #     offer_title="Test Offer",
-    #     total_amount=Decimal("10.00"),
-    # )
-    # assert checkout_url.startswith("https://")
-    # assert expires_at > datetime.utcnow()
+    session = Mock(url="https://checkout.stripe.com/c/pay/cs_test_mock")
+    with patch(
+        "stripe.checkout.Session.create_async", AsyncMock(return_value=session)
+    ) as create:
+        checkout_url, expires_at = await service.create_checkout_session(
+            purchase_id=purchase_id,
+            offer_title="Test Offer",
+            total_amount=Decimal("10.00"),
+        )
 
-    pytest.skip("Stripe mock implementation needed")
+    assert checkout_url.startswith("https://")
+    assert expires_at > datetime.utcnow()
+    create.assert_awaited_once()
+    assert create.await_args.kwargs["metadata"] == {"purchase_id": str(purchase_id)}
 
 
 @pytest.mark.asyncio
@@ -40,9 +46,45 @@ async def test_stripe_verify_payment(mock_stripe):
         cancel_url="https://example.com/cancel",
     )
 
-    # TODO: Mock stripe.checkout.Session.retrieve
-    # result = await service.verify_payment("cs_test_mock")
-    # assert "purchase_id" in result
-    # assert "payment_status" in result
+    session = Mock(
+        metadata={"purchase_id": "p-1"}, payment_status="paid", payment_intent="pi_1"
+    )
+    with patch(
+        "stripe.checkout.Session.retrieve_async", AsyncMock(return_value=session)
+    ) as retrieve:
+        result = await service.verify_payment("cs_test_mock")
+
+    retrieve.assert_awaited_once_with("cs_test_mock")
+    assert result == {
+        "purchase_id": "p-1",
+        "payment_status": "paid",
+        "payment_intent": "pi_1",
+    }
+
+
+@pytest.mark.asyncio
+async def test_stripe_amount_rounds_half_up_to_cents():
+    """Test fractional cents are rounded, not truncated."""
+    service = StripeCheckoutService(
+        secret_key="sk_test_mock",
+        success_url="https://example.com/success",
+        cancel_url="https://example.com/cancel",
+    )
+
+    session = Mock(url="https://checkout.stripe.com/c/pay/cs_test_mock")
+    with patch(
+        "stripe.checkout.Session.create_async", AsyncMock(return_value=session)
+    ) as create:
+        await service.create_checkout_session(
+            purchase_id=uuid4(),
+            offer_title="Test Offer",
+            total_amount=Decimal("10.005"),
+        )
+
+    line_item = create.await_args.kwargs["line_items"][0]
+    assert line_item["price_data"]["unit_amount"] == 1001
 
-    pytest.skip("Stripe mock implementation needed")
+    with pytest.raises(TypeError):
+        await service.create_checkout_session(
+            purchase_id=uuid4(), offer_title="Test Offer", total_amount=10.0
+        )